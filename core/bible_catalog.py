@@ -0,0 +1,78 @@
+"""
+Catálogo dos livros da Bíblia com a quantidade de versículos por capítulo.
+
+O catálogo é distribuído com o projeto (data/bible_catalog.json) e permite
+preencher os menus de livro, capítulo e versículo sem consultar a API. As
+contagens seguem a versificação mais comum; versões que numeram de outra
+forma (versículos omitidos ou divididos) são corrigidas com learn(), a
+partir dos capítulos efetivamente obtidos.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.utils.file_utils import load_json_file
+
+logger = logging.getLogger(__name__)
+
+
+class BibleCatalog:
+    """
+    Livros da Bíblia e contagem de versículos por capítulo.
+
+    Attributes:
+        books: Livros no formato da lista de livros da API
+               (abbrev, name, chapters, testament), em ordem canônica
+    """
+    FORMAT_VERSION = 1
+
+    def __init__(self, books: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.books: List[Dict[str, Any]] = []
+        self._verse_counts: Dict[str, List[int]] = {}  # livro → versículos por capítulo
+        # Contagens observadas nos capítulos obtidos: (versão, livro, capítulo) → versículos
+        self._learned: Dict[Tuple[str, str, int], int] = {}
+        for book in books or []:
+            verses = book.get('verses') or []
+            self.books.append({key: value for key, value in book.items() if key != 'verses'})
+            self._verse_counts[str(book['abbrev']).lower()] = [int(count) for count in verses]
+
+    @classmethod
+    def load(cls, path: Path) -> "BibleCatalog":
+        """Carrega o catálogo do disco; retorna um catálogo vazio se ausente ou incompatível."""
+        data = load_json_file(Path(path), default=None)
+        if not isinstance(data, dict) or data.get('format') != cls.FORMAT_VERSION:
+            logger.warning(f"Catálogo da Bíblia indisponível - caminho: {path}")
+            return cls()
+        return cls(data.get('books', []))
+
+    def __bool__(self) -> bool:
+        return bool(self.books)
+
+    def verse_count(self, book_abbrev: str, chapter_number: int,
+                    version_abbrev: Optional[str] = None) -> Optional[int]:
+        """
+        Retorna a quantidade de versículos do capítulo.
+
+        Args:
+            book_abbrev: Abreviação (pt) do livro
+            chapter_number: Número do capítulo
+            version_abbrev: Versão; se informada, uma contagem já observada
+                            nessa versão tem prioridade sobre o catálogo
+
+        Returns:
+            int ou None se o livro ou capítulo não constar do catálogo
+        """
+        book_abbrev = book_abbrev.lower()
+        if version_abbrev:
+            learned = self._learned.get((version_abbrev.lower(), book_abbrev, int(chapter_number)))
+            if learned is not None:
+                return learned
+        counts = self._verse_counts.get(book_abbrev)
+        if counts and 1 <= int(chapter_number) <= len(counts):
+            return counts[int(chapter_number) - 1]
+        return None
+
+    def learn(self, version_abbrev: str, book_abbrev: str, chapter_number: int, verse_count: int) -> None:
+        """Registra a contagem de versículos observada em um capítulo de uma versão."""
+        self._learned[(version_abbrev.lower(), book_abbrev.lower(), int(chapter_number))] = int(verse_count)
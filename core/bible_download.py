@@ -0,0 +1,273 @@
+"""
+Download de versões inteiras da Bíblia para uso sem internet.
+
+O job percorre todos os capítulos de uma versão, busca na API os que ainda
+não estão no armazenamento local (BibleStore) e grava cada um assim que
+chega. Como cada capítulo é gravado de forma atômica, um download
+interrompido continua de onde parou na próxima execução. Um resumo do
+andamento (capítulos concluídos e falhas) fica em
+data/bible/<versão>/_download.json.
+
+As requisições são limitadas em concorrência e em taxa, para não
+sobrecarregar a API.
+
+Uso pela linha de comando:
+    python -m core.bible_download nvi
+    python -m core.bible_download acf --books gn,ex --rate 1 --index
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.bible_store import BibleStore
+from core.exceptions import BibleAPIError
+from core.utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DownloadProgress:
+    """
+    Andamento de um download.
+
+    Attributes:
+        version: Abreviação da versão
+        total: Quantidade de capítulos da versão
+        completed: Capítulos armazenados (inclusive os de execuções anteriores)
+        skipped: Capítulos que já estavam armazenados no início desta execução
+        failed: Capítulos (livro, capítulo) que não puderam ser obtidos
+        cancelled: Se o download foi cancelado antes do fim
+    """
+    version: str
+    total: int
+    completed: int = 0
+    skipped: int = 0
+    failed: List[Tuple[str, int]] = field(default_factory=list)
+    cancelled: bool = False
+
+    @property
+    def fraction(self) -> float:
+        """Fração concluída (0.0 a 1.0)."""
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def finished(self) -> bool:
+        """Indica se todos os capítulos foram armazenados."""
+        return self.completed >= self.total
+
+    def snapshot(self) -> "DownloadProgress":
+        """Cópia independente, segura para ser lida em outra thread."""
+        return replace(self, failed=list(self.failed))
+
+
+ProgressCallback = Callable[[DownloadProgress], None]
+
+
+class BibleDownloadJob:
+    """
+    Baixa todos os capítulos de uma versão para o BibleStore.
+
+    Attributes:
+        version: Abreviação da versão
+        progress: Andamento atual
+        max_concurrency: Requisições simultâneas
+        rate_limiter: Limite de requisições por segundo
+    """
+    # Limites educados: o download de uma versão leva alguns minutos
+    MAX_CONCURRENCY = 3
+    RATE_PER_SECOND = 2.0
+    PROGRESS_FILE = "_download.json"
+    # Frequência de gravação do resumo do andamento (em capítulos)
+    PROGRESS_SAVE_INTERVAL = 25
+
+    def __init__(self, api_client: Any, store: BibleStore, version_abbrev: str,
+                 books: Sequence[Dict[str, Any]], max_concurrency: Optional[int] = None,
+                 rate_per_second: Optional[float] = None,
+                 on_progress: Optional[ProgressCallback] = None) -> None:
+        """
+        Args:
+            api_client: Cliente da API (BibleAPIClient)
+            store: Armazenamento local de destino
+            version_abbrev: Abreviação da versão (ex: 'nvi')
+            books: Livros a baixar (dicts com 'abbrev' e 'chapters')
+            max_concurrency: Requisições simultâneas (padrão: MAX_CONCURRENCY)
+            rate_per_second: Requisições por segundo (padrão: RATE_PER_SECOND)
+            on_progress: Chamado com um DownloadProgress a cada capítulo concluído
+                         (na thread do loop asyncio)
+        """
+        self.api_client = api_client
+        self.store = store
+        self.version = version_abbrev.lower()
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENCY
+        self.rate_limiter = RateLimiter(rate_per_second or self.RATE_PER_SECOND, burst=1)
+        self.on_progress = on_progress
+        self._chapters = [
+            (self._abbrev(book), chapter)
+            for book in books if self._abbrev(book)
+            for chapter in range(1, int(book.get('chapters') or 0) + 1)
+        ]
+        self.progress = DownloadProgress(self.version, len(self._chapters))
+        self._cancel_event = threading.Event()
+
+    @staticmethod
+    def _abbrev(book: Dict[str, Any]) -> Optional[str]:
+        abbrev = book.get('abbrev')
+        if isinstance(abbrev, dict):
+            abbrev = abbrev.get('pt') or abbrev.get('en')
+        return abbrev.lower() if abbrev else None
+
+    @property
+    def progress_path(self) -> Path:
+        """Arquivo com o resumo do andamento."""
+        return self.store.root / self.version / self.PROGRESS_FILE
+
+    def pending_chapters(self) -> List[Tuple[str, int]]:
+        """Capítulos que ainda não estão no armazenamento local."""
+        return [item for item in self._chapters if not self.store.has_chapter(self.version, *item)]
+
+    def cancel(self) -> None:
+        """Interrompe o download; os capítulos já gravados são mantidos."""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    async def arun(self) -> DownloadProgress:
+        """
+        Executa o download no loop asyncio atual.
+
+        Returns:
+            DownloadProgress final (ver failed e cancelled)
+        """
+        pending = await asyncio.to_thread(self.pending_chapters)
+        self.progress.completed = self.progress.skipped = self.progress.total - len(pending)
+        self.progress.failed = []
+        logger.info(
+            f"Download da versão iniciado - versão: {self.version}, capítulos pendentes: {len(pending)} "
+            f"de {self.progress.total}"
+        )
+        self._notify()
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in pending:
+            queue.put_nowait(item)
+        workers = [asyncio.create_task(self._worker(queue)) for _ in range(min(self.max_concurrency, len(pending)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            self.progress.cancelled = self.cancelled and not self.progress.finished
+            await asyncio.to_thread(self._save_progress_file)
+
+        logger.info(
+            f"Download da versão encerrado - versão: {self.version}, concluídos: {self.progress.completed}/"
+            f"{self.progress.total}, falhas: {len(self.progress.failed)}, cancelado: {self.progress.cancelled}"
+        )
+        return self.progress.snapshot()
+
+    def run(self) -> DownloadProgress:
+        """Executa o download bloqueando a thread atual (uso na linha de comando)."""
+        return asyncio.run(self.arun())
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while not queue.empty() and not self.cancelled:
+            book_abbrev, chapter = queue.get_nowait()
+            await self.rate_limiter.aacquire()
+            if self.cancelled:
+                return
+            try:
+                verses = await self.api_client.aget_chapter_verses(self.version, book_abbrev, chapter)
+            except BibleAPIError as e:
+                logger.warning(f"Falha ao baixar {self.version} {book_abbrev} {chapter}: {e}")
+                verses = None
+            if verses:
+                await asyncio.to_thread(self.store.save_chapter, self.version, book_abbrev, chapter, verses)
+                self.progress.completed += 1
+            else:
+                self.progress.failed.append((book_abbrev, chapter))
+            if (self.progress.completed + len(self.progress.failed)) % self.PROGRESS_SAVE_INTERVAL == 0:
+                await asyncio.to_thread(self._save_progress_file)
+            self._notify()
+
+    def _notify(self) -> None:
+        if self.on_progress is not None:
+            self.on_progress(self.progress.snapshot())
+
+    def _save_progress_file(self) -> None:
+        """Grava o resumo do andamento (informativo: a retomada se baseia no armazenamento)."""
+        data = {
+            "version": self.version,
+            "total": self.progress.total,
+            "completed": self.progress.completed,
+            "failed": self.progress.failed,
+            "finished": self.progress.finished,
+            "updated_at": time.time(),
+        }
+        path = self.progress_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar o andamento do download - caminho: {path}, erro: {e}")
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(prog="python -m core.bible_download",
+                                     description="Baixa uma versão da Bíblia para uso sem internet")
+    parser.add_argument("version", help="Abreviação da versão (ex: nvi, acf)")
+    parser.add_argument("--books", help="Abreviações dos livros separadas por vírgula (padrão: todos)")
+    parser.add_argument("--concurrency", type=int, default=BibleDownloadJob.MAX_CONCURRENCY)
+    parser.add_argument("--rate", type=float, default=BibleDownloadJob.RATE_PER_SECOND,
+                        help="Requisições por segundo")
+    parser.add_argument("--index", action="store_true", help="Constrói o índice de busca ao final")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    from core.bible_manager import BibleManager
+    manager = BibleManager()
+    books = manager.load_books()
+    if args.books:
+        wanted = {abbrev.strip().lower() for abbrev in args.books.split(",")}
+        books = [book for book in books if (BibleManager.pt_abbrev(book) or "").lower() in wanted]
+    if not books:
+        print("Nenhum livro para baixar.", file=sys.stderr)
+        return 1
+
+    def print_progress(progress: DownloadProgress) -> None:
+        print(f"\r{progress.completed}/{progress.total} capítulos ({progress.fraction:.0%}), "
+              f"falhas: {len(progress.failed)}", end="", flush=True)
+
+    job = manager.create_download_job(args.version, books=books, max_concurrency=args.concurrency,
+                                      rate_per_second=args.rate, on_progress=print_progress)
+    try:
+        progress = job.run()
+    except KeyboardInterrupt:
+        print("\nInterrompido. Rode o mesmo comando para continuar de onde parou.", file=sys.stderr)
+        return 130
+    print()
+    if progress.failed:
+        print(f"{len(progress.failed)} capítulo(s) falharam; rode novamente para tentar de novo.", file=sys.stderr)
+        return 1
+    if args.index:
+        count = manager.build_search_index(args.version)
+        print(f"Índice de busca construído: {count} versículos")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
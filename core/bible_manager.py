@@ -1,11 +1,28 @@
+import asyncio
 import logging
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 # --- IMPORTAÇÕES MODIFICADAS ---
 from .services.bible_api_client import BibleAPIClient
-from core.paths import BIBLE_BOOKS_CACHE_PATH
-from core.exceptions import MusicDatabaseError
+from core.paths import (
+    BIBLE_BOOKS_CACHE_PATH, BIBLE_CATALOG_PATH, BIBLE_CHAPTER_CACHE_DIR, BIBLE_STORE_DIR, BIBLE_SEARCH_INDEX_DIR
+)
+from core.exceptions import MusicDatabaseError, BibleAPIError, BibleReferenceError
+from core.bible_reference import (
+    BibleReference, EXTRA_BOOK_ALIASES, format_verse_slide, normalize_book_alias, parse_references
+)
 from core.utils.file_utils import save_json_file, load_json_file
+from core.bible_catalog import BibleCatalog
+from core.bible_download import BibleDownloadJob, ProgressCallback
+from core.bible_store import BibleStore
+from core.bible_search import BibleSearchIndex, SearchResult, build_and_save, build_index_file, index_path
+from core.utils.cache import LRUCache, DiskCache, TwoTierCache
+from core.utils.event_loop_thread import EventLoopThread, ResultCallback
+from core.utils.fetch_coordinator import FetchCoordinator, TicketCallback
+from core.utils.process_pool import ProcessPool
 
 logger = logging.getLogger(__name__)
 
@@ -14,41 +31,149 @@ class BibleManager:
     Gerenciador de acesso à Bíblia.
     
     Responsável por carregar livros bíblicos, buscar versículos e gerenciar
-    cache local. Utiliza índice O(1) para busca por abreviação.
+    cache local. Utiliza índice O(1) para busca por abreviação e um cache de
+    capítulos em dois níveis (memória + disco).
     
     Attributes:
         api_client: Cliente para API da Bíblia Digital
         versions: Lista de versões bíblicas disponíveis
         books: Lista de livros bíblicos carregados
         current_version: Versão bíblica atual selecionada
+        chapter_cache: Cache LRU em memória apoiado por armazenamento em disco,
+                       indexado por (versão, livro, capítulo)
+        bible_store: Texto bíblico armazenado permanentemente (base da busca textual)
+        catalog: Livros e quantidade de versículos por capítulo, distribuídos com o projeto
+        cpu_pool: Pool de processos para construir índices fora do processo da interface (opcional)
         _books_by_abbrev: Índice mapeando abreviação → livro (busca O(1))
+        _book_positions: Índice mapeando abreviação → posição do livro no cânon
+        _books_by_name: Índice mapeando nome exibido → livro
+        _books_by_alias: Índice de apelidos (nomes, abreviações pt/en, ordinais) → livro
+        _books_by_folded_alias: Mesmo índice, com chaves sem acentos
     """
-    def __init__(self) -> None:
+    # Capítulos mantidos em memória (um capítulo ocupa poucos KB)
+    CHAPTER_MEMORY_CACHE_SIZE = 64
+    # Limite do cache de capítulos em disco (a Bíblia inteira ocupa ~5 MB por versão)
+    CHAPTER_DISK_CACHE_MAX_BYTES = 50 * 1024 * 1024
+    # Tempo de vida das entradas em disco; vencidas, continuam em uso enquanto são revalidadas
+    CHAPTER_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+    # Idade a partir da qual a lista de livros em cache é revalidada em segundo plano
+    BOOKS_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+    # Pré-carregamento de capítulos vizinhos em segundo plano
+    PREFETCH_MAX_WORKERS = 2
+    # Espera antes de pré-carregar, para dar prioridade à busca do capítulo selecionado
+    PREFETCH_DELAY_SECONDS = 0.5
+    # Threads que atendem as seleções de capítulo feitas na interface
+    CHAPTER_FETCH_MAX_WORKERS = 2
+    # Versões buscadas simultaneamente na exibição paralela
+    PARALLEL_MAX_WORKERS = 4
+
+    def __init__(self, cpu_pool: Optional[ProcessPool] = None) -> None:
         """
         Inicializa o BibleManager com cliente de API e estruturas vazias.
+        
+        Args:
+            cpu_pool: Pool de processos para o trabalho pesado de CPU (opcional)
         """
         self.api_client = BibleAPIClient()
+        self.cpu_pool = cpu_pool
         self.versions: List[Dict] = []
         self.books: List[Dict] = []
         self.current_version: Optional[str] = None
         # Índice para busca O(1) por abreviação
         self._books_by_abbrev: Dict[str, Dict] = {}  # abreviação → livro
+        self._book_positions: Dict[str, int] = {}  # abreviação → posição em self.books
+        self._books_by_name: Dict[str, Dict] = {}  # nome → livro
+        # Apelidos normalizados para referências digitadas ("1Co", "I Coríntios", "joao")
+        self._books_by_alias: Dict[str, Dict] = {}
+        self._books_by_folded_alias: Dict[str, Dict] = {}
+        self.chapter_cache = TwoTierCache(
+            LRUCache(self.CHAPTER_MEMORY_CACHE_SIZE),
+            DiskCache(
+                Path(BIBLE_CHAPTER_CACHE_DIR),
+                max_bytes=self.CHAPTER_DISK_CACHE_MAX_BYTES,
+                ttl_seconds=self.CHAPTER_CACHE_TTL_SECONDS
+            )
+        )
+        self.bible_store = BibleStore(Path(BIBLE_STORE_DIR))
+        self.catalog = BibleCatalog.load(Path(BIBLE_CATALOG_PATH))
+        # Índices de busca carregados do disco sob demanda (versão → índice)
+        self._search_indexes: Dict[str, BibleSearchIndex] = {}
+        self._search_index_lock = threading.Lock()
+        # Executor das versões paralelas, criado apenas no primeiro uso
+        self._parallel_executor: Optional[ThreadPoolExecutor] = None
+        self._parallel_lock = threading.Lock()
+        # O executor de pré-carregamento é criado apenas no primeiro uso
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_futures: List[Future] = []
+        self._prefetch_cancel_event = threading.Event()
+        # Loop asyncio para buscas em lote, criado apenas no primeiro uso
+        self._event_loop: Optional[EventLoopThread] = None
+        self._event_loop_lock = threading.Lock()
+        # Junta buscas idênticas em andamento e descarta seleções substituídas
+        self.fetch_coordinator = FetchCoordinator(
+            max_workers=self.CHAPTER_FETCH_MAX_WORKERS, thread_name_prefix="bible-fetch"
+        )
 
-    def _save_books_to_cache(self, books_data: List[Dict]) -> None:
-        """Salva a lista de livros em um arquivo JSON local."""
-        save_json_file(Path(BIBLE_BOOKS_CACHE_PATH), books_data, ensure_ascii=False)
+    def _save_books_to_cache(self, books_data: List[Dict], validators: Optional[Dict[str, Optional[str]]] = None) -> None:
+        """Salva a lista de livros em um arquivo JSON local, com a data da busca e os validadores HTTP."""
+        validators = validators or {}
+        data = {
+            "fetched_at": time.time(),
+            "etag": validators.get("etag"),
+            "last_modified": validators.get("last_modified"),
+            "books": books_data,
+        }
+        save_json_file(Path(BIBLE_BOOKS_CACHE_PATH), data, ensure_ascii=False)
         logger.info("Lista de livros salva no cache local.")
 
+    @staticmethod
+    def _parse_books_cache(data: Any) -> Tuple[List[Dict], Dict[str, Any]]:
+        """
+        Separa os livros e os metadados do arquivo de cache.
+        
+        Aceita o formato antigo (lista de livros, sem metadados), que é
+        tratado como vencido para ser revalidado.
+        """
+        if isinstance(data, list):
+            return data, {}
+        if isinstance(data, dict) and isinstance(data.get("books"), list):
+            return data["books"], {key: value for key, value in data.items() if key != "books"}
+        return [], {}
+
+    def _schedule_books_revalidation(self, metadata: Dict[str, Any]) -> Future:
+        """Revalida a lista de livros em segundo plano (GET condicional)."""
+        validators = {"etag": metadata.get("etag"), "last_modified": metadata.get("last_modified")}
+        return self.fetch_coordinator.fetch(("revalidate", "books"), lambda: self._revalidate_books(validators))
+
+    def _revalidate_books(self, validators: Dict[str, Optional[str]]) -> None:
+        try:
+            books, current = self.api_client.get_books_if_modified(validators)
+            if books is None:
+                # 304: a lista não mudou; apenas renova a data da verificação
+                self._save_books_to_cache(self.books, current)
+            elif books:
+                self._save_books_to_cache(books, current)
+                if books != self.books:
+                    logger.info("Lista de livros atualizada pela revalidação.")
+                    self.books = books
+                    self._rebuild_abbrev_index()
+        except (BibleAPIError, MusicDatabaseError) as e:
+            logger.info(f"Revalidação da lista de livros adiada: {e}")
+
     def _rebuild_abbrev_index(self) -> None:
         """
         Reconstrói o índice de busca O(1) por abreviação.
         
         Constrói _books_by_abbrev mapeando abreviação → livro.
         Lida com diferentes formatos de abreviação (dict ou str).
+        Os índices são montados à parte e trocados no final, pois a lista de
+        livros pode ser atualizada por uma revalidação em segundo plano.
         """
-        self._books_by_abbrev.clear()
+        books_by_abbrev: Dict[str, Dict] = {}
+        book_positions: Dict[str, int] = {}
         
-        for book in self.books:
+        for position, book in enumerate(self.books):
             abbrev = book.get('abbrev')
             if not abbrev:
                 continue
@@ -56,15 +181,44 @@ class BibleManager:
             # Lidar com diferentes formatos de abreviação
             if isinstance(abbrev, dict):
                 # Se for dict, indexar por 'pt' e 'en'
-                pt_abbrev = abbrev.get('pt')
-                en_abbrev = abbrev.get('en')
-                if pt_abbrev:
-                    self._books_by_abbrev[pt_abbrev] = book
-                if en_abbrev:
-                    self._books_by_abbrev[en_abbrev] = book
+                for key in (abbrev.get('pt'), abbrev.get('en')):
+                    if key:
+                        books_by_abbrev[key] = book
+                        book_positions[key] = position
             elif isinstance(abbrev, str):
                 # Se for string, indexar diretamente
-                self._books_by_abbrev[abbrev] = book
+                books_by_abbrev[abbrev] = book
+                book_positions[abbrev] = position
+
+        self._books_by_abbrev = books_by_abbrev
+        self._book_positions = book_positions
+        self._rebuild_alias_index()
+
+    def _rebuild_alias_index(self) -> None:
+        """
+        Reconstrói os índices por nome e por apelido usados pelas referências digitadas.
+        
+        As abreviações têm prioridade sobre os nomes, e ambos sobre os apelidos
+        extras; assim "jo" continua sendo João mesmo que "Jó" sem acento seja "jo".
+        """
+        aliases_by_priority: List[Tuple[str, Dict]] = []
+        for abbrev, book in self._books_by_abbrev.items():
+            aliases_by_priority.append((abbrev, book))
+        for book in self.books:
+            if book.get('name'):
+                aliases_by_priority.append((book['name'], book))
+        for book in self.books:
+            for alias in EXTRA_BOOK_ALIASES.get(self.pt_abbrev(book) or "", ()):
+                aliases_by_priority.append((alias, book))
+        
+        books_by_alias: Dict[str, Dict] = {}
+        books_by_folded_alias: Dict[str, Dict] = {}
+        for alias, book in aliases_by_priority:
+            books_by_alias.setdefault(normalize_book_alias(alias, fold=False), book)
+            books_by_folded_alias.setdefault(normalize_book_alias(alias), book)
+        self._books_by_name = {book['name']: book for book in self.books if book.get('name')}
+        self._books_by_alias = books_by_alias
+        self._books_by_folded_alias = books_by_folded_alias
 
     def load_versions(self) -> List[Dict]:
         self.versions = self.api_client.get_versions()
@@ -81,12 +235,15 @@ class BibleManager:
             return self.books
 
         # Tenta carregar do arquivo de cache primeiro.
-        cached_books = load_json_file(Path(BIBLE_BOOKS_CACHE_PATH), default=None)
-        if cached_books is not None and cached_books:
+        cached_books, metadata = self._parse_books_cache(load_json_file(Path(BIBLE_BOOKS_CACHE_PATH), default=None))
+        if cached_books:
             self.books = cached_books
             logger.info("Lista de livros carregada do cache.")
             # Reconstruir índice após carregar
             self._rebuild_abbrev_index()
+            # Cache vencido é usado assim mesmo; a revalidação não bloqueia quem chamou
+            if time.time() - (metadata.get("fetched_at") or 0) > self.BOOKS_CACHE_TTL_SECONDS:
+                self._schedule_books_revalidation(metadata)
             return self.books
         
         # Se o cache não existe ou falhou, busca na API.
@@ -100,9 +257,12 @@ class BibleManager:
                 self._rebuild_abbrev_index()
         except Exception as e:
             logger.error("Erro ao buscar livros da API", exc_info=True)
-            # Se falhar, retorna lista vazia ao invés de levantar exceção
+            # Se falhar, usa o catálogo distribuído com o projeto (ou lista vazia)
             # para não quebrar a aplicação se a API estiver indisponível
-            self.books = []
+            self.books = [dict(book) for book in self.catalog.books]
+            if self.books:
+                logger.info("Lista de livros carregada do catálogo local.")
+                self._rebuild_abbrev_index()
         
         return self.books
     
@@ -124,4 +284,557 @@ class BibleManager:
             self._rebuild_abbrev_index()
         
         # Busca O(1) no índice
-        return self._books_by_abbrev.get(abbrev)
\ No newline at end of file
+        return self._books_by_abbrev.get(abbrev)
+
+    def get_book_by_name(self, name: str) -> Optional[Dict]:
+        """Busca um livro pelo nome exibido nos menus (O(1))."""
+        if not self._books_by_name and self.books:
+            self._rebuild_abbrev_index()
+        return self._books_by_name.get(name)
+
+    def resolve_book(self, text: str) -> Optional[Dict]:
+        """
+        Resolve um nome ou abreviação digitado pelo operador (O(1)).
+        
+        Aceita nomes completos, nomes sem acento, abreviações em português
+        e inglês e ordinais ("1Co", "1ª Coríntios", "I Coríntios",
+        "primeira coríntios"). A grafia exata (com acentos) tem prioridade
+        sobre a forma sem acentos, para distinguir "Jó" de "Jo" (João).
+        
+        Args:
+            text: Nome ou abreviação do livro
+        
+        Returns:
+            Dict com dados do livro ou None se não reconhecido
+        """
+        if not self.books:
+            self.load_books()
+        if not self._books_by_alias:
+            self._rebuild_abbrev_index()
+        
+        book = self._books_by_alias.get(normalize_book_alias(text, fold=False))
+        if book is None:
+            book = self._books_by_folded_alias.get(normalize_book_alias(text))
+        return book
+
+    def parse_references(self, text: str) -> List[BibleReference]:
+        """
+        Interpreta referências como "Jo 3:16-18; Sl 23; 1Co 13".
+        
+        Raises:
+            BibleReferenceError: Se alguma referência for inválida
+        """
+        return parse_references(text, self.resolve_book)
+
+    def get_reference_slides(self, version_abbrev: str, references: List[BibleReference]) -> List[str]:
+        """
+        Monta os slides das referências, buscando cada capítulo pelo cache.
+        
+        Args:
+            version_abbrev: Abreviação da versão
+            references: Referências obtidas com parse_references()
+        
+        Returns:
+            Lista de slides na ordem das referências
+        
+        Raises:
+            BibleAPIError: Se algum capítulo não puder ser obtido
+            BibleReferenceError: Se um intervalo não contiver nenhum versículo
+        """
+        slides: List[str] = []
+        for reference in references:
+            verses = self.get_chapter_verses(version_abbrev, reference.book_abbrev, reference.chapter)
+            selected = [verse for verse in verses if reference.includes(verse['number'])]
+            if not selected:
+                raise BibleReferenceError(f"Nenhum versículo encontrado em {reference.label}")
+            slides.extend(format_verse_slide(reference.book_name, reference.chapter, verse) for verse in selected)
+        return slides
+
+    @staticmethod
+    def _chapter_key(version_abbrev: str, book_abbrev: str, chapter_number: int) -> tuple:
+        """Monta a chave do cache de capítulos: (versão, livro, capítulo)."""
+        return (version_abbrev.lower(), book_abbrev.lower(), int(chapter_number))
+
+    def get_chapter_verses(self, version_abbrev: str, book_abbrev: str, chapter_number: int) -> List[Dict[str, Any]]:
+        """
+        Retorna os versículos de um capítulo, consultando o cache antes da API.
+        
+        A busca passa pelo LRU em memória, depois pelo cache em disco, pelo
+        texto armazenado localmente e só então pela API. Capítulos obtidos
+        da API são gravados no cache e no armazenamento local.
+        
+        Args:
+            version_abbrev: Abreviação da versão (ex: 'nvi')
+            book_abbrev: Abreviação do livro (ex: 'jo')
+            chapter_number: Número do capítulo
+        
+        Returns:
+            Lista de versículos no formato da API ({'number': int, 'text': str})
+        
+        Raises:
+            BibleAPIError: Se o capítulo não estiver em cache e a API falhar
+        """
+        key = self._chapter_key(version_abbrev, book_abbrev, chapter_number)
+        entry = self.chapter_cache.get_entry(key)
+        if entry is not None:
+            if entry.stale:
+                # Serve a cópia vencida agora e revalida em segundo plano
+                self._schedule_chapter_revalidation(key, entry.metadata)
+            self._learn_verse_count(key, entry.value)
+            return entry.value
+        
+        stored_verses = self.bible_store.get_chapter(*key)
+        if stored_verses:
+            self.chapter_cache.set(key, stored_verses)
+            self._learn_verse_count(key, stored_verses)
+            return stored_verses
+        
+        verses = self.api_client.get_chapter_verses(version_abbrev, book_abbrev, int(chapter_number))
+        self._remember_chapter(key, verses)
+        return verses
+
+    def _remember_chapter(self, key: tuple, verses: List[Dict[str, Any]],
+                          validators: Optional[Dict[str, Optional[str]]] = None) -> None:
+        """Grava um capítulo obtido da API no cache (com os validadores HTTP) e no armazenamento local."""
+        # Não armazena respostas vazias para permitir nova tentativa depois
+        if verses:
+            self.chapter_cache.set(key, verses, validators)
+            self.bible_store.save_chapter(*key, verses)
+            self._learn_verse_count(key, verses)
+
+    def _schedule_chapter_revalidation(self, key: tuple, metadata: Optional[Dict[str, Any]]) -> Future:
+        """Revalida um capítulo vencido em segundo plano (GET condicional com ETag/Last-Modified)."""
+        return self.fetch_coordinator.fetch(("revalidate",) + key, lambda: self._revalidate_chapter(key, metadata))
+
+    def _revalidate_chapter(self, key: tuple, metadata: Optional[Dict[str, Any]]) -> None:
+        try:
+            verses, validators = self.api_client.get_chapter_verses_if_modified(*key, metadata)
+        except BibleAPIError as e:
+            logger.debug(f"Revalidação adiada - capítulo: {key}, erro: {e}")
+            return
+        if verses is None:
+            # 304: o conteúdo não mudou; renova o TTL sem baixar o capítulo de novo
+            self.chapter_cache.disk.refresh(key, validators)
+        else:
+            self._remember_chapter(key, verses, validators)
+
+    def _learn_verse_count(self, key: tuple, verses: List[Dict[str, Any]]) -> None:
+        """Corrige o catálogo com a numeração real do capítulo na versão."""
+        if verses:
+            self.catalog.learn(*key, max(int(verse['number']) for verse in verses))
+
+    def get_verse_count(self, version_abbrev: str, book_abbrev: str, chapter_number: int) -> Optional[int]:
+        """
+        Retorna a quantidade de versículos do capítulo sem acessar a rede.
+        
+        Usa a numeração já observada na versão ou, na falta dela, o catálogo
+        distribuído com o projeto. Permite preencher o menu de versículos
+        antes de o texto do capítulo ser buscado.
+        
+        Returns:
+            int ou None se o capítulo não constar do catálogo
+        """
+        return self.catalog.verse_count(book_abbrev, chapter_number, version_abbrev)
+
+    def request_chapter_verses(self, version_abbrev: str, book_abbrev: str, chapter_number: int,
+                               callback: TicketCallback) -> int:
+        """
+        Busca os versículos do capítulo selecionado em segundo plano.
+        
+        Cada chamada substitui a anterior: se o operador trocar de capítulo
+        antes de a busca terminar, o resultado antigo é descartado e o callback
+        não é chamado. Pedidos idênticos em andamento (inclusive
+        pré-carregamentos) são reaproveitados em vez de repetidos.
+        
+        Args:
+            version_abbrev: Abreviação da versão
+            book_abbrev: Abreviação do livro
+            chapter_number: Número do capítulo
+            callback: Chamado na thread de busca com (ticket, versículos, erro)
+        
+        Returns:
+            int: Ticket do pedido (ver FetchCoordinator.is_current)
+        """
+        key = self._chapter_key(version_abbrev, book_abbrev, chapter_number)
+        return self.fetch_coordinator.request_latest(
+            key,
+            lambda: self.get_chapter_verses(version_abbrev, book_abbrev, chapter_number),
+            callback
+        )
+
+    def get_parallel_chapter(self, version_abbrevs: Sequence[str], book_abbrev: str,
+                             chapter_number: int) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Busca o mesmo capítulo em várias versões ao mesmo tempo.
+        
+        Cada versão passa pelo cache de capítulos e pelo coordenador de buscas,
+        então a exibição paralela custa a latência da busca mais lenta e não
+        a soma das buscas.
+        
+        Args:
+            version_abbrevs: Abreviações das versões (ex: ['nvi', 'acf'])
+            book_abbrev: Abreviação do livro
+            chapter_number: Número do capítulo
+        
+        Returns:
+            Dict versão → versículos, na ordem de version_abbrevs
+        
+        Raises:
+            BibleAPIError: Se alguma versão não puder ser obtida
+        """
+        with self._parallel_lock:
+            if self._parallel_executor is None:
+                self._parallel_executor = ThreadPoolExecutor(
+                    max_workers=self.PARALLEL_MAX_WORKERS, thread_name_prefix="bible-parallel"
+                )
+            executor = self._parallel_executor
+        futures = {
+            version: executor.submit(self._load_shared_chapter, version, book_abbrev, int(chapter_number))
+            for version in dict.fromkeys(version_abbrevs)
+        }
+        return {version: future.result() for version, future in futures.items()}
+
+    def _load_shared_chapter(self, version_abbrev: str, book_abbrev: str, chapter_number: int) -> List[Dict[str, Any]]:
+        """Busca um capítulo aproveitando uma busca idêntica que já esteja em andamento."""
+        key = self._chapter_key(version_abbrev, book_abbrev, chapter_number)
+        future = self.fetch_coordinator.run_shared(
+            key, lambda: self.get_chapter_verses(version_abbrev, book_abbrev, chapter_number)
+        )
+        try:
+            return future.result()
+        except CancelledError:
+            # A busca compartilhada foi cancelada por uma nova seleção: busca diretamente
+            return self.get_chapter_verses(version_abbrev, book_abbrev, chapter_number)
+
+    def request_parallel_chapter(self, version_abbrevs: Sequence[str], book_abbrev: str,
+                                 chapter_number: int, callback: TicketCallback) -> int:
+        """
+        Como request_chapter_verses, mas para várias versões (ver get_parallel_chapter).
+        
+        O callback recebe (ticket, dict versão → versículos, erro).
+        """
+        versions = tuple(version.lower() for version in version_abbrevs)
+        key = ("parallel", versions, book_abbrev.lower(), int(chapter_number))
+        return self.fetch_coordinator.request_latest(
+            key,
+            lambda: self.get_parallel_chapter(versions, book_abbrev, chapter_number),
+            callback
+        )
+
+    @staticmethod
+    def join_parallel_verses(chapters: Dict[str, List[Dict[str, Any]]]) -> List[Tuple[int, List[Optional[str]]]]:
+        """
+        Junta os versículos de várias versões pelo número do versículo.
+        
+        Args:
+            chapters: Dict versão → versículos (ver get_parallel_chapter)
+        
+        Returns:
+            Lista ordenada de (número, [texto de cada versão ou None se ausente])
+        """
+        texts_by_version = [
+            {int(verse['number']): verse['text'] for verse in verses} for verses in chapters.values()
+        ]
+        numbers = sorted(set().union(*texts_by_version)) if texts_by_version else []
+        return [(number, [texts.get(number) for texts in texts_by_version]) for number in numbers]
+
+    def is_current_request(self, ticket: int) -> bool:
+        """Indica se o ticket ainda corresponde à seleção mais recente."""
+        return self.fetch_coordinator.is_current(ticket)
+
+    def get_search_index(self, version_abbrev: str) -> Optional[BibleSearchIndex]:
+        """
+        Retorna o índice de busca da versão, carregando-o do disco na primeira vez.
+        
+        Returns:
+            BibleSearchIndex ou None se o índice ainda não foi construído
+        """
+        version = version_abbrev.lower()
+        with self._search_index_lock:
+            index = self._search_indexes.get(version)
+            if index is None:
+                index = BibleSearchIndex.load(index_path(version, Path(BIBLE_SEARCH_INDEX_DIR)))
+                if index is not None:
+                    self._search_indexes[version] = index
+            return index
+
+    def build_search_index(self, version_abbrev: str) -> int:
+        """
+        Constrói (ou reconstrói) o índice de busca a partir do texto armazenado.
+        
+        Tarefa demorada: deve rodar fora da thread da interface. Com um
+        cpu_pool, o índice é construído em outro processo e carregado do
+        disco na próxima busca.
+        
+        Returns:
+            int: Quantidade de versículos indexados
+        """
+        if not self.books:
+            self.load_books()
+        book_order = [abbrev for abbrev in (self.pt_abbrev(book) for book in self.books) if abbrev]
+        version = version_abbrev.lower()
+        if self.cpu_pool is not None:
+            count = self.cpu_pool.run(
+                build_index_file, version_abbrev, self.bible_store.root, book_order, Path(BIBLE_SEARCH_INDEX_DIR)
+            )
+            with self._search_index_lock:
+                self._search_indexes.pop(version, None)
+            return count
+        index = build_and_save(version_abbrev, self.bible_store, book_order, Path(BIBLE_SEARCH_INDEX_DIR))
+        with self._search_index_lock:
+            self._search_indexes[version] = index
+        return len(index)
+
+    def search_verses(self, version_abbrev: str, query: str, limit: int = 20) -> List[SearchResult]:
+        """
+        Busca versículos pelo texto (ignorando acentos; frases entre aspas).
+        
+        Returns:
+            Resultados ordenados por relevância; lista vazia se não houver
+            índice para a versão (ver build_search_index)
+        """
+        index = self.get_search_index(version_abbrev)
+        if index is None:
+            return []
+        return index.search(query, limit=limit)
+
+    def create_download_job(self, version_abbrev: str, books: Optional[Sequence[Dict]] = None,
+                            max_concurrency: Optional[int] = None, rate_per_second: Optional[float] = None,
+                            on_progress: Optional[ProgressCallback] = None) -> BibleDownloadJob:
+        """
+        Cria o job que baixa a versão inteira para o armazenamento local.
+        
+        O job é executado com job.run() (linha de comando) ou
+        run_async(job.arun(), callback) (interface); capítulos já
+        armazenados são pulados, o que permite retomar downloads interrompidos.
+        
+        Args:
+            version_abbrev: Abreviação da versão
+            books: Livros a baixar (padrão: todos)
+            max_concurrency: Requisições simultâneas
+            rate_per_second: Requisições por segundo
+            on_progress: Chamado com o andamento a cada capítulo
+        """
+        if books is None:
+            books = self.load_books() or self.catalog.books
+        return BibleDownloadJob(
+            self.api_client, self.bible_store, version_abbrev, books,
+            max_concurrency=max_concurrency, rate_per_second=rate_per_second, on_progress=on_progress
+        )
+
+    def api_status(self) -> str:
+        """Estado do disjuntor da API: 'closed' (online), 'open' (offline) ou 'half_open' (sondando)."""
+        return self.api_client.circuit_breaker.state
+
+    def add_api_status_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Registra uma função chamada quando a API fica indisponível ou volta.
+        
+        O listener roda na thread que detectou a mudança; a GUI deve
+        reencaminhá-lo para a thread principal.
+        """
+        self.api_client.circuit_breaker.add_listener(listener)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Retorna os contadores de acerto/falha do cache de capítulos."""
+        return self.chapter_cache.stats()
+
+    @staticmethod
+    def pt_abbrev(book: Dict) -> Optional[str]:
+        """Retorna a abreviação em português do livro (aceita dict ou str)."""
+        abbrev = book.get('abbrev')
+        if isinstance(abbrev, dict):
+            return abbrev.get('pt') or abbrev.get('en')
+        return abbrev
+
+    def get_adjacent_chapters(self, book_abbrev: str, chapter_number: int) -> List[Tuple[str, int]]:
+        """
+        Lista os capítulos vizinhos de um capítulo, em ordem de probabilidade de uso.
+        
+        Inclui o próximo e o anterior capítulo do mesmo livro e o primeiro
+        capítulo do livro seguinte e do anterior.
+        
+        Args:
+            book_abbrev: Abreviação do livro
+            chapter_number: Número do capítulo atual
+        
+        Returns:
+            Lista de tuplas (abreviação do livro, capítulo)
+        """
+        book = self.get_book_by_abbrev(book_abbrev)
+        position = self._book_positions.get(book_abbrev)
+        if not book or position is None:
+            return []
+        
+        neighbours: List[Tuple[str, int]] = []
+        num_chapters = book.get('chapters', 0)
+        if chapter_number < num_chapters:
+            neighbours.append((book_abbrev, chapter_number + 1))
+        if chapter_number > 1:
+            neighbours.append((book_abbrev, chapter_number - 1))
+        
+        for neighbour_position in (position + 1, position - 1):
+            if 0 <= neighbour_position < len(self.books):
+                neighbour_abbrev = self.pt_abbrev(self.books[neighbour_position])
+                if neighbour_abbrev:
+                    neighbours.append((neighbour_abbrev, 1))
+        return neighbours
+
+    def prefetch_adjacent_chapters(self, version_abbrev: str, book_abbrev: str, chapter_number: int) -> List[Future]:
+        """
+        Agenda o pré-carregamento dos capítulos vizinhos em segundo plano.
+        
+        Pré-carregamentos anteriores são cancelados, pois a seleção mudou.
+        As tarefas aguardam PREFETCH_DELAY_SECONDS antes de buscar, deixando
+        a rede livre para o capítulo que o operador acabou de abrir.
+        
+        Args:
+            version_abbrev: Abreviação da versão
+            book_abbrev: Abreviação do livro selecionado
+            chapter_number: Capítulo selecionado
+        
+        Returns:
+            Lista de futures das tarefas agendadas
+        """
+        with self._prefetch_lock:
+            self._cancel_prefetch_locked()
+            cancel_event = self._prefetch_cancel_event
+            
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=self.PREFETCH_MAX_WORKERS,
+                    thread_name_prefix="bible-prefetch"
+                )
+            
+            # A consulta ao cache é feita na tarefa, para não ler o disco na thread da interface
+            for neighbour_book, neighbour_chapter in self.get_adjacent_chapters(book_abbrev, int(chapter_number)):
+                future = self._prefetch_executor.submit(
+                    self._prefetch_chapter, cancel_event, version_abbrev, neighbour_book, neighbour_chapter
+                )
+                self._prefetch_futures.append(future)
+            return list(self._prefetch_futures)
+
+    def _prefetch_chapter(self, cancel_event: threading.Event, version_abbrev: str,
+                          book_abbrev: str, chapter_number: int) -> None:
+        """Tarefa de pré-carregamento executada no pool de segundo plano."""
+        # wait() retorna True se o pré-carregamento foi cancelado durante a espera
+        if cancel_event.wait(self.PREFETCH_DELAY_SECONDS):
+            return
+        key = self._chapter_key(version_abbrev, book_abbrev, chapter_number)
+        if self.chapter_cache.contains(key):
+            return
+        # Registrado no coordenador para que uma seleção do mesmo capítulo aproveite esta busca
+        future = self.fetch_coordinator.run_shared(
+            key, lambda: self.get_chapter_verses(version_abbrev, book_abbrev, chapter_number)
+        )
+        if not future.done() or future.cancelled():
+            # O capítulo já está sendo buscado por uma seleção da interface
+            return
+        try:
+            future.result()
+            logger.debug(f"Capítulo pré-carregado: {version_abbrev} {book_abbrev} {chapter_number}")
+        except BibleAPIError:
+            # Falhas de pré-carregamento não são críticas: o capítulo será buscado sob demanda
+            logger.debug(f"Falha ao pré-carregar {version_abbrev} {book_abbrev} {chapter_number}", exc_info=True)
+
+    def _cancel_prefetch_locked(self) -> None:
+        self._prefetch_cancel_event.set()
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures = []
+        self._prefetch_cancel_event = threading.Event()
+
+    def cancel_prefetch(self) -> None:
+        """Cancela os pré-carregamentos pendentes."""
+        with self._prefetch_lock:
+            self._cancel_prefetch_locked()
+
+    def shutdown(self) -> None:
+        """Cancela tarefas pendentes e encerra o pool e o loop de segundo plano."""
+        with self._prefetch_lock:
+            self._cancel_prefetch_locked()
+            if self._prefetch_executor is not None:
+                self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+                self._prefetch_executor = None
+        self.fetch_coordinator.shutdown()
+        with self._parallel_lock:
+            if self._parallel_executor is not None:
+                self._parallel_executor.shutdown(wait=False, cancel_futures=True)
+                self._parallel_executor = None
+        with self._event_loop_lock:
+            event_loop, self._event_loop = self._event_loop, None
+        if event_loop is not None:
+            event_loop.stop()
+
+    def run_async(self, coro, callback: Optional[ResultCallback] = None) -> Future:
+        """
+        Executa uma corrotina no loop asyncio de segundo plano.
+        
+        O callback é chamado na thread do loop com (resultado, erro); a GUI
+        deve reencaminhá-lo para a thread principal com master.after().
+        
+        Returns:
+            concurrent.futures.Future da execução
+        """
+        with self._event_loop_lock:
+            if self._event_loop is None or not self._event_loop.is_running():
+                self._event_loop = EventLoopThread(name="bible-asyncio")
+            event_loop = self._event_loop
+        return event_loop.submit(coro, callback)
+
+    async def aload_book(self, version_abbrev: str, book_abbrev: str) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Carrega todos os capítulos de um livro, buscando em paralelo os ausentes do cache.
+        
+        Args:
+            version_abbrev: Abreviação da versão
+            book_abbrev: Abreviação do livro
+        
+        Returns:
+            Dict mapeando número do capítulo → lista de versículos
+        
+        Raises:
+            BibleAPIError: Se o livro não existir ou algum capítulo falhar
+        """
+        # get_book_by_abbrev pode carregar a lista de livros da API: não bloqueia o loop
+        book = await asyncio.to_thread(self.get_book_by_abbrev, book_abbrev)
+        if not book:
+            raise BibleAPIError(f"Livro não encontrado: {book_abbrev}")
+        
+        chapters = await asyncio.to_thread(
+            self._cached_book_chapters, version_abbrev, book_abbrev, book.get('chapters', 0)
+        )
+        missing = [chapter for chapter in range(1, book.get('chapters', 0) + 1) if chapter not in chapters]
+        
+        results = await asyncio.gather(
+            *(self.api_client.aget_chapter_verses(version_abbrev, book_abbrev, chapter) for chapter in missing),
+            return_exceptions=True
+        )
+        failed = []
+        for chapter, result in zip(missing, results):
+            if isinstance(result, BaseException):
+                failed.append(chapter)
+                continue
+            # Grava no cache em disco e no BibleStore: E/S de arquivo fora do loop
+            await asyncio.to_thread(
+                self._remember_chapter, self._chapter_key(version_abbrev, book_abbrev, chapter), result
+            )
+            chapters[chapter] = result
+        if failed:
+            raise BibleAPIError(f"Não foi possível obter os capítulos {failed} de {book_abbrev} ({version_abbrev})")
+        return chapters
+
+    def _cached_book_chapters(self, version_abbrev: str, book_abbrev: str,
+                              num_chapters: int) -> Dict[int, List[Dict[str, Any]]]:
+        """Lê do cache os capítulos já disponíveis, sem alterar os contadores de acerto."""
+        chapters: Dict[int, List[Dict[str, Any]]] = {}
+        for chapter in range(1, num_chapters + 1):
+            cached = self.chapter_cache.peek(self._chapter_key(version_abbrev, book_abbrev, chapter))
+            if cached is not None:
+                chapters[chapter] = cached
+        return chapters
+
+    def load_book_async(self, version_abbrev: str, book_abbrev: str,
+                        callback: Optional[ResultCallback] = None) -> Future:
+        """Agenda aload_book no loop de segundo plano e retorna o Future."""
+        return self.run_async(self.aload_book(version_abbrev, book_abbrev), callback)
@@ -0,0 +1,180 @@
+"""
+Interpretação de referências bíblicas digitadas pelo operador.
+
+Aceita várias referências separadas por ";", por exemplo:
+"Jo 3:16-18; Sl 23; 1Co 13". O livro é resolvido por uma função fornecida
+pelo chamador (normalmente BibleManager.resolve_book, que usa um índice de
+apelidos O(1)).
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.exceptions import BibleReferenceError
+from core.utils.text_utils import normalize_text
+
+# Prefixos ordinais aceitos antes do nome do livro (1, 1º, 1ª, I, primeira, ...)
+_ORDINAL_WORDS = {
+    "i": "1", "ii": "2", "iii": "3",
+    "primeiro": "1", "primeira": "1",
+    "segundo": "2", "segunda": "2",
+    "terceiro": "3", "terceira": "3",
+    "first": "1", "second": "2", "third": "3",
+}
+_ORDINAL_RE = re.compile(r"^(?:(?P<digit>[123])(?:[oa](?=\s))?\.?|(?P<word>[a-z]+)(?=\s))\s*(?P<rest>\S.*)$")
+# Abreviações em inglês (padrão da API) e variações comuns, por abreviação em português.
+# Complementam os nomes e abreviações que vêm da lista de livros.
+EXTRA_BOOK_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "gn": ("gen", "gênesis"), "ex": ("exo", "êxodo"), "lv": ("lev",), "nm": ("num",), "dt": ("deu",),
+    "js": ("jos",), "jz": ("jud", "jdg", "juízes"), "rt": ("rut",),
+    "1sm": ("1sa", "1samuel"), "2sm": ("2sa", "2samuel"), "1rs": ("1kgs", "1ki", "1reis"),
+    "2rs": ("2kgs", "2ki", "2reis"), "1cr": ("1ch", "1crônicas"), "2cr": ("2ch", "2crônicas"),
+    "ed": ("ezr", "esd"), "ne": ("neh",), "et": ("est",), "job": ("jó",),
+    "sl": ("ps", "psa", "sal", "salmo"), "pv": ("prv", "pro", "prov"), "ec": ("ecl",),
+    "ct": ("so", "sng", "cântico dos cânticos", "cantares"), "is": ("isa",), "jr": ("jer",),
+    "lm": ("lam", "lamentações"), "ez": ("eze", "ezk"), "dn": ("dan",), "os": ("ho", "hos", "oseias"),
+    "jl": ("jol",), "am": ("amo",), "ob": ("oba", "ab"), "jn": ("jon",), "mq": ("mi", "mic", "miqueias"),
+    "na": ("nah",), "hc": ("hk", "hab"), "sf": ("zp", "zep"), "ag": ("hg", "hag"), "zc": ("zac", "zec"),
+    "ml": ("mal",), "mt": ("mat",), "mc": ("mk", "mar"), "lc": ("lk", "luc"), "jo": ("jhn", "joh"),
+    "at": ("act", "atos dos apóstolos"), "rm": ("rom",), "1co": ("1cor",), "2co": ("2cor",),
+    "gl": ("gal",), "ef": ("eph",), "fp": ("ph", "php", "fil"), "cl": ("col",),
+    "1ts": ("1th", "1tes"), "2ts": ("2th", "2tes"), "1tm": ("1ti", "1tim"), "2tm": ("2ti", "2tim"),
+    "tt": ("tit",), "fm": ("phm", "flm"), "hb": ("heb",), "tg": ("jm", "jas"),
+    "1pe": ("1pd",), "2pe": ("2pd",), "1jo": ("1jn",), "2jo": ("2jn",), "3jo": ("3jn",),
+    "jd": ("jude",), "ap": ("re", "rev", "apo"),
+}
+# Livro, capítulo e intervalo opcional de versículos ("Jo 3", "Jo 3:16", "Jo 3.16-18")
+_REFERENCE_RE = re.compile(
+    r"^(?P<book>[1-3]?\s*\D+?)\s*(?P<chapter>\d+)"
+    r"(?:\s*[:.,]\s*(?P<start>\d+)(?:\s*[-–]\s*(?P<end>\d+))?)?$"
+)
+
+
+def normalize_book_alias(alias: str, fold: bool = True) -> str:
+    """
+    Normaliza um nome ou abreviação de livro para uso como chave de índice.
+
+    Ordinais são convertidos em um dígito colado ao restante do nome e os
+    espaços são removidos, de modo que "1ª Coríntios", "1 Co", "I Coríntios"
+    e "primeira coríntios" resultem na mesma forma ("1corintios" / "1co").
+
+    Args:
+        alias: Nome ou abreviação do livro
+        fold: Se True, remove os acentos
+
+    Returns:
+        str: Chave normalizada
+    """
+    # Indicadores ordinais viram espaço: "1ºSamuel" → "1 Samuel"
+    text = normalize_text(re.sub(r"[ºª°]", " ", alias), fold=fold)
+    match = _ORDINAL_RE.match(text)
+    if match:
+        if match.group("digit"):
+            text = match.group("digit") + match.group("rest")
+        elif match.group("word") in _ORDINAL_WORDS:
+            text = _ORDINAL_WORDS[match.group("word")] + match.group("rest")
+    return text.replace(" ", "").replace(".", "")
+
+
+@dataclass(frozen=True)
+class BibleReference:
+    """
+    Referência a um capítulo ou intervalo de versículos.
+
+    Attributes:
+        book_abbrev: Abreviação (pt) do livro, usada nas chamadas à API
+        book_name: Nome do livro para exibição
+        chapter: Número do capítulo
+        verse_start: Primeiro versículo (None = capítulo inteiro)
+        verse_end: Último versículo (None = apenas verse_start)
+    """
+    book_abbrev: str
+    book_name: str
+    chapter: int
+    verse_start: Optional[int] = None
+    verse_end: Optional[int] = None
+
+    def includes(self, verse_number: int) -> bool:
+        """Indica se o versículo faz parte da referência."""
+        if self.verse_start is None:
+            return True
+        end = self.verse_end if self.verse_end is not None else self.verse_start
+        return self.verse_start <= verse_number <= end
+
+    @property
+    def label(self) -> str:
+        """Texto da referência para títulos (ex: "João 3:16-18")."""
+        label = f"{self.book_name} {self.chapter}"
+        if self.verse_start is not None:
+            label += f":{self.verse_start}"
+            if self.verse_end is not None and self.verse_end != self.verse_start:
+                label += f"-{self.verse_end}"
+        return label
+
+
+def format_verse_slide(book_name: str, chapter: int, verse: Dict[str, Any]) -> str:
+    """Monta o texto de um slide de versículo ("Livro C:V" + quebra de linha + texto)."""
+    return f"{book_name} {chapter}:{verse['number']}\n{verse['text']}"
+
+
+def format_parallel_slide(book_name: str, chapter: int, verse_number: int,
+                          texts: Sequence[Tuple[str, Optional[str]]]) -> str:
+    """
+    Monta um slide com o mesmo versículo em várias versões.
+
+    Args:
+        book_name: Nome do livro
+        chapter: Número do capítulo
+        verse_number: Número do versículo
+        texts: Pares (rótulo da versão, texto ou None se a versão não tiver o versículo)
+    """
+    parts = [f"{label}: {text}" for label, text in texts if text]
+    return f"{book_name} {chapter}:{verse_number}\n" + "\n\n".join(parts)
+
+
+def parse_references(text: str, resolve_book: Callable[[str], Optional[Dict[str, Any]]]) -> List[BibleReference]:
+    """
+    Interpreta uma ou mais referências separadas por ";".
+
+    Args:
+        text: Texto digitado (ex: "Jo 3:16-18; Sl 23")
+        resolve_book: Função que recebe o nome/abreviação digitado e retorna
+                      o livro (dict com 'name', 'abbrev' e 'chapters') ou None
+
+    Returns:
+        Lista de BibleReference na ordem digitada
+
+    Raises:
+        BibleReferenceError: Se alguma referência for inválida
+    """
+    references = []
+    for part in (p.strip() for p in text.split(";")):
+        if not part:
+            continue
+        match = _REFERENCE_RE.match(part)
+        if not match:
+            raise BibleReferenceError(f"Referência inválida: '{part}'")
+
+        book = resolve_book(match.group("book").strip())
+        if not book:
+            raise BibleReferenceError(f"Livro não encontrado: '{match.group('book').strip()}'")
+
+        chapter = int(match.group("chapter"))
+        num_chapters = book.get("chapters")
+        if chapter < 1 or (num_chapters and chapter > num_chapters):
+            raise BibleReferenceError(f"{book['name']} não tem o capítulo {chapter}")
+
+        start = int(match.group("start")) if match.group("start") else None
+        end = int(match.group("end")) if match.group("end") else None
+        if start is not None and (start < 1 or (end is not None and end < start)):
+            raise BibleReferenceError(f"Intervalo de versículos inválido: '{part}'")
+
+        abbrev = book.get("abbrev")
+        if isinstance(abbrev, dict):
+            abbrev = abbrev.get("pt") or abbrev.get("en")
+        references.append(BibleReference(abbrev, book["name"], chapter, start, end))
+
+    if not references:
+        raise BibleReferenceError("Nenhuma referência informada")
+    return references
@@ -0,0 +1,318 @@
+"""
+Busca textual nos versículos armazenados localmente.
+
+Mantém um índice invertido por versão (termo → versículos e posições),
+construído uma única vez a partir do BibleStore e gravado em disco.
+As buscas ignoram acentos e maiúsculas, aceitam frases entre aspas e
+ordenam os resultados por relevância (BM25).
+
+Uso pela linha de comando:
+    python -m core.bible_search build nvi
+    python -m core.bible_search search nvi "lâmpada para os meus pés"
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.bible_store import BibleStore
+from core.paths import BIBLE_SEARCH_INDEX_DIR, BIBLE_STORE_DIR
+from core.utils.file_utils import ensure_directory_exists
+from core.utils.text_utils import normalize_text
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+_QUERY_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+# Palavras muito frequentes, ignoradas em termos soltos (continuam valendo dentro de frases)
+STOPWORDS = frozenset({
+    "a", "ao", "aos", "as", "com", "da", "das", "de", "do", "dos", "e", "em", "na", "nas",
+    "no", "nos", "o", "os", "ou", "para", "pela", "pelo", "por", "que", "se", "um", "uma",
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Divide o texto em termos normalizados (minúsculas, sem acentos)."""
+    return _TOKEN_RE.findall(normalize_text(text))
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """
+    Versículo encontrado por uma busca.
+
+    Attributes:
+        book_abbrev: Abreviação do livro
+        chapter: Número do capítulo
+        verse: Número do versículo
+        text: Texto do versículo
+        score: Relevância (maior é melhor)
+    """
+    book_abbrev: str
+    chapter: int
+    verse: int
+    text: str
+    score: float
+
+
+class BibleSearchIndex:
+    """
+    Índice invertido dos versículos de uma versão.
+
+    Attributes:
+        version: Abreviação da versão indexada
+        K1: Saturação da frequência do termo (BM25)
+        B: Peso da normalização pelo tamanho do versículo (BM25)
+    """
+    K1 = 1.2
+    B = 0.75
+    FORMAT_VERSION = 1
+
+    def __init__(self, version: str) -> None:
+        self.version = version.lower()
+        # Documento = versículo: (livro, capítulo, versículo, texto)
+        self._docs: List[Tuple[str, int, int, str]] = []
+        self._lengths: List[int] = []
+        # termo → {id do documento → posições do termo no versículo}
+        self._postings: Dict[str, Dict[int, List[int]]] = {}
+        self._total_length = 0
+        self._avg_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add_verse(self, book_abbrev: str, chapter: int, verse: int, text: str) -> None:
+        """Indexa um versículo."""
+        doc_id = len(self._docs)
+        tokens = tokenize(text)
+        self._docs.append((book_abbrev, chapter, verse, text))
+        self._lengths.append(len(tokens))
+        for position, term in enumerate(tokens):
+            self._postings.setdefault(term, {}).setdefault(doc_id, []).append(position)
+        self._total_length += len(tokens)
+        self._avg_length = self._total_length / len(self._lengths)
+
+    @classmethod
+    def build(cls, store: BibleStore, version: str,
+              book_order: Optional[Sequence[str]] = None) -> "BibleSearchIndex":
+        """
+        Constrói o índice a partir dos capítulos armazenados da versão.
+
+        Args:
+            store: Armazenamento local do texto bíblico
+            version: Abreviação da versão
+            book_order: Ordem canônica das abreviações dos livros (opcional),
+                        usada para desempatar resultados de mesma relevância
+        """
+        index = cls(version)
+        chapters = list(store.iter_chapters(version))
+        if book_order:
+            position = {abbrev.lower(): i for i, abbrev in enumerate(book_order)}
+            chapters.sort(key=lambda item: (position.get(item[0], len(position)), item[1]))
+        for book_abbrev, chapter, verses in chapters:
+            for verse in verses:
+                index.add_verse(book_abbrev, chapter, int(verse["number"]), verse["text"])
+        logger.info(f"Índice de busca construído - versão: {version}, versículos: {len(index)}")
+        return index
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        return math.log(1 + (len(self._docs) - df + 0.5) / (df + 0.5))
+
+    def _bm25(self, term: str, doc_id: int) -> float:
+        positions = self._postings.get(term, {}).get(doc_id)
+        if not positions:
+            return 0.0
+        tf = len(positions)
+        norm = 1 - self.B + self.B * self._lengths[doc_id] / (self._avg_length or 1)
+        return self._idf(term) * tf * (self.K1 + 1) / (tf + self.K1 * norm)
+
+    def _phrase_docs(self, phrase: List[str]) -> set:
+        """Retorna os documentos em que os termos aparecem em sequência."""
+        postings = [self._postings.get(term, {}) for term in phrase]
+        if not postings or any(not p for p in postings):
+            return set()
+        candidates = set(postings[0]).intersection(*postings[1:])
+        matches = set()
+        for doc_id in candidates:
+            following = [set(p[doc_id]) for p in postings[1:]]
+            if any(all(start + offset + 1 in positions for offset, positions in enumerate(following))
+                   for start in postings[0][doc_id]):
+                matches.add(doc_id)
+        return matches
+
+    def search(self, query: str, limit: int = 20) -> List[SearchResult]:
+        """
+        Busca versículos pela consulta.
+
+        Termos soltos são combinados por relevância (versículos que contêm
+        mais termos da consulta ficam à frente); trechos entre aspas exigem
+        a frase exata, ignorando acentos.
+
+        Args:
+            query: Consulta (ex: 'lâmpada pés' ou '"lâmpada para os meus pés"')
+            limit: Número máximo de resultados
+
+        Returns:
+            Lista de SearchResult ordenada por relevância
+        """
+        phrases: List[List[str]] = []
+        loose: List[str] = []
+        for phrase, word in _QUERY_RE.findall(query):
+            if phrase:
+                tokens = tokenize(phrase)
+                if tokens:
+                    phrases.append(tokens)
+            else:
+                loose.extend(tokenize(word))
+
+        # Stopwords só são descartadas quando há outros termos
+        meaningful = [term for term in loose if term not in STOPWORDS] or loose
+        scoring_terms = list(dict.fromkeys(
+            meaningful + [term for phrase in phrases for term in phrase if term not in STOPWORDS]
+        ))
+        if not scoring_terms and not phrases:
+            return []
+
+        if phrases:
+            candidates = set.intersection(*(self._phrase_docs(phrase) for phrase in phrases))
+        else:
+            candidates = set()
+            for term in scoring_terms:
+                candidates.update(self._postings.get(term, ()))
+
+        scored = []
+        for doc_id in candidates:
+            matched = [term for term in scoring_terms if doc_id in self._postings.get(term, ())]
+            score = sum(self._bm25(term, doc_id) for term in matched)
+            # Fator de coordenação: favorece versículos com todos os termos
+            if scoring_terms:
+                score *= len(matched) / len(scoring_terms)
+            scored.append((score, doc_id))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        results = []
+        for score, doc_id in scored[:limit]:
+            book_abbrev, chapter, verse, text = self._docs[doc_id]
+            results.append(SearchResult(book_abbrev, chapter, verse, text, round(score, 4)))
+        return results
+
+    def save(self, path: Path) -> None:
+        """Grava o índice em disco (JSON, gravação atômica)."""
+        data = {
+            "format": self.FORMAT_VERSION,
+            "version": self.version,
+            "docs": self._docs,
+            "postings": {
+                term: [[doc_id, *positions] for doc_id, positions in docs.items()]
+                for term, docs in self._postings.items()
+            },
+        }
+        path = Path(path)
+        ensure_directory_exists(path)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["BibleSearchIndex"]:
+        """Carrega um índice gravado com save(); retorna None se ausente ou incompatível."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Índice de busca ilegível - caminho: {path}, erro: {e}")
+            return None
+        if data.get("format") != cls.FORMAT_VERSION:
+            return None
+
+        index = cls(data["version"])
+        index._docs = [tuple(doc) for doc in data["docs"]]
+        index._lengths = [0] * len(index._docs)
+        for term, entries in data["postings"].items():
+            docs = index._postings[term] = {}
+            for doc_id, *positions in entries:
+                docs[doc_id] = positions
+                index._lengths[doc_id] += len(positions)
+        index._total_length = sum(index._lengths)
+        index._avg_length = index._total_length / len(index._lengths) if index._lengths else 0.0
+        return index
+
+
+def index_path(version: str, directory: Path = BIBLE_SEARCH_INDEX_DIR) -> Path:
+    """Caminho do arquivo de índice de uma versão."""
+    return Path(directory) / f"{version.lower()}.json"
+
+
+def build_and_save(version: str, store: Optional[BibleStore] = None,
+                   book_order: Optional[Sequence[str]] = None,
+                   directory: Path = BIBLE_SEARCH_INDEX_DIR) -> BibleSearchIndex:
+    """Constrói o índice de uma versão a partir do armazenamento local e o grava em disco."""
+    store = store or BibleStore(BIBLE_STORE_DIR)
+    index = BibleSearchIndex.build(store, version, book_order)
+    index.save(index_path(version, directory))
+    return index
+
+
+def build_index_file(version: str, store_root: Path, book_order: Optional[Sequence[str]] = None,
+                     directory: Path = BIBLE_SEARCH_INDEX_DIR) -> int:
+    """
+    Versão de build_and_save para executar em um ProcessPool.
+
+    Recebe apenas caminhos e devolve a quantidade de versículos indexados,
+    para que o índice (grande) não precise voltar ao processo da interface.
+    """
+    return len(build_and_save(version, BibleStore(Path(store_root)), book_order, Path(directory)))
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    """Ponto de entrada da linha de comando (build / search)."""
+    parser = argparse.ArgumentParser(prog="python -m core.bible_search",
+                                     description="Índice de busca dos versículos armazenados localmente")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="Constrói o índice de uma versão")
+    build_parser.add_argument("version")
+    search_parser = subparsers.add_parser("search", help="Busca versículos em uma versão já indexada")
+    search_parser.add_argument("version")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    if args.command == "build":
+        from core.bible_manager import BibleManager
+        # Ordem canônica dos livros, quando a lista de livros estiver disponível
+        book_order = [BibleManager.pt_abbrev(book) for book in BibleManager().load_books()]
+        start = time.perf_counter()
+        index = build_and_save(args.version, book_order=[abbrev for abbrev in book_order if abbrev])
+        print(f"{len(index)} versículos indexados em {time.perf_counter() - start:.1f}s "
+              f"→ {index_path(args.version)}")
+        return 0
+
+    index = BibleSearchIndex.load(index_path(args.version))
+    if index is None:
+        print(f"Índice não encontrado para '{args.version}'. Rode: python -m core.bible_search build {args.version}",
+              file=sys.stderr)
+        return 1
+    start = time.perf_counter()
+    results = index.search(args.query, limit=args.limit)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for result in results:
+        print(f"{result.book_abbrev} {result.chapter}:{result.verse} ({result.score}) {result.text}")
+    print(f"{len(results)} resultado(s) em {elapsed_ms:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
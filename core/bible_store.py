@@ -0,0 +1,110 @@
+"""
+Armazenamento local do texto bíblico.
+
+Diferente do cache de capítulos (que expira e despeja entradas), o
+BibleStore guarda permanentemente cada capítulo obtido, organizado por
+versão. É a base para a busca textual e para o uso sem internet.
+
+Estrutura em disco:
+    data/bible/<versão>/<livro>/<capítulo>.json  → lista de versículos
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.utils.file_utils import ensure_directory_exists
+
+logger = logging.getLogger(__name__)
+
+Verses = List[Dict[str, Any]]
+
+
+class BibleStore:
+    """
+    Guarda os capítulos da Bíblia em disco, um arquivo JSON por capítulo.
+
+    Attributes:
+        root: Diretório raiz do armazenamento
+    """
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    def _chapter_path(self, version_abbrev: str, book_abbrev: str, chapter_number: int) -> Path:
+        return self.root / version_abbrev.lower() / book_abbrev.lower() / f"{int(chapter_number)}.json"
+
+    def get_chapter(self, version_abbrev: str, book_abbrev: str, chapter_number: int) -> Optional[Verses]:
+        """Retorna os versículos armazenados do capítulo ou None se ausente."""
+        path = self._chapter_path(version_abbrev, book_abbrev, chapter_number)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Capítulo armazenado ilegível - caminho: {path}, erro: {e}")
+            return None
+
+    def has_chapter(self, version_abbrev: str, book_abbrev: str, chapter_number: int) -> bool:
+        """Indica se o capítulo já está armazenado."""
+        return self._chapter_path(version_abbrev, book_abbrev, chapter_number).exists()
+
+    def save_chapter(self, version_abbrev: str, book_abbrev: str, chapter_number: int, verses: Verses) -> None:
+        """
+        Grava o capítulo de forma atômica (arquivo temporário + os.replace).
+
+        Falhas de gravação são registradas, mas não interrompem a aplicação.
+        """
+        path = self._chapter_path(version_abbrev, book_abbrev, chapter_number)
+        payload = json.dumps(verses, ensure_ascii=False)
+        with self._lock:
+            try:
+                ensure_directory_exists(path)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Não foi possível armazenar o capítulo - caminho: {path}, erro: {e}")
+
+    def versions(self) -> List[str]:
+        """Lista as versões com algum capítulo armazenado."""
+        if not self.root.exists():
+            return []
+        return sorted(entry.name for entry in os.scandir(self.root) if entry.is_dir())
+
+    def iter_chapters(self, version_abbrev: str) -> Iterator[Tuple[str, int, Verses]]:
+        """
+        Percorre os capítulos armazenados de uma versão.
+
+        Yields:
+            Tuplas (abreviação do livro, número do capítulo, versículos)
+        """
+        version_dir = self.root / version_abbrev.lower()
+        if not version_dir.exists():
+            return
+        for book_entry in sorted(os.scandir(version_dir), key=lambda entry: entry.name):
+            if not book_entry.is_dir():
+                continue
+            chapter_numbers = sorted(
+                int(entry.name[:-5]) for entry in os.scandir(book_entry.path)
+                if entry.name.endswith(".json") and entry.name[:-5].isdigit()
+            )
+            for chapter_number in chapter_numbers:
+                verses = self.get_chapter(version_abbrev, book_entry.name, chapter_number)
+                if verses:
+                    yield book_entry.name, chapter_number, verses
+
+    def chapter_count(self, version_abbrev: str) -> int:
+        """Retorna quantos capítulos da versão estão armazenados."""
+        version_dir = self.root / version_abbrev.lower()
+        if not version_dir.exists():
+            return 0
+        return sum(
+            1 for book_entry in os.scandir(version_dir) if book_entry.is_dir()
+            for entry in os.scandir(book_entry.path) if entry.name.endswith(".json")
+        )
@@ -1,7 +1,10 @@
 import configparser
 import os
 import logging
-from typing import Optional, Any
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 # --- IMPORTAÇÃO MODIFICADA ---
 from core.paths import CONFIG_PATH
 from core.exceptions import ConfigSaveError, ValidationError
@@ -9,6 +12,11 @@ from core.validators import validate_font_size, validate_color
 
 logger = logging.getLogger(__name__)
 
+# Chave de uma configuração: (seção, chave)
+SettingKey = Tuple[str, str]
+ChangeListener = Callable[[FrozenSet[SettingKey]], None]
+
+
 class ConfigManager:
     """
     Gerenciador de configurações da aplicação.
@@ -16,9 +24,20 @@ class ConfigManager:
     Responsável por carregar, salvar e gerenciar todas as configurações
     da aplicação em arquivo INI. Cria configurações padrão se não existirem.
     
+    As leituras são servidas da memória. O arquivo só é lido de novo se a
+    data de modificação (ou o tamanho) mudar, o que é verificado no máximo
+    uma vez a cada RELOAD_CHECK_INTERVAL_SECONDS, ou após invalidate().
+    
+    Alterações feitas dentro de batch() são validadas e aplicadas juntas,
+    com uma única gravação (atômica) do arquivo; os listeners registrados
+    com add_change_listener recebem uma vez o conjunto de chaves alteradas.
+    
     Attributes:
         config: Objeto ConfigParser com todas as configurações
     """
+    # Intervalo mínimo entre verificações de alteração externa do arquivo
+    RELOAD_CHECK_INTERVAL_SECONDS = 2.0
+
     def __init__(self) -> None:
         """
         Inicializa o ConfigManager e carrega as configurações.
@@ -26,17 +45,72 @@ class ConfigManager:
         Cria arquivo de configuração padrão se não existir.
         """
         self.config = configparser.ConfigParser()
+        self._lock = threading.RLock()
+        self._file_signature: Optional[Tuple[int, int]] = None
+        self._last_check = 0.0
+        self._change_listeners: List[ChangeListener] = []
+        # Alterações pendentes do batch() em andamento (None fora de um batch)
+        self._pending: Optional[Dict[SettingKey, str]] = None
+        self._batch_depth = 0
         self.load_config()
 
     def load_config(self) -> None:
         """Carrega as configurações do arquivo. Cria o arquivo com padrões se não existir."""
-        if not os.path.exists(CONFIG_PATH):
-            self._create_default_config()
-            # Precisamos salvar o arquivo recém-criado antes de lê-lo
-            self._save_config_file()
+        with self._lock:
+            if not os.path.exists(CONFIG_PATH):
+                self._create_default_config()
+                # Precisamos salvar o arquivo recém-criado antes de lê-lo
+                self._save_config_file()
+            
+            # Um parser novo descarta chaves removidas do arquivo
+            config = configparser.ConfigParser()
+            # O argumento encoding é importante para consistência
+            config.read(CONFIG_PATH, encoding='utf-8')
+            changed = self._diff(self.config, config)
+            self.config = config
+            self._file_signature = self._read_file_signature()
+            self._last_check = time.monotonic()
+        if changed:
+            self._notify(changed)
+
+    @staticmethod
+    def _diff(old: configparser.ConfigParser, new: configparser.ConfigParser) -> FrozenSet[SettingKey]:
+        """Chaves (seção, chave) com valor diferente entre duas configurações."""
+        def flatten(config: configparser.ConfigParser) -> Dict[SettingKey, str]:
+            return {(section, key): value for section in config.sections() for key, value in config.items(section, raw=True)}
+        old_values, new_values = flatten(old), flatten(new)
+        return frozenset(key for key in old_values.keys() | new_values.keys()
+                         if old_values.get(key) != new_values.get(key))
+
+    def invalidate(self) -> None:
+        """Força a verificação do arquivo na próxima leitura (ex: após editá-lo externamente)."""
+        with self._lock:
+            self._last_check = float("-inf")
+
+    @staticmethod
+    def _read_file_signature() -> Optional[Tuple[int, int]]:
+        """Data de modificação (ns) e tamanho do arquivo, ou None se ele não existir."""
+        try:
+            stat = os.stat(CONFIG_PATH)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload_if_changed(self) -> None:
+        """
+        Relê o arquivo se ele mudou desde a última leitura (verificação limitada por intervalo).
         
-        # O argumento encoding é importante para consistência
-        self.config.read(CONFIG_PATH, encoding='utf-8')
+        Os listeners são notificados com as chaves alteradas pela releitura.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_check < self.RELOAD_CHECK_INTERVAL_SECONDS:
+                return
+            self._last_check = now
+            signature = self._read_file_signature()
+            if signature is not None and signature != self._file_signature:
+                logger.info(f"Arquivo de configuração alterado externamente, recarregando - caminho: {CONFIG_PATH}")
+                self.load_config()
 
     def _create_default_config(self) -> None:
         """Cria um arquivo de config com seções de estilo separadas."""
@@ -66,21 +140,20 @@ class ConfigManager:
 
     def get_setting(self, section: str, key: str, fallback: Optional[str] = None) -> Optional[str]:
         """Obtém uma configuração. Retorna fallback se não encontrada."""
-        # Adicionado encoding='utf-8' para consistência
-        self.config.read(CONFIG_PATH, encoding='utf-8')
+        self.reload_if_changed()
         return self.config.get(section, key, fallback=fallback)
 
     def get_int_setting(self, section: str, key: str, fallback: Optional[int] = None) -> Optional[int]:
         """Obtém uma configuração como inteiro. Retorna fallback se não encontrada."""
-        # Adicionado encoding='utf-8' para consistência
-        self.config.read(CONFIG_PATH, encoding='utf-8')
+        self.reload_if_changed()
         try:
             return self.config.getint(section, key)
         except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
             return fallback
 
-    def set_setting(self, section: str, key: str, value: Any) -> bool:
-        """Define uma configuração e salva no arquivo."""
+    @staticmethod
+    def _validate(key: str, value: Any) -> str:
+        """Valida o valor conforme o tipo da configuração e o converte para texto."""
         # Fail Fast: Validar valor conforme tipo de setting
         if key == 'font_size':
             value = validate_font_size(value)
@@ -88,17 +161,115 @@ class ConfigManager:
             value = validate_color(value)
         # Outros tipos de settings (como animation_type) são strings simples
         # e não precisam de validação específica além do que já é feito
+        return str(value)
+
+    def set_setting(self, section: str, key: str, value: Any) -> bool:
+        """
+        Define uma configuração e salva no arquivo.
         
-        if not self.config.has_section(section):
-            self.config.add_section(section)
-        self.config.set(section, key, str(value))
-        return self._save_config_file() # Adiciona o 'return' aqui
+        Dentro de batch(), o valor é apenas validado e guardado; a gravação
+        acontece uma vez, ao final do batch. Valores iguais aos atuais não
+        provocam gravação.
+        
+        Raises:
+            ValidationError: Se o valor for inválido
+            ConfigSaveError: Se o arquivo não puder ser gravado
+        """
+        with self.batch():
+            self._pending[(section, key)] = self._validate(key, value)
+        return True
+
+    @contextmanager
+    def batch(self) -> Iterator["ConfigManager"]:
+        """
+        Agrupa várias chamadas a set_setting em uma única gravação.
+        
+        Os valores são validados em cada set_setting. Se o bloco levantar
+        uma exceção, nada é aplicado. Ao final, as alterações são aplicadas
+        em memória, o arquivo é gravado uma vez e os listeners são
+        notificados com as chaves alteradas. Batches aninhados se juntam ao
+        mais externo.
+        
+        Raises:
+            ConfigSaveError: Se o arquivo não puder ser gravado (as
+                             alterações em memória são desfeitas)
+        
+        Examples:
+            >>> with config.batch():
+            ...     config.set_setting('Projection_Music', 'font_size', 72)
+            ...     config.set_setting('Projection_Music', 'font_color', 'white')
+        """
+        with self._lock:
+            self._batch_depth += 1
+            if self._batch_depth == 1:
+                self._pending = {}
+            try:
+                yield self
+                if self._batch_depth > 1:
+                    return
+                changed = self._apply_pending(self._pending)
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._pending = None
+        if changed:
+            self._notify(changed)
+
+    def _apply_pending(self, pending: Dict[SettingKey, str]) -> FrozenSet[SettingKey]:
+        """Aplica as alterações que mudam algum valor e grava o arquivo uma vez."""
+        previous: Dict[SettingKey, Optional[str]] = {}
+        for (section, key), value in pending.items():
+            current = self.config.get(section, key, fallback=None)
+            if current == value:
+                continue
+            previous[(section, key)] = current
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            self.config.set(section, key, value)
+        if not previous:
+            return frozenset()
+        try:
+            self._save_config_file()
+        except ConfigSaveError:
+            for (section, key), value in previous.items():
+                if value is None:
+                    self.config.remove_option(section, key)
+                else:
+                    self.config.set(section, key, value)
+            raise
+        logger.debug(f"Configurações gravadas - alteradas: {sorted(previous)}")
+        return frozenset(previous)
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """
+        Registra uma função chamada com as chaves (seção, chave) alteradas.
+        
+        Chamada uma vez por gravação (ou releitura do arquivo editado fora do
+        programa), na thread que fez a alteração.
+        """
+        self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: ChangeListener) -> None:
+        """Remove um listener registrado com add_change_listener."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def _notify(self, changed: FrozenSet[SettingKey]) -> None:
+        for listener in list(self._change_listeners):
+            try:
+                listener(changed)
+            except Exception:
+                logger.exception("Erro em listener de alteração de configuração")
 
     def _save_config_file(self) -> bool:
-        """Salva o objeto de configuração atual no arquivo."""
+        """Salva o objeto de configuração atual no arquivo (arquivo temporário + os.replace)."""
+        tmp_path = f"{CONFIG_PATH}.tmp"
         try:
-            with open(CONFIG_PATH, 'w', encoding='utf-8') as configfile:
+            with open(tmp_path, 'w', encoding='utf-8') as configfile:
                 self.config.write(configfile)
+            os.replace(tmp_path, CONFIG_PATH)
+            # A própria escrita não deve provocar uma releitura
+            self._file_signature = self._read_file_signature()
             return True # Retorna True em caso de sucesso
         except IOError as e:
             logger.error(f"Erro ao salvar arquivo de configuração - caminho: {CONFIG_PATH}, seção: {list(self.config.sections())}", exc_info=True)
@@ -55,6 +55,17 @@ class BibleAPIError(ProjectorError):
     pass
 
 
+class BibleAPIUnavailableError(BibleAPIError):
+    """
+    Exceção levantada quando a API da Bíblia está temporariamente indisponível.
+    
+    Ocorre sem acesso à rede enquanto o disjuntor do cliente está aberto,
+    após falhas consecutivas; o conteúdo deve vir do cache ou do texto
+    armazenado localmente.
+    """
+    pass
+
+
 class ScraperError(ProjectorError):
     """
     Exceção base para erros relacionados ao scraper de letras.
@@ -91,3 +102,12 @@ class ValidationError(ProjectorError):
     """
     pass
 
+
+class BibleReferenceError(ValidationError):
+    """
+    Exceção levantada quando uma referência bíblica digitada é inválida.
+    
+    Ocorre quando o livro não é reconhecido, o capítulo não existe
+    ou o texto não segue o formato "Livro capítulo:versículo".
+    """
+    pass
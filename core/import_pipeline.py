@@ -0,0 +1,429 @@
+"""
+Pipeline de importação de músicas em estágios sobrepostos.
+
+Cada música passa por cinco estágios ligados por filas de tamanho limitado:
+
+    busca (E/S) → análise (CPU) → normalização → deduplicação → gravação
+
+Os estágios têm suas próprias threads, de modo que, enquanto uma página é
+baixada, outra é analisada e um lote anterior é gravado. As filas limitadas
+fazem o estágio mais lento segurar os anteriores (sem acumular páginas na
+memória). A deduplicação usa os índices do MusicManager e um único escritor
+grava as músicas em lotes (MusicManager.add_music_batch).
+
+Cada estágio registra itens processados, falhas, tempo ocupado e a
+profundidade da fila de entrada (ver ImportPipeline.metrics).
+
+Uso pela linha de comando:
+    python -m core.import_pipeline urls.txt
+    python -m core.import_pipeline urls.txt --fetch-workers 6 --rate 3
+"""
+
+import argparse
+import logging
+import queue
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import requests
+
+from core.exceptions import MusicDatabaseError, ScraperError, ScraperNetworkError
+from core.music_import import BatchImportReport, ImportItemResult, ResultCallback, prepare_song_urls, split_url_list
+from core.utils.rate_limiter import HostRateLimiter
+from core.validators import validate_string
+
+logger = logging.getLogger(__name__)
+
+# Marca o fim dos itens de uma fila
+_STOP = object()
+
+
+@dataclass
+class StageMetrics:
+    """
+    Contadores de um estágio do pipeline.
+
+    Attributes:
+        name: Nome do estágio
+        workers: Threads do estágio
+        processed: Itens concluídos (inclusive os descartados, como duplicatas)
+        failed: Itens que falharam no estágio
+        busy_seconds: Tempo somado das threads processando itens
+    """
+    name: str
+    workers: int
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+
+
+@dataclass
+class _PipelineItem:
+    url: str
+    html: Optional[str] = None
+    music: Optional[Dict[str, str]] = None
+
+
+def normalize_music_data(music: Dict[str, str]) -> Dict[str, str]:
+    """
+    Padroniza os campos de uma música antes da deduplicação e da gravação.
+
+    Remove espaços extras do título e do artista, converte quebras de linha
+    para '\\n', tira espaços no fim das linhas e deixa no máximo uma linha em
+    branco entre as estrofes (que viram os slides).
+
+    Raises:
+        ValidationError: Se algum campo ficar vazio
+    """
+    lyrics = music.get("lyrics_full") or ""
+    lyrics = "\n".join(line.rstrip() for line in lyrics.replace("\r\n", "\n").replace("\r", "\n").split("\n"))
+    lyrics = re.sub(r"\n{3,}", "\n\n", lyrics).strip()
+    return {
+        "title": validate_string(re.sub(r"\s+", " ", music.get("title") or ""), "título"),
+        "artist": validate_string(re.sub(r"\s+", " ", music.get("artist") or ""), "artista"),
+        "lyrics_full": validate_string(lyrics, "letra completa"),
+    }
+
+
+class _Stage:
+    """Estágio com fila de entrada limitada e um grupo de threads."""
+
+    def __init__(self, name: str, workers: int, handler: Callable[[Any], Any], queue_size: int,
+                 on_error: Callable[[Any, Exception], None]) -> None:
+        self.name = name
+        self.handler = handler
+        self.on_error = on_error
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.metrics = StageMetrics(name, workers)
+        self.next: Optional["_Stage"] = None
+        self._running = workers
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        for index in range(self.metrics.workers):
+            thread = threading.Thread(target=self._work, name=f"import-{self.name}-{index}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def join(self) -> None:
+        for thread in self._threads:
+            thread.join()
+
+    def _record(self, started: float, failed: bool = False) -> None:
+        with self._lock:
+            self.metrics.processed += 1
+            self.metrics.busy_seconds += time.perf_counter() - started
+            if failed:
+                self.metrics.failed += 1
+
+    def _process(self, item: Any) -> None:
+        started = time.perf_counter()
+        try:
+            output = self.handler(item)
+        except Exception as e:
+            self._record(started, failed=True)
+            self._report_error(item, e)
+            return
+        self._record(started)
+        if output is not None and self.next is not None:
+            self.next.queue.put(output)
+
+    def _report_error(self, item: Any, error: Exception) -> None:
+        # Um erro no callback não pode derrubar a thread (o pipeline ficaria preso em join)
+        try:
+            self.on_error(item, error)
+        except Exception:
+            logger.exception(f"Erro no tratamento de falha do estágio {self.name}")
+
+    def _work(self) -> None:
+        try:
+            while True:
+                item = self.queue.get()
+                if item is _STOP:
+                    break
+                self._process(item)
+        finally:
+            self._worker_finished()
+
+    def _worker_finished(self) -> None:
+        """A última thread a terminar avisa o próximo estágio."""
+        with self._lock:
+            self._running -= 1
+            last = self._running == 0
+        if last and self.next is not None:
+            for _ in range(self.next.metrics.workers):
+                self.next.queue.put(_STOP)
+
+
+class _BatchingStage(_Stage):
+    """Estágio de uma thread que agrupa os itens e os processa em lotes."""
+
+    def __init__(self, name: str, handler: Callable[[List[Any]], None], queue_size: int,
+                 on_error: Callable[[Any, Exception], None], batch_size: int, max_wait: float) -> None:
+        super().__init__(name, 1, handler, queue_size, on_error)
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+
+    def _flush(self, batch: List[Any]) -> None:
+        started = time.perf_counter()
+        try:
+            self.handler(batch)
+            failed = False
+        except Exception as e:
+            failed = True
+            for item in batch:
+                self._report_error(item, e)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.metrics.processed += len(batch)
+            self.metrics.busy_seconds += elapsed
+            if failed:
+                self.metrics.failed += len(batch)
+        batch.clear()
+
+    def _work(self) -> None:
+        batch: List[Any] = []
+        deadline = None
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    # Tempo máximo de espera atingido: grava o lote incompleto
+                    self._flush(batch)
+                    deadline = None
+                    continue
+                if item is _STOP:
+                    break
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.max_wait
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+                    deadline = None
+            if batch:
+                self._flush(batch)
+        finally:
+            self._worker_finished()
+
+
+class ImportPipeline:
+    """
+    Importa músicas com busca, análise e gravação acontecendo ao mesmo tempo.
+
+    Attributes:
+        scraper: LetrasScraper (get_page_html e parse_page)
+        manager: MusicManager que recebe as músicas; durante run() o
+                 escritor do pipeline deve ser o único a alterá-lo
+        rate_limiter: Limite de requisições por segundo, por host
+    """
+    FETCH_WORKERS = 4
+    PARSE_WORKERS = 2
+    QUEUE_SIZE = 16
+    WRITE_BATCH_SIZE = 20
+    # Espera máxima (segundos) para completar um lote antes de gravá-lo
+    WRITE_MAX_WAIT_SECONDS = 1.0
+    RATE_PER_SECOND_PER_HOST = 2.0
+    ALLOWED_DOMAINS = ['letras.mus.br']
+
+    def __init__(self, scraper: Any, music_manager: Any, fetch_workers: Optional[int] = None,
+                 parse_workers: Optional[int] = None, queue_size: Optional[int] = None,
+                 write_batch_size: Optional[int] = None, rate_per_second: Optional[float] = None) -> None:
+        self.scraper = scraper
+        self.manager = music_manager
+        self.rate_limiter = HostRateLimiter(rate_per_second or self.RATE_PER_SECOND_PER_HOST)
+        self._fetch_workers = fetch_workers or self.FETCH_WORKERS
+        self._parse_workers = parse_workers or self.PARSE_WORKERS
+        self._queue_size = queue_size or self.QUEUE_SIZE
+        self._write_batch_size = write_batch_size or self.WRITE_BATCH_SIZE
+        self._cancel_event = threading.Event()
+        self._report_lock = threading.Lock()
+        self._report = BatchImportReport()
+        self._on_result: Optional[ResultCallback] = None
+        self._seen: set = set()
+        self._stages: List[_Stage] = []
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    def cancel(self) -> None:
+        """Descarta as URLs ainda não baixadas; as músicas já em andamento são gravadas."""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self, urls: Iterable[str], on_result: Optional[ResultCallback] = None) -> BatchImportReport:
+        """
+        Importa as URLs, bloqueando até o último lote ser gravado.
+
+        Args:
+            urls: URLs das músicas no Letras.mus.br
+            on_result: Chamado com o resultado de cada URL (nas threads do pipeline)
+
+        Returns:
+            BatchImportReport com as músicas gravadas, duplicatas e falhas
+        """
+        self._report = BatchImportReport()
+        self._on_result = on_result
+        self._seen = set()
+        valid, invalid = prepare_song_urls(urls, self.ALLOWED_DOMAINS)
+        for result in invalid:
+            self._finish_item(result)
+
+        self._stages = self._build_stages()
+        self._started_at = time.perf_counter()
+        self._finished_at = None
+        for stage in self._stages:
+            stage.start()
+        fetch_stage = self._stages[0]
+        for url in valid:
+            fetch_stage.queue.put(_PipelineItem(url))
+        for _ in range(fetch_stage.metrics.workers):
+            fetch_stage.queue.put(_STOP)
+        for stage in self._stages:
+            stage.join()
+        self._finished_at = time.perf_counter()
+
+        self._report.cancelled = self.cancelled
+        logger.info(
+            f"Pipeline de importação concluído - adicionadas: {len(self._report.added)}, "
+            f"duplicadas: {len(self._report.duplicates)}, falhas: {len(self._report.failed)}, "
+            f"tempo: {self._finished_at - self._started_at:.2f}s"
+        )
+        return self._report
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Métricas por estágio (também durante a execução).
+
+        Returns:
+            Dict nome do estágio → 'workers', 'processed', 'failed',
+            'busy_seconds', 'throughput' (itens por segundo desde o início)
+            e 'queue_depth' (itens aguardando na fila de entrada)
+        """
+        if self._started_at is None:
+            return {}
+        elapsed = (self._finished_at or time.perf_counter()) - self._started_at
+        result = {}
+        for stage in self._stages:
+            metrics = stage.metrics
+            result[stage.name] = {
+                "workers": metrics.workers,
+                "processed": metrics.processed,
+                "failed": metrics.failed,
+                "busy_seconds": metrics.busy_seconds,
+                "throughput": metrics.processed / elapsed if elapsed > 0 else 0.0,
+                "queue_depth": stage.queue.qsize(),
+            }
+        return result
+
+    def _build_stages(self) -> List[_Stage]:
+        stages = [
+            _Stage("fetch", self._fetch_workers, self._fetch, self._queue_size, self._on_error),
+            _Stage("parse", self._parse_workers, self._parse, self._queue_size, self._on_error),
+            _Stage("normalize", 1, self._normalize, self._queue_size, self._on_error),
+            _Stage("dedupe", 1, self._dedupe, self._queue_size, self._on_error),
+            _BatchingStage("persist", self._persist, self._queue_size, self._on_error,
+                           self._write_batch_size, self.WRITE_MAX_WAIT_SECONDS),
+        ]
+        for stage, next_stage in zip(stages, stages[1:]):
+            stage.next = next_stage
+        return stages
+
+    # --- Estágios ---
+
+    def _fetch(self, item: _PipelineItem) -> Optional[_PipelineItem]:
+        if self.cancelled:
+            # Cada URL recebida tem um resultado, inclusive as não baixadas
+            self._finish_item(ImportItemResult(item.url, error=ScraperError("Importação cancelada")))
+            return None
+        self.rate_limiter.acquire(item.url)
+        try:
+            item.html = self.scraper.get_page_html(item.url)
+        except requests.exceptions.RequestException as e:
+            raise ScraperNetworkError(f"Erro de rede ao acessar {item.url}: {e}") from e
+        return item
+
+    def _parse(self, item: _PipelineItem) -> _PipelineItem:
+        item.music = self.scraper.parse_page(item.html, item.url)
+        item.html = None  # Libera a página assim que analisada
+        return item
+
+    def _normalize(self, item: _PipelineItem) -> _PipelineItem:
+        item.music = normalize_music_data(item.music)
+        return item
+
+    def _dedupe(self, item: _PipelineItem) -> Optional[_PipelineItem]:
+        music = item.music
+        key = (music["title"].lower(), music["artist"].lower())
+        if key in self._seen or self.manager.is_duplicate(music["title"], music["artist"]):
+            with self._report_lock:
+                self._report.duplicates.append(music)
+            self._finish_item(ImportItemResult(item.url, music_data=music))
+            return None
+        self._seen.add(key)
+        return item
+
+    def _persist(self, batch: List[_PipelineItem]) -> None:
+        added = self.manager.add_music_batch([item.music for item in batch])
+        with self._report_lock:
+            self._report.added.extend(added)
+        for item in batch:
+            self._finish_item(ImportItemResult(item.url, music_data=item.music))
+
+    # --- Resultados ---
+
+    def _on_error(self, item: _PipelineItem, error: Exception) -> None:
+        if not isinstance(error, MusicDatabaseError):
+            logger.warning(f"Falha ao importar música - url: {item.url}, erro: {error}")
+        self._finish_item(ImportItemResult(item.url, error=error))
+
+    def _finish_item(self, result: ImportItemResult) -> None:
+        with self._report_lock:
+            self._report.results.append(result)
+        if self._on_result is not None:
+            try:
+                self._on_result(result)
+            except Exception:
+                logger.exception(f"Erro no callback de resultado da importação - url: {result.url}")
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(prog="python -m core.import_pipeline",
+                                     description="Importa músicas do Letras.mus.br a partir de uma lista de URLs")
+    parser.add_argument("file", type=Path, help="Arquivo com as URLs (uma por linha)")
+    parser.add_argument("--fetch-workers", type=int, default=ImportPipeline.FETCH_WORKERS)
+    parser.add_argument("--parse-workers", type=int, default=ImportPipeline.PARSE_WORKERS)
+    parser.add_argument("--rate", type=float, default=ImportPipeline.RATE_PER_SECOND_PER_HOST,
+                        help="Requisições por segundo ao site")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    from core.music_manager import MusicManager
+    from core.services.letras_scraper import LetrasScraper
+    urls = split_url_list(args.file.read_text(encoding="utf-8"))
+    pipeline = ImportPipeline(LetrasScraper(), MusicManager(), fetch_workers=args.fetch_workers,
+                              parse_workers=args.parse_workers, rate_per_second=args.rate)
+    report = pipeline.run(urls)
+
+    print(f"{len(report.added)} importada(s), {len(report.duplicates)} já existente(s), "
+          f"{len(report.failed)} falha(s)")
+    for result in report.failed:
+        print(f"  falha: {result.url}: {result.error}", file=sys.stderr)
+    print(f"{'estágio':<10} {'threads':>7} {'itens':>6} {'falhas':>6} {'itens/s':>8} {'ocupado (s)':>11}")
+    for name, stage in pipeline.metrics().items():
+        print(f"{name:<10} {stage['workers']:>7} {stage['processed']:>6} {stage['failed']:>6} "
+              f"{stage['throughput']:>8.2f} {stage['busy_seconds']:>11.2f}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Topologia de monitores em cache.
+
+Consultar os monitores (screeninfo.get_monitors) é uma chamada ao sistema;
+a pré-visualização precisa do tamanho do monitor de projeção a cada
+redimensionamento. Este módulo guarda a lista de monitores em memória e só
+a consulta de novo quando refresh() é chamado (por um temporizador lento ou
+quando a tela pode ter mudado, como ao abrir a projeção).
+
+O monitor de destino pode ser escolhido em config.ini
+([Display] projection_monitor_index, começando em 0); vazio ou inválido,
+usa o segundo monitor, se houver, ou o primeiro.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, FrozenSet, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+MonitorQuery = Callable[[], Sequence[Any]]
+
+
+def _query_screeninfo() -> Sequence[Any]:
+    from screeninfo import get_monitors
+    return get_monitors()
+
+
+class MonitorTopology:
+    """
+    Lista de monitores e monitor de destino da projeção, servidos da memória.
+
+    Attributes:
+        config_manager: ConfigManager com a escolha do monitor (opcional)
+    """
+    # Intervalo sugerido para o temporizador de atualização
+    REFRESH_INTERVAL_SECONDS = 30.0
+    CONFIG_SECTION = 'Display'
+    CONFIG_KEY = 'projection_monitor_index'
+
+    def __init__(self, config_manager: Any = None, query: Optional[MonitorQuery] = None) -> None:
+        self.config_manager = config_manager
+        self._query = query or _query_screeninfo
+        self._monitors: Optional[List[Any]] = None
+        self._configured_index: Optional[int] = None
+        self._lock = threading.Lock()
+        if config_manager is not None:
+            self._configured_index = self._read_configured_index()
+            config_manager.add_change_listener(self._on_config_changed)
+
+    def refresh(self) -> bool:
+        """
+        Consulta os monitores novamente.
+
+        Returns:
+            bool: Se a lista de monitores mudou
+        """
+        try:
+            monitors = list(self._query())
+        except Exception as e:
+            logger.warning(f"Não foi possível consultar os monitores: {e}")
+            monitors = []
+        with self._lock:
+            changed = self._geometry(monitors) != self._geometry(self._monitors or [])
+            self._monitors = monitors
+        if changed:
+            logger.info(f"Monitores detectados: {self._geometry(monitors)}")
+        return changed
+
+    def monitors(self) -> List[Any]:
+        """Monitores conhecidos (consultados apenas na primeira vez)."""
+        if self._monitors is None:
+            self.refresh()
+        return list(self._monitors)
+
+    def target_monitor(self) -> Optional[Any]:
+        """Monitor onde a projeção é aberta (None se nenhum for detectado)."""
+        monitors = self.monitors()
+        if not monitors:
+            return None
+        index = self._configured_index
+        if index is not None and 0 <= index < len(monitors):
+            return monitors[index]
+        return monitors[1] if len(monitors) > 1 else monitors[0]
+
+    def target_size(self) -> Tuple[int, int]:
+        """Largura e altura do monitor de destino ((0, 0) se nenhum for detectado)."""
+        monitor = self.target_monitor()
+        return (monitor.width, monitor.height) if monitor is not None else (0, 0)
+
+    def _read_configured_index(self) -> Optional[int]:
+        value = (self.config_manager.get_setting(self.CONFIG_SECTION, self.CONFIG_KEY, '') or '').strip()
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            logger.warning(f"Índice de monitor inválido em config.ini: '{value}' (usando o automático)")
+            return None
+
+    def _on_config_changed(self, changed: FrozenSet[Tuple[str, str]]) -> None:
+        if (self.CONFIG_SECTION, self.CONFIG_KEY) in changed:
+            self._configured_index = self._read_configured_index()
+
+    @staticmethod
+    def _geometry(monitors: Sequence[Any]) -> List[Tuple[int, int, int, int]]:
+        return [(m.x, m.y, m.width, m.height) for m in monitors]
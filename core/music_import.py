@@ -0,0 +1,292 @@
+"""
+Importação de músicas em lote a partir de URLs do Letras.mus.br.
+
+As páginas são baixadas por um pool de threads de tamanho limitado, com
+limite de taxa por host para não sobrecarregar o site. Cada resultado é
+entregue ao chamador assim que fica pronto (para exibir o andamento), e as
+músicas obtidas são deduplicadas e gravadas com uma única escrita do banco
+de dados (MusicManager.add_music_batch).
+
+A busca (fetch_all) e a gravação (commit) são etapas separadas para que a
+interface possa buscar em segundo plano e gravar na thread do Tk, que é a
+única a alterar o MusicManager.
+
+ArtistCatalogImporter importa o catálogo completo de um artista: lista as
+músicas da página do artista, pula as que a biblioteca já tem antes de
+baixá-las e grava as novas em pequenos lotes, à medida que chegam.
+"""
+
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.exceptions import ScraperError, ValidationError
+from core.services.letras_scraper import normalize_song_url
+from core.utils.rate_limiter import HostRateLimiter
+from core.validators import validate_url
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImportItemResult:
+    """
+    Resultado da importação de uma URL.
+
+    Attributes:
+        url: URL normalizada (ou o texto original, se inválido)
+        music_data: Dict com 'title', 'artist' e 'lyrics_full' (ou None)
+        error: Erro da validação ou da busca (ou None)
+    """
+    url: str
+    music_data: Optional[Dict[str, str]] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and bool(self.music_data)
+
+
+@dataclass
+class BatchImportReport:
+    """
+    Resumo de uma importação em lote.
+
+    Attributes:
+        results: Resultado de cada URL, na ordem recebida
+        added: Músicas gravadas no banco de dados
+        duplicates: Músicas obtidas que já existiam (ou repetidas no lote)
+        cancelled: Se a importação foi cancelada antes do fim
+    """
+    results: List[ImportItemResult] = field(default_factory=list)
+    added: List[Dict[str, Any]] = field(default_factory=list)
+    duplicates: List[Dict[str, str]] = field(default_factory=list)
+    cancelled: bool = False
+
+    @property
+    def failed(self) -> List[ImportItemResult]:
+        return [result for result in self.results if result.error is not None]
+
+
+ResultCallback = Callable[[ImportItemResult], None]
+
+
+def split_url_list(text: str) -> List[str]:
+    """Separa as URLs de um texto colado (uma por linha, ou separadas por espaços/vírgulas)."""
+    return [item for item in re.split(r"[\s,;]+", text) if item]
+
+
+def prepare_song_urls(urls: Iterable[str], allowed_domains: List[str]) -> Tuple[List[str], List[ImportItemResult]]:
+    """
+    Valida, normaliza e remove URLs repetidas.
+
+    Returns:
+        Tuple com as URLs válidas (sem repetição, na ordem recebida) e os
+        resultados de erro das inválidas
+    """
+    valid: List[str] = []
+    invalid: List[ImportItemResult] = []
+    seen = set()
+    for url in urls:
+        try:
+            normalized = normalize_song_url(validate_url(url.strip(), allowed_domains=allowed_domains))
+        except ValidationError as e:
+            invalid.append(ImportItemResult(url, error=e))
+            continue
+        if normalized not in seen:
+            seen.add(normalized)
+            valid.append(normalized)
+    return valid, invalid
+
+
+class BatchImporter:
+    """
+    Importa várias músicas a partir de uma lista de URLs.
+
+    Attributes:
+        scraper: LetrasScraper usado para baixar e extrair as letras
+        manager: MusicManager que recebe as músicas
+        max_workers: Páginas baixadas simultaneamente
+        rate_limiter: Limite de requisições por segundo, por host
+    """
+    MAX_WORKERS = 4
+    RATE_PER_SECOND_PER_HOST = 2.0
+    ALLOWED_DOMAINS = ['letras.mus.br']
+
+    def __init__(self, scraper: Any, music_manager: Any, max_workers: Optional[int] = None,
+                 rate_per_second: Optional[float] = None) -> None:
+        self.scraper = scraper
+        self.manager = music_manager
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.rate_limiter = HostRateLimiter(rate_per_second or self.RATE_PER_SECOND_PER_HOST)
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Interrompe a importação; as páginas já obtidas ainda podem ser gravadas."""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def prepare_urls(self, urls: Iterable[str]) -> Tuple[List[str], List[ImportItemResult]]:
+        """Valida, normaliza e remove URLs repetidas (ver prepare_song_urls)."""
+        return prepare_song_urls(urls, self.ALLOWED_DOMAINS)
+
+    def fetch_all(self, urls: Iterable[str], on_result: Optional[ResultCallback] = None) -> List[ImportItemResult]:
+        """
+        Baixa e extrai as letras das URLs em paralelo.
+
+        Args:
+            urls: URLs das músicas
+            on_result: Chamado com cada ImportItemResult assim que fica pronto
+                       (na thread que chamou fetch_all)
+
+        Returns:
+            List[ImportItemResult]: Resultados na ordem das URLs (inválidas primeiro);
+            URLs não buscadas por cancelamento ficam de fora
+        """
+        valid, results = self.prepare_urls(urls)
+        for result in results:
+            self._notify(on_result, result)
+
+        fetched: Dict[str, ImportItemResult] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="music-import") as executor:
+            futures = [executor.submit(self._fetch, url) for url in valid]
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                result = future.result()
+                fetched[result.url] = result
+                self._notify(on_result, result)
+                if self.cancelled:
+                    for pending in futures:
+                        pending.cancel()
+        results.extend(fetched[url] for url in valid if url in fetched)
+        return results
+
+    def commit(self, results: Iterable[ImportItemResult]) -> BatchImportReport:
+        """
+        Grava as músicas obtidas que ainda não existem, com uma única escrita.
+
+        Raises:
+            MusicDatabaseError: Se a gravação falhar (nenhuma música é adicionada)
+        """
+        report = BatchImportReport(results=list(results), cancelled=self.cancelled)
+        songs = []
+        seen = set()
+        for result in report.results:
+            if not result.ok:
+                continue
+            data = result.music_data
+            key = (data["title"].lower().strip(), data["artist"].lower().strip())
+            if key in seen or self.manager.is_duplicate(data["title"], data["artist"]):
+                report.duplicates.append(data)
+                continue
+            seen.add(key)
+            songs.append(data)
+        report.added = self.manager.add_music_batch(songs)
+        logger.info(
+            f"Importação em lote concluída - adicionadas: {len(report.added)}, "
+            f"duplicadas: {len(report.duplicates)}, falhas: {len(report.failed)}"
+        )
+        return report
+
+    def run(self, urls: Iterable[str], on_result: Optional[ResultCallback] = None) -> BatchImportReport:
+        """Busca todas as URLs e grava o resultado (uso fora da interface)."""
+        return self.commit(self.fetch_all(urls, on_result))
+
+    def _fetch(self, url: str) -> ImportItemResult:
+        if self.cancelled:
+            return ImportItemResult(url, error=ScraperError("Importação cancelada"))
+        self.rate_limiter.acquire(url)
+        try:
+            return ImportItemResult(url, music_data=self.scraper.fetch_lyrics_from_url(url))
+        except (ScraperError, ValidationError) as e:
+            logger.warning(f"Falha ao importar música - url: {url}, erro: {e}")
+            return ImportItemResult(url, error=e)
+        except Exception as e:
+            logger.error(f"Erro inesperado ao importar música - url: {url}", exc_info=True)
+            return ImportItemResult(url, error=e)
+
+    @staticmethod
+    def _notify(on_result: Optional[ResultCallback], result: ImportItemResult) -> None:
+        if on_result is not None:
+            on_result(result)
+
+
+class ArtistCatalogImporter(BatchImporter):
+    """
+    Importa o catálogo completo de um artista a partir da página dele.
+
+    As músicas que o MusicManager já conhece (pelo título do link e nome do
+    artista) são puladas antes de qualquer download. As demais são baixadas
+    como no BatchImporter e entram na biblioteca em pequenos lotes, à medida
+    que chegam.
+    """
+    # Músicas gravadas por escrita do banco de dados ao importar fora da interface
+    COMMIT_BATCH_SIZE = 10
+
+    def list_new_songs(self, artist_url: str) -> Tuple[Optional[str], List[Dict[str, str]], List[Dict[str, str]]]:
+        """
+        Lista as músicas do artista, separando as que já estão na biblioteca.
+
+        Returns:
+            Tuple com o nome do artista, as músicas a baixar e as já conhecidas
+            (dicts com 'title', 'artist' e 'url')
+
+        Raises:
+            ValidationError, ScraperError: Se a página do artista não puder ser lida
+        """
+        page = self.scraper.fetch_artist_songs(artist_url)
+        artist = page["artist"]
+        new_songs, known = [], []
+        for song in page["songs"]:
+            song = dict(song, artist=artist)
+            if artist and self.manager.is_duplicate(song["title"], artist):
+                known.append(song)
+            else:
+                new_songs.append(song)
+        logger.info(
+            f"Catálogo do artista listado - artista: {artist}, músicas: {len(page['songs'])}, "
+            f"já na biblioteca: {len(known)}"
+        )
+        return artist, new_songs, known
+
+    def run_catalog(self, artist_url: str, on_result: Optional[ResultCallback] = None) -> BatchImportReport:
+        """
+        Importa o catálogo do artista, gravando as músicas em lotes à medida que chegam.
+
+        Args:
+            artist_url: URL da página do artista no Letras.mus.br
+            on_result: Chamado com cada ImportItemResult assim que fica pronto
+
+        Returns:
+            BatchImportReport com todas as músicas gravadas; as já conhecidas
+            aparecem em duplicates
+        """
+        _, new_songs, known = self.list_new_songs(artist_url)
+        report = BatchImportReport(duplicates=list(known))
+        pending: List[ImportItemResult] = []
+
+        def flush() -> None:
+            if pending:
+                partial = self.commit(pending)
+                report.added.extend(partial.added)
+                report.duplicates.extend(partial.duplicates)
+                pending.clear()
+
+        def collect(result: ImportItemResult) -> None:
+            report.results.append(result)
+            pending.append(result)
+            self._notify(on_result, result)
+            if len(pending) >= self.COMMIT_BATCH_SIZE:
+                flush()
+
+        self.fetch_all([song["url"] for song in new_songs], on_result=collect)
+        flush()
+        report.cancelled = self.cancelled
+        return report
@@ -161,6 +161,61 @@ class MusicManager:
                 del self._title_artist_index[key]
             raise
 
+    def add_music_batch(self, songs: List[Dict[str, str]]) -> List[Dict]:
+        """
+        Adiciona várias músicas com uma única gravação do banco de dados.
+        
+        Todas as entradas são validadas antes de qualquer alteração (Fail Fast).
+        Duplicatas não são verificadas aqui: o chamador decide o que importar
+        (ver is_duplicate).
+        
+        Args:
+            songs: Dicts com 'title', 'artist' e 'lyrics_full'
+        
+        Returns:
+            List[Dict]: Músicas adicionadas, na ordem recebida
+        
+        Raises:
+            ValidationError: Se alguma música tiver campos inválidos
+            MusicDatabaseError: Se a gravação falhar (nenhuma música é adicionada)
+        """
+        validated = [
+            (validate_string(song.get("title"), "título", min_length=1),
+             validate_string(song.get("artist"), "artista", min_length=1),
+             validate_string(song.get("lyrics_full"), "letra completa", min_length=1))
+            for song in songs
+        ]
+        if not validated:
+            return []
+        
+        original_length = len(self.music_database)
+        original_title_artist_index = self._title_artist_index.copy()
+        new_songs = []
+        for title, artist, lyrics_full in validated:
+            new_music = {
+                "id": str(uuid.uuid4()),
+                "title": title,
+                "artist": artist,
+                "lyrics_full": lyrics_full,
+                "slides": self._generate_slides_from_lyrics(lyrics_full)
+            }
+            self.music_database.append(new_music)
+            self._music_index[new_music["id"]] = new_music
+            self._title_artist_index[(title.lower().strip(), artist.lower().strip())] = new_music["id"]
+            new_songs.append(new_music)
+        
+        try:
+            self.save_music_db()
+        except MusicDatabaseError:
+            # Desfaz o lote inteiro na memória
+            del self.music_database[original_length:]
+            for music in new_songs:
+                del self._music_index[music["id"]]
+            self._title_artist_index = original_title_artist_index
+            raise
+        logger.info(f"Lote de músicas adicionado - quantidade: {len(new_songs)}")
+        return new_songs
+
     def edit_music(self, song_id: str, new_title: str, new_artist: str, new_lyrics_full: str) -> bool:
         # Fail Fast: Validar entradas no início
         if not song_id:
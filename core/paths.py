@@ -13,4 +13,19 @@ CONFIG_PATH = SOURCE_ROOT / "config.ini"
 
 # Os caminhos para os arquivos de dados agora serão calculados corretamente
 MUSIC_DB_PATH = DATA_DIR / "music_db.json"
-BIBLE_BOOKS_CACHE_PATH = DATA_DIR / "bible_books_cache.json"
\ No newline at end of file
+BIBLE_BOOKS_CACHE_PATH = DATA_DIR / "bible_books_cache.json"
+
+# Catálogo distribuído com o projeto: livros e quantidade de versículos por capítulo
+BIBLE_CATALOG_PATH = DATA_DIR / "bible_catalog.json"
+
+# Cache persistente de capítulos da Bíblia (um arquivo JSON por capítulo)
+BIBLE_CHAPTER_CACHE_DIR = DATA_DIR / "cache" / "bible_chapters"
+
+# Cache das páginas baixadas do Letras.mus.br (HTML bruto, um arquivo por URL)
+LETRAS_PAGE_CACHE_DIR = DATA_DIR / "cache" / "letras_pages"
+
+# Texto bíblico armazenado localmente (um arquivo JSON por capítulo, por versão)
+BIBLE_STORE_DIR = DATA_DIR / "bible"
+
+# Índices de busca textual gerados a partir do texto armazenado (um por versão)
+BIBLE_SEARCH_INDEX_DIR = DATA_DIR / "bible_index"
@@ -1,35 +1,228 @@
+import asyncio
 import requests
 import os
-from typing import Dict, List, Optional, Any
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 import json
 import logging
-from core.exceptions import BibleAPIError
+from core.exceptions import BibleAPIError, BibleAPIUnavailableError
+from core.services.http_session import create_session, backoff_delay, LatencyRecorder
+from core.utils.circuit_breaker import CircuitBreaker
+from core.utils.rate_limiter import RateLimiter
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 class BibleAPIClient:
+    """
+    Cliente HTTP da API da Bíblia Digital.
+    
+    Usa uma sessão com pool de conexões (keep-alive), timeouts explícitos de
+    conexão e leitura, e novas tentativas com backoff exponencial para GETs.
+    Os métodos com prefixo "a" (aget_chapter_verses, aget_book) são corrotinas
+    para buscas em lote concorrentes, limitadas por concorrência e taxa.
+    
+    Um disjuntor suspende as requisições após falhas consecutivas: enquanto
+    aberto, as chamadas levantam BibleAPIUnavailableError sem acessar a rede,
+    e uma sondagem em segundo plano reabre o acesso quando a API responder.
+    
+    Attributes:
+        token: Token de acesso da API (opcional)
+        base_url: URL base da API
+        session: Sessão HTTP compartilhada por todas as requisições
+        latency: Registro de latência por endpoint
+        max_concurrency: Requisições assíncronas simultâneas permitidas
+        rate_limiter: Limitador de taxa das requisições assíncronas
+        circuit_breaker: Disjuntor que suspende as requisições com a API fora do ar
+    """
     BASE_URL = "https://www.abibliadigital.com.br/api"
+    # Timeouts (segundos): conexão curta, leitura tolerante a respostas lentas
+    CONNECT_TIMEOUT = 3.05
+    READ_TIMEOUT = 10
+    # Novas tentativas para GETs (idempotentes)
+    MAX_RETRIES = 3
+    BACKOFF_BASE_SECONDS = 0.5
+    BACKOFF_MAX_SECONDS = 8.0
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    # Conexões simultâneas mantidas no pool (busca + pré-carregamento)
+    POOL_MAXSIZE = 10
+    # Limites padrão das buscas assíncronas em lote
+    ASYNC_MAX_CONCURRENCY = 6
+    ASYNC_RATE_PER_SECOND = 10.0
+    # Disjuntor: falhas consecutivas (após as novas tentativas) e espera até a sondagem
+    CIRCUIT_FAILURE_THRESHOLD = 3
+    CIRCUIT_RECOVERY_SECONDS = 30.0
+    PROBE_ENDPOINT = "/books"
 
-    def __init__(self, token: Optional[str] = None) -> None:
+    def __init__(self, token: Optional[str] = None, base_url: Optional[str] = None,
+                 session: Optional[requests.Session] = None,
+                 max_concurrency: Optional[int] = None,
+                 rate_per_second: Optional[float] = None) -> None:
         self.token: Optional[str] = token or os.getenv("BIBLE_API_TOKEN")
         if not self.token:
             logger.warning("Token da API da Bíblia Digital não configurado. Algumas funcionalidades podem ser limitadas.")
+        self.base_url = base_url or self.BASE_URL
+        self.session = session or create_session(pool_connections=1, pool_maxsize=self.POOL_MAXSIZE)
+        if self.token:
+            self.session.headers["Authorization"] = f"Bearer {self.token}"
+        self.latency = LatencyRecorder()
+        self.max_concurrency = max_concurrency or self.ASYNC_MAX_CONCURRENCY
+        rate = rate_per_second or self.ASYNC_RATE_PER_SECOND
+        self.rate_limiter = RateLimiter(rate, burst=self.max_concurrency)
+        # Semáforos são ligados a um loop de eventos; um por loop em uso
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+        self.circuit_breaker = CircuitBreaker(
+            self.CIRCUIT_FAILURE_THRESHOLD, self.CIRCUIT_RECOVERY_SECONDS, name="API da Bíblia"
+        )
+        self.circuit_breaker.add_listener(self._on_circuit_state_changed)
+        self._probe_timer: Optional[threading.Timer] = None
+
+    @staticmethod
+    def _endpoint_key(endpoint: str) -> str:
+        """Agrupa endpoints parametrizados (ex: '/verses/nvi/gn/1' → '/verses')."""
+        return "/" + endpoint.strip("/").split("/")[0]
+
+    def _get_with_retries(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                          headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Executa um GET com timeouts e novas tentativas para falhas transitórias.
+        
+        Erros de conexão, timeouts e os status de RETRY_STATUS_CODES são
+        repetidos até MAX_RETRIES vezes, com backoff exponencial e jitter.
+        
+        Raises:
+            requests.exceptions.RequestException: Se todas as tentativas falharem
+        """
+        url = f"{self.base_url}{endpoint}"
+        endpoint_key = self._endpoint_key(endpoint)
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self.session.get(
+                    url, params=params, headers=headers, timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT)
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self.latency.record(endpoint_key, time.perf_counter() - started, failed=True)
+                if attempt >= self.MAX_RETRIES:
+                    raise
+                reason = str(e)
+                delay = backoff_delay(attempt, self.BACKOFF_BASE_SECONDS, self.BACKOFF_MAX_SECONDS)
+            else:
+                self.latency.record(endpoint_key, time.perf_counter() - started)
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt >= self.MAX_RETRIES:
+                    return response
+                reason = f"status {response.status_code}"
+                delay = self._retry_after(response) or backoff_delay(
+                    attempt, self.BACKOFF_BASE_SECONDS, self.BACKOFF_MAX_SECONDS
+                )
+            
+            logger.warning(
+                f"Falha transitória na API da Bíblia - endpoint: {endpoint}, motivo: {reason}, "
+                f"nova tentativa {attempt + 1}/{self.MAX_RETRIES} em {delay:.2f}s"
+            )
+            time.sleep(delay)
+            attempt += 1
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Lê o cabeçalho Retry-After (em segundos), limitado a BACKOFF_MAX_SECONDS."""
+        value = response.headers.get("Retry-After")
+        try:
+            return min(float(value), self.BACKOFF_MAX_SECONDS) if value else None
+        except ValueError:
+            return None
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """Retorna as estatísticas de latência por endpoint."""
+        return self.latency.stats()
+
+    def is_available(self) -> bool:
+        """Indica se as requisições estão liberadas (disjuntor fechado)."""
+        return self.circuit_breaker.allow_request()
+
+    def _on_circuit_state_changed(self, state: str) -> None:
+        if state == CircuitBreaker.OPEN:
+            self._schedule_probe()
+
+    def _schedule_probe(self) -> None:
+        """Agenda a sondagem da API para quando o tempo de recuperação terminar."""
+        if self._probe_timer is not None:
+            self._probe_timer.cancel()
+        self._probe_timer = threading.Timer(self.circuit_breaker.seconds_until_probe(), self._probe)
+        self._probe_timer.daemon = True
+        self._probe_timer.start()
+
+    def _probe(self) -> None:
+        """Testa a API com uma única requisição, sem novas tentativas."""
+        if not self.circuit_breaker.begin_probe():
+            return
+        try:
+            response = self.session.get(
+                f"{self.base_url}{self.PROBE_ENDPOINT}", timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT)
+            )
+            available = response.status_code < 500
+        except requests.exceptions.RequestException:
+            available = False
+        if available:
+            self.circuit_breaker.record_success()
+        else:
+            # Reabre o disjuntor, o que agenda a próxima sondagem
+            self.circuit_breaker.record_failure()
 
     def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        headers = {}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
+        data, _ = self._make_conditional_request(endpoint, params=params)
+        return data
+
+    def _make_conditional_request(self, endpoint: str, validators: Optional[Dict[str, Optional[str]]] = None,
+                                  params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Dict[str, Optional[str]]]:
+        """
+        Executa um GET condicional (If-None-Match / If-Modified-Since).
+        
+        Args:
+            endpoint: Caminho do endpoint
+            validators: Validadores de uma resposta anterior ('etag', 'last_modified')
+            params: Parâmetros da query string
         
+        Returns:
+            Tupla (dados ou None se a resposta for 304 Not Modified, validadores atuais)
+        
+        Raises:
+            BibleAPIError: Em falhas de rede, status de erro ou JSON inválido
+        """
+        validators = validators or {}
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        if not self.circuit_breaker.allow_request():
+            raise BibleAPIUnavailableError(
+                f"API da Bíblia indisponível no momento; nova tentativa em "
+                f"{self.circuit_breaker.seconds_until_probe():.0f}s"
+            )
         response = None
         try:
-            response = requests.get(f"{self.BASE_URL}{endpoint}", headers=headers, params=params)
+            response = self._get_with_retries(endpoint, params, headers or None)
             response.raise_for_status()
-            return response.json()
+            self.circuit_breaker.record_success()
+            current = {
+                "etag": response.headers.get("ETag") or validators.get("etag"),
+                "last_modified": response.headers.get("Last-Modified") or validators.get("last_modified"),
+            }
+            if response.status_code == 304:
+                return None, current
+            return response.json(), current
         except requests.exceptions.RequestException as e:
             status_code = response.status_code if response is not None else None
+            # Erros 4xx indicam que a API respondeu; só falhas de rede e 5xx contam para o disjuntor
+            if status_code is None or status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
             logger.error(
                 f"Erro na API da Bíblia - endpoint: {endpoint}, params: {params}, status: {status_code}",
                 exc_info=True
@@ -52,15 +245,94 @@ class BibleAPIClient:
 
     def get_books(self, version_abbrev: str = "nvi") -> List[Dict[str, Any]]:
         data = self._make_request("/books")
+        return self._parse_books(data)
+
+    @staticmethod
+    def _parse_books(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         return [{"abbrev": book.get("abbrev", {}).get("pt", book.get("name").lower()[:3]), 
                  "name": book.get("name"),
                  "chapters": book.get("chapters"),
                  "testament": book.get("testament")} 
                 for book in data]
 
+    def get_books_if_modified(self, validators: Optional[Dict[str, Optional[str]]] = None
+                              ) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, Optional[str]]]:
+        """
+        Revalida a lista de livros com um GET condicional.
+        
+        Returns:
+            Tupla (livros ou None se não mudaram, validadores atuais)
+        """
+        data, current = self._make_conditional_request("/books", validators)
+        return (self._parse_books(data) if data is not None else None), current
+
     def get_chapter_verses(self, version_abbrev: str, book_abbrev: str, chapter_number: int) -> List[Dict[str, Any]]:
         endpoint = f"/verses/{version_abbrev}/{book_abbrev}/{chapter_number}"
         data = self._make_request(endpoint)
+        return self._parse_verses(data)
+
+    @staticmethod
+    def _parse_verses(data: Any) -> List[Dict[str, Any]]:
         if data and "verses" in data:
             return data["verses"]
-        return []
\ No newline at end of file
+        return []
+
+    def get_chapter_verses_if_modified(self, version_abbrev: str, book_abbrev: str, chapter_number: int,
+                                       validators: Optional[Dict[str, Optional[str]]] = None
+                                       ) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, Optional[str]]]:
+        """
+        Revalida um capítulo com um GET condicional.
+        
+        Returns:
+            Tupla (versículos ou None se não mudaram, validadores atuais)
+        """
+        endpoint = f"/verses/{version_abbrev}/{book_abbrev}/{chapter_number}"
+        data, current = self._make_conditional_request(endpoint, validators)
+        return (self._parse_verses(data) if data is not None else None), current
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def aget_chapter_verses(self, version_abbrev: str, book_abbrev: str, chapter_number: int) -> List[Dict[str, Any]]:
+        """
+        Versão assíncrona de get_chapter_verses.
+        
+        A requisição HTTP é executada em uma thread do executor padrão (a
+        sessão requests é síncrona), respeitando o limite de concorrência e
+        o limitador de taxa do cliente.
+        """
+        async with self._get_semaphore():
+            await self.rate_limiter.aacquire()
+            return await asyncio.to_thread(self.get_chapter_verses, version_abbrev, book_abbrev, chapter_number)
+
+    async def aget_book(self, version_abbrev: str, book_abbrev: str, num_chapters: int) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Busca todos os capítulos de um livro de forma concorrente.
+        
+        Args:
+            version_abbrev: Abreviação da versão
+            book_abbrev: Abreviação do livro
+            num_chapters: Quantidade de capítulos do livro
+        
+        Returns:
+            Dict mapeando número do capítulo → lista de versículos
+        
+        Raises:
+            BibleAPIError: Se algum capítulo não puder ser obtido
+        """
+        chapters = list(range(1, num_chapters + 1))
+        results = await asyncio.gather(
+            *(self.aget_chapter_verses(version_abbrev, book_abbrev, chapter) for chapter in chapters),
+            return_exceptions=True
+        )
+        failed = [chapter for chapter, result in zip(chapters, results) if isinstance(result, BaseException)]
+        if failed:
+            raise BibleAPIError(
+                f"Não foi possível obter os capítulos {failed} de {book_abbrev} ({version_abbrev})"
+            )
+        return dict(zip(chapters, results))
@@ -0,0 +1,95 @@
+"""
+Utilitários HTTP compartilhados pelos serviços externos.
+
+Este módulo centraliza a criação de sessões HTTP com pool de conexões
+(keep-alive), o cálculo de espera entre tentativas e o registro de
+latência por endpoint, usados pelos clientes da API da Bíblia e do
+Letras.mus.br.
+"""
+
+import random
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_connections: int = 4, pool_maxsize: int = 10,
+                   headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Cria uma sessão HTTP com pool de conexões reutilizáveis.
+
+    A sessão mantém as conexões TCP/TLS abertas entre requisições (keep-alive),
+    evitando um novo handshake a cada chamada. Novas tentativas são feitas
+    pelo chamador, por isso o adaptador não repete requisições sozinho.
+    As respostas comprimidas são negociadas pelo requests: gzip e deflate
+    sempre, e brotli quando o pacote brotli estiver instalado.
+
+    Args:
+        pool_connections: Número de hosts distintos mantidos no pool
+        pool_maxsize: Conexões simultâneas mantidas por host
+        headers: Cabeçalhos enviados em todas as requisições da sessão
+
+    Returns:
+        requests.Session: Sessão configurada para http e https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Calcula a espera antes de uma nova tentativa (backoff exponencial com jitter).
+
+    Usa "full jitter": um valor aleatório entre 0 e min(cap, base * 2^attempt),
+    o que evita que vários clientes tentem novamente ao mesmo tempo.
+
+    Args:
+        attempt: Número da tentativa que falhou (começando em 0)
+        base: Espera base em segundos
+        cap: Espera máxima em segundos
+
+    Returns:
+        float: Tempo de espera em segundos
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class LatencyRecorder:
+    """
+    Registra a latência das requisições agrupada por endpoint.
+
+    Thread-safe, pois as requisições partem de várias threads de busca.
+    """
+    def __init__(self) -> None:
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float, failed: bool = False) -> None:
+        """Registra a duração de uma requisição ao endpoint."""
+        with self._lock:
+            stats = self._stats.setdefault(
+                endpoint, {"count": 0, "failures": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+            )
+            stats["count"] += 1
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            stats["last"] = seconds
+            if failed:
+                stats["failures"] += 1
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Retorna uma cópia das estatísticas, incluindo a média por endpoint."""
+        with self._lock:
+            result = {}
+            for endpoint, stats in self._stats.items():
+                entry = dict(stats)
+                entry["avg"] = stats["total"] / stats["count"] if stats["count"] else 0.0
+                result[endpoint] = entry
+            return result
@@ -1,21 +1,190 @@
+import argparse
+import importlib.util
 import requests
-from bs4 import BeautifulSoup
-from typing import Optional, List, Dict
+import sys
+import time
+from bs4 import BeautifulSoup, SoupStrainer
+from pathlib import Path
+from typing import Any, Iterable, Optional, List, Dict
+from urllib.parse import urljoin, urlparse, urlunparse
 import re
 import logging
 from core.exceptions import ScraperError, ScraperNetworkError, ScraperParseError, ValidationError
+from core.paths import LETRAS_PAGE_CACHE_DIR
+from core.services.http_session import create_session, LatencyRecorder
+from core.utils.cache import DiskCache
+from core.utils.process_pool import ProcessPool
 from core.validators import validate_url
 
 logger = logging.getLogger(__name__)
 
+# lxml é opcional: quando instalado, constrói a árvore bem mais rápido que o html.parser
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+
+def normalize_song_url(url: str) -> str:
+    """
+    Normaliza a URL de uma música para comparação e cache.
+
+    Remove query string e fragmento, coloca o host em minúsculas e garante a
+    barra final usada pelo Letras.mus.br (".../artista/musica/").
+    """
+    parsed = urlparse(url.strip())
+    path = parsed.path.rstrip("/") + "/"
+    return urlunparse(((parsed.scheme or "https").lower(), parsed.netloc.lower(), path, "", "", ""))
+
+
+def _selector_region_class(selector: str) -> str:
+    """Classe CSS do primeiro elemento do seletor (ex: 'div.title-content h1' → 'title-content')."""
+    return selector.split()[0].split(".", 1)[1]
+
+
 class LetrasScraper:
+    """
+    Extrai título, artista e letra de páginas do Letras.mus.br.
+    
+    Todas as requisições passam por uma sessão com pool de conexões
+    (keep-alive), de modo que importar várias músicas em sequência reutiliza
+    a mesma conexão TLS. A latência de cada página é registrada para
+    diagnóstico (ver get_latency_stats).
+    
+    A análise do HTML considera apenas as regiões do título, do artista e da
+    letra (SoupStrainer), ignorando menus, anúncios e scripts, e usa o lxml
+    quando disponível. Se a estrutura do site mudar e a letra não for
+    encontrada, a página inteira é analisada antes de desistir.
+    
+    As páginas baixadas ficam em um cache em disco (HTML bruto, arquivo
+    nomeado pelo hash da URL normalizada, com limite de tamanho e despejo
+    das menos usadas). Reimportar ou tentar de novo após uma falha de
+    análise não acessa a rede; passado o TTL, a página é revalidada com GET
+    condicional, e a cópia em cache é usada se o site estiver inacessível.
+    
+    Attributes:
+        session: Sessão HTTP compartilhada por todas as requisições
+        latency: Registro de latência das requisições
+        page_cache: Cache em disco das páginas baixadas (None desativa)
+    """
     BASE_URL_SEARCH = "https://www.letras.mus.br"
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    # Timeouts (segundos): conexão curta, leitura tolerante a páginas pesadas
+    CONNECT_TIMEOUT = 3.05
+    READ_TIMEOUT = 15
+    # Conexões simultâneas mantidas no pool (importação em lote)
+    POOL_MAXSIZE = 4
+    LATENCY_KEY = "/letra"
+    # Cache de páginas: letras raramente mudam; vencidas, são revalidadas
+    PAGE_CACHE_MAX_BYTES = 100 * 1024 * 1024
+    PAGE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
     
     # --- SELETORES ATUALIZADOS ---
     # Colocamos os seletores mais recentes e específicos no início da lista.
     TITLE_SELECTORS: List[str] = ['div.title-content h1.textStyle-primary', 'h1.textStyle-primary', 'div.cnt-head_title h1']
     ARTIST_SELECTORS: List[str] = ['div.title-content h2.textStyle-secondary', 'div.song-title a', 'h2.textStyle-secondary a', 'div.cnt-head_title h2 a']
     LYRICS_CONTAINER_SELECTORS: List[str] = ['div.lyric-original', 'div.cnt-letra', 'div.歌詞', 'div.lyric-cnt', 'div.js-lyric-cnt']
+    # Página do artista: nome e links para as músicas
+    ARTIST_PAGE_NAME_SELECTORS: List[str] = ['div.title-content h1.textStyle-primary', 'div.cnt-head_title h1', 'h1']
+    ARTIST_SONG_LINK_SELECTORS: List[str] = ['a.songList-table-songName', 'li.songList-table-row a', 'ul.cnt-list li a']
+    # Subpáginas do artista que não são músicas
+    ARTIST_NON_SONG_PATHS = frozenset({'discografia', 'fotos', 'videos', 'biografia', 'mais-acessadas', 'traducoes'})
+    # Regiões da página mantidas na análise: a primeira classe de cada seletor acima
+    REGION_CLASSES: List[str] = sorted({
+        _selector_region_class(selector)
+        for selector in TITLE_SELECTORS + ARTIST_SELECTORS + LYRICS_CONTAINER_SELECTORS
+    })
+
+    _DEFAULT_CACHE: Any = object()
+
+    def __init__(self, session: Optional[requests.Session] = None,
+                 page_cache: Optional[DiskCache] = _DEFAULT_CACHE,
+                 cpu_pool: Optional[ProcessPool] = None) -> None:
+        self.session = session or create_session(
+            pool_connections=1, pool_maxsize=self.POOL_MAXSIZE, headers={'User-Agent': self.USER_AGENT}
+        )
+        self.latency = LatencyRecorder()
+        if page_cache is self._DEFAULT_CACHE:
+            page_cache = DiskCache(
+                Path(LETRAS_PAGE_CACHE_DIR),
+                max_bytes=self.PAGE_CACHE_MAX_BYTES,
+                ttl_seconds=self.PAGE_CACHE_TTL_SECONDS,
+            )
+        self.page_cache = page_cache
+        self.cpu_pool = cpu_pool
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """Retorna as estatísticas de latência das requisições."""
+        return self.latency.stats()
+
+    def close(self) -> None:
+        """Fecha as conexões mantidas no pool."""
+        self.session.close()
+
+    def _get_page(self, song_url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Baixa a página pela sessão compartilhada, registrando a latência."""
+        started = time.perf_counter()
+        try:
+            response = self.session.get(song_url, headers=headers, timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT))
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            self.latency.record(self.LATENCY_KEY, time.perf_counter() - started, failed=True)
+            raise
+        elapsed = time.perf_counter() - started
+        self.latency.record(self.LATENCY_KEY, elapsed)
+        logger.debug(f"Página de letra obtida - url: {song_url}, tempo: {elapsed:.3f}s")
+        return response
+
+    def get_page_html(self, song_url: str) -> str:
+        """
+        Retorna o HTML da página, do cache quando possível.
+        
+        Entradas vencidas são revalidadas (If-None-Match/If-Modified-Since);
+        se a revalidação falhar por erro de rede, a cópia em cache é usada.
+        
+        Raises:
+            requests.exceptions.RequestException: Se a página não estiver em cache e a busca falhar
+        """
+        key = normalize_song_url(song_url)
+        entry = self.page_cache.get_entry(key) if self.page_cache is not None else None
+        if entry is not None and not entry.stale:
+            return entry.value
+        
+        headers = {}
+        validators = (entry.metadata or {}) if entry is not None else {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        try:
+            response = self._get_page(song_url, headers=headers or None)
+        except requests.exceptions.RequestException as e:
+            if entry is None:
+                raise
+            logger.warning(f"Revalidação falhou, usando página em cache - url: {song_url}, erro: {e}")
+            return entry.value
+        
+        if response.status_code == 304 and entry is not None:
+            self.page_cache.refresh(key)
+            return entry.value
+        if self.page_cache is not None:
+            self.page_cache.set(key, response.text, {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            })
+        return response.text
+
+    def parse_cached_page(self, song_url: str) -> Optional[Dict[str, str]]:
+        """
+        Analisa a cópia em cache da página, sem acessar a rede.
+        
+        Útil para repetir a extração depois de ajustar os seletores.
+        
+        Returns:
+            Dict com 'title', 'artist' e 'lyrics_full', ou None se a página não estiver em cache
+        
+        Raises:
+            ScraperParseError: Se a letra não for encontrada
+        """
+        entry = self.page_cache.get_entry(normalize_song_url(song_url)) if self.page_cache is not None else None
+        return self.parse_page(entry.value, song_url) if entry is not None else None
 
     def _find_element_text(self, soup: BeautifulSoup, selectors: List[str]) -> Optional[str]:
         """Tenta encontrar um elemento usando uma lista de seletores e retorna seu texto."""
@@ -63,33 +232,118 @@ class LetrasScraper:
 
         return re.sub(r'(\n\s*){3,}', '\n\n', full_lyrics.strip())
 
+    def _parse_regions(self, html: str) -> BeautifulSoup:
+        """Analisa apenas as regiões do título, do artista e da letra."""
+        return BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer(class_=self.REGION_CLASSES))
+
+    def parse_page(self, html: str, song_url: str = "") -> Dict[str, str]:
+        """
+        Extrai título, artista e letra do HTML de uma página de música.
+        
+        Não acessa a rede: pode ser usado com páginas salvas.
+        
+        Args:
+            html: Conteúdo da página
+            song_url: URL de origem (usada apenas nas mensagens)
+        
+        Returns:
+            Dict com 'title', 'artist' e 'lyrics_full'
+        
+        Raises:
+            ScraperParseError: Se a letra não for encontrada
+        """
+        if self.cpu_pool is not None:
+            return self.cpu_pool.run(parse_lyrics_html, html, song_url)
+        return self._parse_page_inline(html, song_url)
+
+    def _parse_page_inline(self, html: str, song_url: str = "") -> Dict[str, str]:
+        soup = self._parse_regions(html)
+        lyrics_container = self._find_element_container(soup, self.LYRICS_CONTAINER_SELECTORS)
+        if lyrics_container is None:
+            # Estrutura desconhecida: tenta a página inteira antes de desistir
+            logger.debug(f"Regiões conhecidas não encontradas, analisando a página inteira - url: {song_url}")
+            soup = BeautifulSoup(html, HTML_PARSER)
+            lyrics_container = self._find_element_container(soup, self.LYRICS_CONTAINER_SELECTORS)
+        
+        title = self._find_element_text(soup, self.TITLE_SELECTORS) or "Título Desconhecido"
+        artist = self._find_element_text(soup, self.ARTIST_SELECTORS) or "Artista Desconhecido"
+
+        if lyrics_container:
+            lyrics_text = self._clean_text(lyrics_container)
+        else:
+            logger.warning(f"Scraper não encontrou o container da letra em {song_url}")
+            raise ScraperParseError(f"Não foi possível encontrar o container da letra na URL: {song_url}")
+
+        if lyrics_text and lyrics_text.strip():
+            return {"title": title, "artist": artist, "lyrics_full": lyrics_text.strip()}
+        else:
+            logger.warning(f"Scraper encontrou o container mas não conseguiu extrair a letra em {song_url}")
+            raise ScraperParseError(f"Não foi possível extrair a letra da música na URL: {song_url}")
+
+    def parse_artist_page(self, html: str, artist_url: str) -> Dict[str, Any]:
+        """
+        Extrai o nome do artista e os links das músicas da página do artista.
+        
+        Apenas links para páginas do próprio artista com um nível a mais
+        (/artista/musica/) são considerados, sem repetição e na ordem da página.
+        
+        Returns:
+            Dict com 'artist' (nome ou None) e 'songs' (lista de dicts com 'title' e 'url')
+        
+        Raises:
+            ScraperParseError: Se nenhuma música for encontrada
+        """
+        if self.cpu_pool is not None:
+            return self.cpu_pool.run(parse_artist_html, html, artist_url)
+        return self._parse_artist_page_inline(html, artist_url)
+
+    def _parse_artist_page_inline(self, html: str, artist_url: str) -> Dict[str, Any]:
+        soup = BeautifulSoup(html, HTML_PARSER)
+        artist_path = urlparse(artist_url).path.strip("/").split("/")[0]
+        songs: List[Dict[str, str]] = []
+        seen = set()
+        for selector in self.ARTIST_SONG_LINK_SELECTORS:
+            for link in soup.select(selector):
+                url = normalize_song_url(urljoin(artist_url, link.get('href') or ""))
+                segments = urlparse(url).path.strip("/").split("/")
+                if len(segments) != 2 or segments[0] != artist_path or segments[1] in self.ARTIST_NON_SONG_PATHS:
+                    continue
+                if url not in seen:
+                    seen.add(url)
+                    songs.append({"title": link.get_text(strip=True), "url": url})
+            if songs:
+                break
+        if not songs:
+            logger.warning(f"Scraper não encontrou músicas na página do artista {artist_url}")
+            raise ScraperParseError(f"Não foi possível encontrar a lista de músicas na URL: {artist_url}")
+        return {"artist": self._find_element_text(soup, self.ARTIST_PAGE_NAME_SELECTORS), "songs": songs}
+
+    def fetch_artist_songs(self, artist_url: str) -> Dict[str, Any]:
+        """
+        Lista as músicas de um artista a partir da página dele no Letras.mus.br.
+        
+        Returns:
+            Dict com 'artist' e 'songs' (ver parse_artist_page)
+        
+        Raises:
+            ValidationError: Se a URL for inválida
+            ScraperNetworkError: Se a página não puder ser baixada
+            ScraperParseError: Se nenhuma música for encontrada
+        """
+        artist_url = normalize_song_url(validate_url(artist_url, allowed_domains=['letras.mus.br']))
+        try:
+            html = self.get_page_html(artist_url)
+        except requests.exceptions.RequestException as req_err:
+            logger.error(f"Scraper falhou na requisição para {artist_url}", exc_info=True)
+            raise ScraperNetworkError(f"Erro de rede ao acessar {artist_url}: {req_err}") from req_err
+        return self.parse_artist_page(html, artist_url)
+
     def fetch_lyrics_from_url(self, song_url: str) -> Dict[str, str]:
         # Fail Fast: Validar URL no início
         song_url = validate_url(song_url, allowed_domains=['letras.mus.br'])
         
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-            response = requests.get(song_url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            title = self._find_element_text(soup, self.TITLE_SELECTORS) or "Título Desconhecido"
-            artist = self._find_element_text(soup, self.ARTIST_SELECTORS) or "Artista Desconhecido"
-
-            lyrics_container = self._find_element_container(soup, self.LYRICS_CONTAINER_SELECTORS)
-            
-            if lyrics_container:
-                lyrics_text = self._clean_text(lyrics_container)
-            else:
-                logger.warning(f"Scraper não encontrou o container da letra em {song_url}")
-                raise ScraperParseError(f"Não foi possível encontrar o container da letra na URL: {song_url}")
-
-            if lyrics_text and lyrics_text.strip():
-                return {"title": title, "artist": artist, "lyrics_full": lyrics_text.strip()}
-            else:
-                logger.warning(f"Scraper encontrou o container mas não conseguiu extrair a letra em {song_url}")
-                raise ScraperParseError(f"Não foi possível extrair a letra da música na URL: {song_url}")
+            return self.parse_page(self.get_page_html(song_url), song_url)
 
         except requests.exceptions.RequestException as req_err:
             logger.error(f"Scraper falhou na requisição para {song_url}", exc_info=True)
@@ -99,4 +353,86 @@ class LetrasScraper:
             raise
         except Exception as e:
             logger.error(f"Scraper teve um erro inesperado em {song_url}", exc_info=True)
-            raise ScraperError(f"Erro inesperado ao fazer scraping de {song_url}: {e}") from e
\ No newline at end of file
+            raise ScraperError(f"Erro inesperado ao fazer scraping de {song_url}: {e}") from e
+
+
+_worker_scraper: Optional[LetrasScraper] = None
+
+
+def _get_worker_scraper() -> LetrasScraper:
+    """Scraper sem rede nem cache, reaproveitado entre tarefas do mesmo processo."""
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = LetrasScraper(page_cache=None)
+    return _worker_scraper
+
+
+def parse_lyrics_html(html: str, song_url: str = "") -> Dict[str, str]:
+    """Versão de LetrasScraper.parse_page para executar em um ProcessPool."""
+    return _get_worker_scraper()._parse_page_inline(html, song_url)
+
+
+def parse_artist_html(html: str, artist_url: str) -> Dict[str, Any]:
+    """Versão de LetrasScraper.parse_artist_page para executar em um ProcessPool."""
+    return _get_worker_scraper()._parse_artist_page_inline(html, artist_url)
+
+
+def benchmark_parsing(pages: Iterable[str], repeat: int = 5) -> Dict[str, float]:
+    """
+    Mede o custo médio de análise por página: árvore completa com html.parser
+    (caminho anterior) e análise restrita às regiões da letra (caminho atual).
+    
+    Args:
+        pages: HTML das páginas salvas
+        repeat: Repetições de cada página
+    
+    Returns:
+        Dict com 'pages', 'full_ms' e 'regions_ms' (milissegundos por página)
+    """
+    scraper = LetrasScraper(page_cache=None)
+    pages = list(pages)
+    if not pages:
+        return {"pages": 0, "full_ms": 0.0, "regions_ms": 0.0}
+    
+    def measure(parse) -> float:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for html in pages:
+                parse(html)
+        return (time.perf_counter() - started) * 1000 / (repeat * len(pages))
+    
+    def parse_full(html: str) -> None:
+        soup = BeautifulSoup(html, 'html.parser')
+        scraper._find_element_text(soup, scraper.TITLE_SELECTORS)
+        scraper._find_element_text(soup, scraper.ARTIST_SELECTORS)
+        scraper._clean_text(scraper._find_element_container(soup, scraper.LYRICS_CONTAINER_SELECTORS))
+    
+    def parse_regions(html: str) -> None:
+        try:
+            scraper.parse_page(html)
+        except ScraperParseError:
+            pass
+    
+    return {"pages": len(pages), "full_ms": measure(parse_full), "regions_ms": measure(parse_regions)}
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    """Linha de comando: compara o custo de análise sobre páginas salvas do Letras.mus.br."""
+    parser = argparse.ArgumentParser(prog="python -m core.services.letras_scraper",
+                                     description="Mede o custo de análise de páginas salvas do Letras.mus.br")
+    parser.add_argument("pages", nargs="+", type=Path, help="Arquivos .html salvos")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(list(argv) if argv is not None else None)
+    
+    pages = [path.read_text(encoding="utf-8", errors="replace") for path in args.pages]
+    result = benchmark_parsing(pages, repeat=args.repeat)
+    print(f"Páginas: {result['pages']} (construtor: {HTML_PARSER})")
+    print(f"Árvore completa (html.parser): {result['full_ms']:.2f} ms/página")
+    print(f"Apenas regiões da letra:       {result['regions_ms']:.2f} ms/página")
+    if result['regions_ms']:
+        print(f"Ganho: {result['full_ms'] / result['regions_ms']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
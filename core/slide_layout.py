@@ -0,0 +1,156 @@
+"""
+Layout dos slides da projeção calculado antecipadamente.
+
+Para cada slide, o motor quebra o texto em linhas na largura útil da
+projeção e calcula a caixa do texto e o retângulo de fundo atrás dele. O
+resultado fica em cache, indexado por (texto, fonte, tamanho do canvas), e
+pode ser preparado no tempo ocioso para o slide anterior e o próximo: na
+troca de slide, a janela de projeção só aplica o texto já quebrado e as
+coordenadas prontas, sem medir nada.
+
+As medidas vêm de funções injetadas (no Tk, tkinter.font.Font.measure e
+metrics("linespace")), o que mantém o módulo independente da interface.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
+
+from core.utils.cache import LRUCache
+
+# Mede a largura, em pixels, de um texto em uma fonte
+MeasureFunction = Callable[[Hashable, str], int]
+# Altura, em pixels, de uma linha de uma fonte
+LinespaceFunction = Callable[[Hashable], int]
+Rect = Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class SlideLayout:
+    """
+    Texto de um slide já posicionado no canvas.
+
+    Attributes:
+        text: Texto com as quebras de linha já aplicadas
+        line_count: Quantidade de linhas
+        text_bbox: Caixa do texto centralizado (x1, y1, x2, y2)
+        background_rect: Retângulo de fundo (caixa do texto com margem), ou
+                         None se não houver texto
+    """
+    text: str
+    line_count: int
+    text_bbox: Rect
+    background_rect: Optional[Rect]
+
+
+def text_background(layout: SlideLayout, profile: Any) -> Optional[Tuple[Rect, str]]:
+    """
+    Retângulo e padrão de stipple do fundo atrás do texto.
+
+    Args:
+        layout: Layout do slide exibido
+        profile: StyleProfile aplicado
+
+    Returns:
+        Tuple (retângulo, stipple), ou None se o fundo deve ficar oculto
+        (slide vazio, fundo desativado ou opacidade nula)
+    """
+    stipple = profile.text_bg_stipple
+    if layout.background_rect is None or stipple is None:
+        return None
+    return layout.background_rect, stipple
+
+
+class SlideLayoutEngine:
+    """
+    Calcula e guarda o layout dos slides.
+
+    Attributes:
+        measure: Função que mede a largura de um texto em uma fonte
+        linespace: Função que retorna a altura de linha de uma fonte
+    """
+    # Fração da largura do canvas usada pelo texto
+    WRAP_RATIO = 0.9
+    # Margem do retângulo de fundo em volta do texto
+    BACKGROUND_PADDING = 20
+    MAX_ENTRIES = 64
+
+    def __init__(self, measure: MeasureFunction, linespace: LinespaceFunction,
+                 max_entries: Optional[int] = None) -> None:
+        self.measure = measure
+        self.linespace = linespace
+        self._cache = LRUCache(max_entries or self.MAX_ENTRIES)
+
+    @classmethod
+    def wrap_width(cls, canvas_width: int) -> int:
+        return int(canvas_width * cls.WRAP_RATIO)
+
+    def layout(self, text: str, font: Hashable, canvas_size: Tuple[int, int]) -> SlideLayout:
+        """Retorna o layout do texto (do cache, se já calculado)."""
+        key = (text, font, tuple(canvas_size))
+        layout = self._cache.get(key)
+        if layout is None:
+            layout = self._compute(text, font, canvas_size)
+            self._cache.set(key, layout)
+        return layout
+
+    def prepare(self, texts: Iterable[str], font: Hashable, canvas_size: Tuple[int, int]) -> None:
+        """Calcula antecipadamente o layout de vários slides (ex: anterior e próximo)."""
+        for text in texts:
+            self.layout(text, font, canvas_size)
+
+    def is_prepared(self, text: str, font: Hashable, canvas_size: Tuple[int, int]) -> bool:
+        return self._cache.peek((text, font, tuple(canvas_size))) is not None
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _compute(self, text: str, font: Hashable, canvas_size: Tuple[int, int]) -> SlideLayout:
+        width, height = canvas_size
+        lines = self.wrap(text, font, self.wrap_width(width)) if text else []
+        center_x, center_y = width / 2, height / 2
+        if not lines:
+            return SlideLayout("", 0, (center_x, center_y, center_x, center_y), None)
+        text_width = max(self.measure(font, line) for line in lines)
+        text_height = self.linespace(font) * len(lines)
+        bbox = (center_x - text_width / 2, center_y - text_height / 2,
+                center_x + text_width / 2, center_y + text_height / 2)
+        padding = self.BACKGROUND_PADDING
+        background = (bbox[0] - padding, bbox[1] - padding, bbox[2] + padding, bbox[3] + padding)
+        return SlideLayout("\n".join(lines), len(lines), bbox, background)
+
+    def wrap(self, text: str, font: Hashable, max_width: int) -> List[str]:
+        """
+        Quebra o texto em linhas de até max_width pixels, como o canvas do Tk.
+
+        Quebras de linha do texto são mantidas; as linhas são quebradas nos
+        espaços, e palavras mais largas que a linha são quebradas por caractere.
+        """
+        lines: List[str] = []
+        for paragraph in text.split("\n"):
+            current = ""
+            for word in paragraph.split():
+                candidate = f"{current} {word}" if current else word
+                if self.measure(font, candidate) <= max_width:
+                    current = candidate
+                    continue
+                if current:
+                    lines.append(current)
+                current = ""
+                for piece in self._split_long_word(word, font, max_width):
+                    if current:
+                        lines.append(current)
+                    current = piece
+            lines.append(current)
+        return lines
+
+    def _split_long_word(self, word: str, font: Hashable, max_width: int) -> List[str]:
+        if self.measure(font, word) <= max_width:
+            return [word]
+        pieces, current = [], ""
+        for char in word:
+            if current and self.measure(font, current + char) > max_width:
+                pieces.append(current)
+                current = ""
+            current += char
+        pieces.append(current)
+        return pieces
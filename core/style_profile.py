@@ -0,0 +1,159 @@
+"""
+Perfis de estilo da projeção por tipo de conteúdo.
+
+Cada perfil reúne, já convertidos para os tipos usados pela interface, o
+tamanho e a cor da fonte, a cor de fundo, o fundo atrás do texto e a
+animação de um tipo de conteúdo (música, Bíblia ou texto). Os perfis são
+lidos do ConfigManager uma única vez e reaproveitados em cada troca de
+slide e redimensionamento; o cache é descartado apenas quando alguma
+configuração muda.
+"""
+
+import threading
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+NO_ANIMATION = 'Nenhuma'
+
+# Seção do config.ini de cada tipo de conteúdo
+CONTENT_SECTIONS = {
+    'music': 'Projection_Music',
+    'bible': 'Projection_Bible',
+    'text': 'Projection_Text',
+}
+
+_TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+
+def section_for(content_type: Optional[str]) -> str:
+    """Seção do config.ini com o estilo do tipo de conteúdo (música, se desconhecido)."""
+    return CONTENT_SECTIONS.get(content_type, CONTENT_SECTIONS['music'])
+
+
+@dataclass(frozen=True)
+class StyleProfile:
+    """
+    Estilo (imutável) da projeção de um tipo de conteúdo.
+
+    Attributes:
+        content_type: 'music', 'bible' ou 'text'
+        font_size: Tamanho da fonte na projeção
+        font_color: Cor do texto
+        bg_color: Cor de fundo
+        text_bg_enabled: Se o retângulo atrás do texto está ativado
+        text_bg_opacity: Opacidade do retângulo (0 a 1)
+        animation_type: Nome da animação de fundo ('Nenhuma' para nenhuma)
+    """
+    FONT_FAMILY = 'Arial'
+
+    content_type: str
+    font_size: int = 60
+    font_color: str = 'white'
+    bg_color: str = 'black'
+    text_bg_enabled: bool = True
+    text_bg_opacity: float = 0.75
+    animation_type: str = NO_ANIMATION
+
+    @property
+    def font(self) -> Tuple[str, int, str]:
+        """Fonte do texto da projeção, no formato do Tk."""
+        return (self.FONT_FAMILY, self.font_size, 'bold')
+
+    @property
+    def text_bg_visible(self) -> bool:
+        return self.text_bg_enabled and self.text_bg_opacity > 0.01
+
+    @property
+    def text_bg_stipple(self) -> Optional[str]:
+        """Padrão de stipple que aproxima a opacidade do fundo (None se oculto)."""
+        if not self.text_bg_visible:
+            return None
+        if self.text_bg_opacity >= 0.85:
+            return 'gray75'
+        if self.text_bg_opacity >= 0.6:
+            return 'gray50'
+        if self.text_bg_opacity >= 0.35:
+            return 'gray25'
+        return 'gray12'
+
+    @property
+    def has_animation(self) -> bool:
+        return self.animation_type != NO_ANIMATION
+
+    def changed_fields(self, previous: Optional["StyleProfile"]) -> FrozenSet[str]:
+        """
+        Campos de estilo com valor diferente do perfil anterior.
+
+        Permite aplicar na interface apenas o que mudou; sem perfil anterior,
+        todos os campos são considerados alterados.
+        """
+        names = [f.name for f in fields(self) if f.name != 'content_type']
+        if previous is None:
+            return frozenset(names)
+        return frozenset(name for name in names if getattr(self, name) != getattr(previous, name))
+
+    @classmethod
+    def from_config(cls, config_manager: Any, content_type: str) -> "StyleProfile":
+        """Lê e converte o estilo de um tipo de conteúdo (valores inválidos usam o padrão)."""
+        section = section_for(content_type)
+        defaults = cls(content_type)
+        enabled = config_manager.get_setting(section, 'text_bg_enabled', 'true')
+        try:
+            opacity = float(config_manager.get_setting(section, 'text_bg_opacity', '0.75'))
+        except (TypeError, ValueError):
+            opacity = defaults.text_bg_opacity
+        return cls(
+            content_type=content_type,
+            font_size=config_manager.get_int_setting(section, 'font_size', defaults.font_size),
+            font_color=config_manager.get_setting(section, 'font_color', defaults.font_color),
+            bg_color=config_manager.get_setting(section, 'bg_color', defaults.bg_color),
+            text_bg_enabled=str(enabled).strip().lower() in _TRUE_VALUES,
+            text_bg_opacity=min(1.0, max(0.0, opacity)),
+        )
+
+
+class StyleProfileCache:
+    """
+    Perfis de estilo prontos, por tipo de conteúdo e animação.
+
+    Registra-se como listener do ConfigManager e descarta os perfis das
+    seções alteradas; até lá, get() não consulta as configurações.
+    """
+
+    def __init__(self, config_manager: Any) -> None:
+        self.config_manager = config_manager
+        self._profiles: Dict[Tuple[str, str], StyleProfile] = {}
+        self._lock = threading.Lock()
+        config_manager.add_change_listener(self.invalidate)
+
+    def get(self, content_type: str, animation_type: Optional[str] = None) -> StyleProfile:
+        """
+        Retorna o perfil do tipo de conteúdo.
+
+        Args:
+            content_type: 'music', 'bible' ou 'text'
+            animation_type: Animação do item (apenas músicas têm animação)
+        """
+        # Arquivo editado fora do programa: a releitura notifica invalidate()
+        self.config_manager.reload_if_changed()
+        animation = animation_type if content_type == 'music' and animation_type else NO_ANIMATION
+        key = (content_type, animation)
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is not None:
+                return profile
+            base = self._profiles.get((content_type, NO_ANIMATION))
+        if base is None:
+            base = StyleProfile.from_config(self.config_manager, content_type)
+        profile = replace(base, animation_type=animation) if animation != NO_ANIMATION else base
+        with self._lock:
+            self._profiles.setdefault((content_type, NO_ANIMATION), base)
+            return self._profiles.setdefault(key, profile)
+
+    def invalidate(self, changed: Optional[FrozenSet[Tuple[str, str]]] = None) -> None:
+        """Descarta os perfis das seções alteradas (todos, se changed for None)."""
+        sections = None if changed is None else {section for section, _ in changed}
+        with self._lock:
+            for key in list(self._profiles):
+                if sections is None or section_for(key[0]) in sections:
+                    del self._profiles[key]
@@ -0,0 +1,401 @@
+"""
+Estruturas de cache reutilizáveis.
+
+Este módulo fornece um cache LRU em memória, um armazenamento persistente
+em disco com TTL e limite de tamanho, e um cache de dois níveis que combina
+ambos. Todas as classes são thread-safe, pois são acessadas a partir das
+threads de busca da GUI.
+
+Entradas em disco podem guardar metadados (ex: validadores HTTP ETag e
+Last-Modified). get_entry() devolve também entradas vencidas, marcadas como
+'stale', para que o chamador as use imediatamente enquanto revalida o
+conteúdo em segundo plano.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional
+
+from core.utils.file_utils import ensure_directory_exists
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """
+    Entrada de cache com seus metadados.
+
+    Attributes:
+        value: Valor armazenado
+        metadata: Metadados gravados junto com o valor (ou None)
+        stored_at: Horário (epoch) da gravação ou da última revalidação; None para entradas em memória
+        stale: Se a entrada passou do TTL e deve ser revalidada
+    """
+    value: Any
+    metadata: Optional[Dict[str, Any]] = None
+    stored_at: Optional[float] = None
+    stale: bool = False
+
+
+def _key_to_str(key: Hashable) -> str:
+    """Converte uma chave (string ou tupla) em uma string estável."""
+    if isinstance(key, tuple):
+        return "/".join(str(part) for part in key)
+    return str(key)
+
+
+class LRUCache:
+    """
+    Cache em memória com capacidade limitada e política LRU.
+
+    Quando a capacidade é excedida, a entrada usada há mais tempo é descartada.
+
+    Attributes:
+        max_entries: Número máximo de entradas mantidas em memória
+        hits: Quantidade de buscas que encontraram a entrada
+        misses: Quantidade de buscas que não encontraram a entrada
+    """
+    def __init__(self, max_entries: int = 128) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries deve ser maior que zero")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Retorna o valor da chave (marcando-a como usada) ou default."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Retorna o valor da chave sem alterar a ordem LRU nem os contadores."""
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Armazena um valor, descartando a entrada mais antiga se necessário."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove e retorna o valor da chave, ou default se não existir."""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove todas as entradas (os contadores são mantidos)."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class DiskCache:
+    """
+    Armazenamento persistente em disco com TTL e despejo por tamanho.
+
+    Cada entrada é gravada como um arquivo JSON cujo nome é o hash SHA-256
+    da chave. O horário de modificação do arquivo é usado como horário do
+    último acesso, permitindo despejar as entradas menos usadas quando o
+    tamanho total ultrapassa max_bytes.
+
+    Attributes:
+        directory: Diretório onde os arquivos de cache são gravados
+        max_bytes: Tamanho total máximo (em bytes) dos arquivos de cache
+        ttl_seconds: Tempo de vida de uma entrada (None = sem expiração)
+        hits: Quantidade de buscas que encontraram uma entrada válida
+        misses: Quantidade de buscas sem entrada válida
+    """
+    def __init__(self, directory: Path, max_bytes: int = 50 * 1024 * 1024,
+                 ttl_seconds: Optional[float] = None) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        # Índice nome do arquivo → (tamanho, último acesso), construído sob demanda
+        self._index: Optional[Dict[str, tuple]] = None
+        self._lock = threading.Lock()
+
+    def _path_for(self, key: Hashable) -> Path:
+        digest = hashlib.sha256(_key_to_str(key).encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def _load_index(self) -> Dict[str, tuple]:
+        """Varre o diretório uma única vez para conhecer os arquivos existentes."""
+        if self._index is None:
+            self._index = {}
+            if self.directory.exists():
+                for entry in os.scandir(self.directory):
+                    if entry.is_file() and entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        self._index[entry.name] = (stat.st_size, stat.st_mtime)
+        return self._index
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        if self.ttl_seconds is None:
+            return False
+        return time.time() - entry.get("stored_at", 0) > self.ttl_seconds
+
+    def _read_entry(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Entrada de cache corrompida descartada - caminho: {path}, erro: {e}")
+            self._remove_file(path)
+            return None
+
+    def _remove_file(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Não foi possível remover entrada de cache - caminho: {path}, erro: {e}")
+        self._load_index().pop(path.name, None)
+
+    def get(self, key: Hashable) -> Any:
+        """Retorna o valor armazenado para a chave ou None se ausente/expirado."""
+        with self._lock:
+            path = self._path_for(key)
+            entry = self._read_entry(path)
+            if entry is None or entry.get("key") != _key_to_str(key):
+                self.misses += 1
+                return None
+            if self._is_expired(entry):
+                self._remove_file(path)
+                self.misses += 1
+                return None
+            self._touch(path)
+            self.hits += 1
+            return entry.get("value")
+
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Retorna a entrada da chave com seus metadados, mesmo se vencida.
+        
+        Entradas vencidas não são removidas: vêm com stale=True para que o
+        chamador as sirva enquanto revalida (ver refresh()).
+        """
+        with self._lock:
+            path = self._path_for(key)
+            entry = self._read_entry(path)
+            if entry is None or entry.get("key") != _key_to_str(key):
+                self.misses += 1
+                return None
+            self._touch(path)
+            self.hits += 1
+            return CacheEntry(entry.get("value"), entry.get("metadata"), entry.get("stored_at"),
+                              self._is_expired(entry))
+
+    def refresh(self, key: Hashable, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Marca a entrada como revalidada (ex: resposta 304), renovando o TTL.
+        
+        Args:
+            key: Chave da entrada
+            metadata: Novos metadados (None mantém os atuais)
+        
+        Returns:
+            bool: False se a entrada não existir mais
+        """
+        with self._lock:
+            entry = self._read_entry(self._path_for(key))
+        if entry is None or entry.get("key") != _key_to_str(key):
+            return False
+        self.set(key, entry.get("value"), metadata if metadata is not None else entry.get("metadata"))
+        return True
+
+    def peek(self, key: Hashable) -> Any:
+        """Retorna o valor válido da chave sem alterar contadores nem o último acesso."""
+        with self._lock:
+            entry = self._read_entry(self._path_for(key))
+            if entry is None or entry.get("key") != _key_to_str(key) or self._is_expired(entry):
+                return None
+            return entry.get("value")
+
+    def contains(self, key: Hashable) -> bool:
+        """Indica se há uma entrada válida para a chave, sem alterar contadores."""
+        return self.peek(key) is not None
+
+    def _touch(self, path: Path) -> None:
+        """Atualiza o horário de último acesso usado pela política LRU."""
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            return
+        index = self._load_index()
+        if path.name in index:
+            index[path.name] = (index[path.name][0], now)
+
+    def set(self, key: Hashable, value: Any, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Grava o valor (e os metadados opcionais) no disco e despeja entradas antigas se necessário."""
+        entry = {"key": _key_to_str(key), "stored_at": time.time(), "value": value}
+        if metadata is not None:
+            entry["metadata"] = metadata
+        payload = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            path = self._path_for(key)
+            try:
+                ensure_directory_exists(path)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                # Falha de cache não deve interromper a aplicação
+                logger.warning(f"Não foi possível gravar entrada de cache - caminho: {path}, erro: {e}")
+                return
+            self._load_index()[path.name] = (len(payload), time.time())
+            self._evict_if_needed()
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a entrada da chave, se existir."""
+        with self._lock:
+            self._remove_file(self._path_for(key))
+
+    def clear(self) -> None:
+        """Remove todas as entradas do diretório de cache."""
+        with self._lock:
+            for name in list(self._load_index()):
+                self._remove_file(self.directory / name)
+
+    def total_bytes(self) -> int:
+        """Retorna o tamanho total ocupado pelas entradas em disco."""
+        with self._lock:
+            return sum(size for size, _ in self._load_index().values())
+
+    def _evict_if_needed(self) -> None:
+        index = self._load_index()
+        total = sum(size for size, _ in index.values())
+        if total <= self.max_bytes:
+            return
+        # Despeja as entradas acessadas há mais tempo até caber no limite
+        for name, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            self._remove_file(self.directory / name)
+            total -= size
+        logger.debug(f"Cache em disco reduzido para {total} bytes: {self.directory}")
+
+
+class TwoTierCache:
+    """
+    Cache de dois níveis: LRU em memória na frente de um DiskCache.
+
+    Buscas consultam primeiro a memória; acertos no disco são promovidos
+    para a memória. Gravações vão para os dois níveis.
+
+    Attributes:
+        memory: Nível em memória (LRUCache)
+        disk: Nível persistente (DiskCache)
+        memory_hits: Acertos no nível em memória
+        disk_hits: Acertos no nível em disco
+        misses: Buscas que não encontraram a entrada em nenhum nível
+    """
+    def __init__(self, memory: LRUCache, disk: DiskCache) -> None:
+        self.memory = memory
+        self.disk = disk
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Retorna o valor da chave ou None se não estiver em nenhum nível."""
+        value = self.memory.get(key)
+        if value is not None:
+            with self._lock:
+                self.memory_hits += 1
+            return value
+        value = self.disk.get(key)
+        if value is not None:
+            self.memory.set(key, value)
+            with self._lock:
+                self.disk_hits += 1
+            return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Como get(), mas retorna a entrada com metadados e inclui entradas vencidas do disco.
+        
+        Entradas em memória são consideradas válidas. Entradas do disco são
+        promovidas para a memória mesmo se vencidas (stale=True): o chamador
+        as usa e revalida uma vez, sem repetir a revalidação a cada acesso.
+        """
+        value = self.memory.get(key)
+        if value is not None:
+            with self._lock:
+                self.memory_hits += 1
+            return CacheEntry(value)
+        entry = self.disk.get_entry(key)
+        if entry is not None:
+            self.memory.set(key, entry.value)
+            with self._lock:
+                self.disk_hits += 1
+            return entry
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Armazena o valor nos dois níveis (os metadados ficam apenas no disco)."""
+        self.memory.set(key, value)
+        self.disk.set(key, value, metadata)
+
+    def peek(self, key: Hashable) -> Any:
+        """Retorna o valor da chave sem alterar contadores nem promover entradas do disco."""
+        value = self.memory.peek(key)
+        if value is not None:
+            return value
+        return self.disk.peek(key)
+
+    def contains(self, key: Hashable) -> bool:
+        """Indica se a chave está em algum nível, sem alterar contadores."""
+        return key in self.memory or self.disk.contains(key)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a chave dos dois níveis."""
+        self.memory.pop(key)
+        self.disk.delete(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna os contadores de acerto/falha do cache."""
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_entries": len(self.memory),
+            }
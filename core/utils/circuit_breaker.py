@@ -0,0 +1,107 @@
+"""
+Disjuntor (circuit breaker) para serviços externos.
+
+Depois de várias falhas seguidas, o disjuntor "abre" e as chamadas passam
+a falhar imediatamente, sem esperar timeouts da rede. Passado o tempo de
+recuperação, uma sondagem em segundo plano testa o serviço: se responder,
+o disjuntor fecha e as chamadas voltam ao normal; se não, continua aberto.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+StateListener = Callable[[str], None]
+
+
+class CircuitBreaker:
+    """
+    Disjuntor com os estados fechado, aberto e em sondagem.
+
+    Attributes:
+        name: Nome do serviço protegido (usado nos logs)
+        failure_threshold: Falhas consecutivas que abrem o disjuntor
+        recovery_timeout: Segundos em aberto antes de permitir uma sondagem
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, recovery_timeout: float = 30.0, name: str = "") -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        self._listeners: List[StateListener] = []
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def add_listener(self, listener: StateListener) -> None:
+        """Registra uma função chamada com o novo estado a cada mudança (na thread que a causou)."""
+        self._listeners.append(listener)
+
+    def allow_request(self) -> bool:
+        """Indica se uma chamada normal pode acessar o serviço (apenas com o disjuntor fechado)."""
+        return self._state == self.CLOSED
+
+    def seconds_until_probe(self) -> float:
+        """Segundos até a próxima sondagem ser permitida (0 se fechado ou já permitida)."""
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def begin_probe(self) -> bool:
+        """
+        Passa do estado aberto para a sondagem, se o tempo de recuperação já passou.
+
+        Returns:
+            bool: True se o chamador deve sondar o serviço agora
+        """
+        with self._lock:
+            if self._state != self.OPEN or time.monotonic() - self._opened_at < self.recovery_timeout:
+                return False
+            self._state = self.HALF_OPEN
+        self._notify(self.HALF_OPEN)
+        return True
+
+    def record_success(self) -> None:
+        """Registra uma resposta do serviço; fecha o disjuntor se estava aberto."""
+        with self._lock:
+            self._failures = 0
+            changed = self._state != self.CLOSED
+            self._state = self.CLOSED
+        if changed:
+            logger.info(f"Serviço disponível novamente - serviço: {self.name}")
+            self._notify(self.CLOSED)
+
+    def record_failure(self) -> None:
+        """Registra uma falha; abre o disjuntor ao atingir o limite ou se a sondagem falhou."""
+        with self._lock:
+            self._failures += 1
+            should_open = self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            )
+            if should_open:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+        if should_open:
+            logger.warning(
+                f"Serviço indisponível, chamadas suspensas por {self.recovery_timeout:.0f}s - "
+                f"serviço: {self.name}, falhas consecutivas: {self._failures}"
+            )
+            self._notify(self.OPEN)
+
+    def _notify(self, state: str) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(state)
+            except Exception:
+                logger.exception(f"Erro em listener do disjuntor - serviço: {self.name}")
@@ -0,0 +1,82 @@
+"""
+Loop de eventos asyncio executado em uma thread dedicada.
+
+A interface Tk roda na thread principal e não pode ser bloqueada por um
+loop asyncio. Este módulo mantém um loop em segundo plano para onde a GUI
+envia corrotinas e de onde recebe os resultados por callback.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+# Callback de resultado: (resultado, exceção) — apenas um dos dois é diferente de None
+ResultCallback = Callable[[Any, Optional[BaseException]], None]
+
+
+class EventLoopThread:
+    """
+    Executa um loop asyncio em uma thread daemon.
+
+    O callback passado para submit() é chamado na thread do loop; quem
+    atualiza widgets Tk deve reencaminhá-lo com master.after().
+
+    Attributes:
+        loop: Loop de eventos executado pela thread
+    """
+    def __init__(self, name: str = "asyncio-loop") -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+        # Após stop(): cancela o que ficou pendente e aguarda os cancelamentos
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        self.loop.close()
+
+    def submit(self, coro: Coroutine, callback: Optional[ResultCallback] = None) -> Future:
+        """
+        Agenda uma corrotina no loop e retorna um concurrent.futures.Future.
+
+        Args:
+            coro: Corrotina a executar
+            callback: Chamado com (resultado, None) em caso de sucesso ou
+                      (None, exceção) em caso de erro ou cancelamento
+                      (CancelledError)
+
+        Returns:
+            Future que pode ser aguardado ou cancelado por outras threads
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if callback is not None:
+            def _on_done(done: Future) -> None:
+                # Cancelamentos também são avisados, para a GUI poder restaurar seu estado
+                error = CancelledError() if done.cancelled() else done.exception()
+                try:
+                    callback(None if error else done.result(), error)
+                except Exception:
+                    logger.error("Erro no callback de tarefa assíncrona", exc_info=True)
+            future.add_done_callback(_on_done)
+        return future
+
+    def is_running(self) -> bool:
+        """Indica se a thread do loop ainda está ativa."""
+        return self._thread.is_alive()
+
+    def stop(self, timeout: Optional[float] = 2.0) -> None:
+        """Cancela as tarefas pendentes e encerra o loop."""
+        if not self._thread.is_alive():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
@@ -0,0 +1,192 @@
+"""
+Coordenação de buscas concorrentes (single-flight + "a última seleção vence").
+
+Quando o operador percorre livros e capítulos rapidamente, cada seleção
+dispara uma busca. Este módulo junta buscas idênticas que já estão em
+andamento em uma única execução e descarta os resultados de seleções que
+já foram substituídas por outra mais recente.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Callback de resultado: (ticket, resultado, exceção)
+TicketCallback = Callable[[int, Any, Optional[BaseException]], None]
+
+
+class FetchCoordinator:
+    """
+    Junta buscas idênticas em andamento e entrega só o resultado mais recente.
+
+    - fetch(): executa o loader no pool, reaproveitando a execução em
+      andamento para a mesma chave (single-flight).
+    - run_shared(): executa o loader na thread atual, mas permite que outras
+      buscas da mesma chave se juntem a ela (usado pelo pré-carregamento).
+    - request_latest(): como fetch(), mas cada chamada substitui a anterior;
+      pedidos substituídos são marcados como cancelados e seus callbacks não
+      são chamados. Se ninguém mais aguarda a execução substituída e ela
+      ainda não começou, ela é cancelada no pool.
+
+    Attributes:
+        coalesced: Quantidade de buscas atendidas por uma execução já em andamento
+        superseded: Quantidade de pedidos descartados por uma seleção mais recente
+    """
+    def __init__(self, max_workers: int = 4, thread_name_prefix: str = "fetch") -> None:
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self.coalesced = 0
+        self.superseded = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        # Quantos interessados aguardam cada execução em andamento
+        self._subscribers: Dict[Hashable, int] = {}
+        self._latest_ticket = 0
+        self._latest: Optional[Tuple[int, Hashable]] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix
+            )
+        return self._executor
+
+    def _join_or_start(self, key: Hashable, start: Callable[[], Future]) -> Tuple[Future, bool]:
+        """Retorna (future, criado_agora). Deve ser chamado com o lock adquirido."""
+        future = self._in_flight.get(key)
+        # Uma execução pendente sem interessados está prestes a ser cancelada fora do lock
+        released = (future is not None and self._subscribers.get(key, 0) <= 0
+                    and not future.running())
+        if future is not None and not future.cancelled() and not released:
+            self.coalesced += 1
+            self._subscribers[key] = self._subscribers.get(key, 0) + 1
+            return future, False
+        future = start()
+        self._in_flight[key] = future
+        self._subscribers[key] = 1
+        return future, True
+
+    def _forget(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+                self._subscribers.pop(key, None)
+
+    def fetch(self, key: Hashable, loader: Callable[[], Any]) -> Future:
+        """
+        Executa loader() no pool, ou reaproveita a execução em andamento da chave.
+
+        Returns:
+            Future compartilhado por todos os interessados na chave
+        """
+        with self._lock:
+            future, created = self._join_or_start(key, lambda: self._get_executor().submit(loader))
+        if created:
+            future.add_done_callback(lambda done, k=key: self._forget(k, done))
+        return future
+
+    def run_shared(self, key: Hashable, loader: Callable[[], Any]) -> Future:
+        """
+        Executa loader() na thread atual, registrando a execução para single-flight.
+
+        Se a chave já estiver em andamento, não executa nada e retorna o
+        Future existente (sem aguardá-lo).
+        """
+        with self._lock:
+            future, created = self._join_or_start(key, Future)
+        if not created:
+            return future
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(loader())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            self._forget(key, future)
+        return future
+
+    def request_latest(self, key: Hashable, loader: Callable[[], Any], on_result: TicketCallback) -> int:
+        """
+        Pede a busca da seleção atual, substituindo o pedido anterior.
+
+        Args:
+            key: Chave que identifica a busca
+            loader: Função que executa a busca
+            on_result: Chamado com (ticket, resultado, erro) apenas se o pedido
+                       ainda for o mais recente quando a busca terminar
+
+        Returns:
+            int: Ticket do pedido; use is_current(ticket) para revalidar na UI
+        """
+        with self._lock:
+            self._latest_ticket += 1
+            ticket = self._latest_ticket
+            previous = self._latest
+            self._latest = (ticket, key)
+            released = self._release_locked(previous[1]) if previous is not None else None
+        self._cancel_released(released)
+
+        future = self.fetch(key, loader)
+
+        def _deliver(done: Future) -> None:
+            if done.cancelled() or not self.is_current(ticket):
+                with self._lock:
+                    self.superseded += 1
+                return
+            error = done.exception()
+            try:
+                on_result(ticket, None if error else done.result(), error)
+            except Exception:
+                logger.error("Erro no callback de busca coordenada", exc_info=True)
+
+        future.add_done_callback(_deliver)
+        return ticket
+
+    def _release_locked(self, key: Hashable) -> Optional[Future]:
+        """
+        Libera o interesse de um pedido substituído. Deve ser chamado com o lock adquirido.
+
+        Returns:
+            Future que ficou sem interessados (a ser cancelado fora do lock) ou None
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            return None
+        remaining = self._subscribers.get(key, 1) - 1
+        self._subscribers[key] = remaining
+        return future if remaining <= 0 else None
+
+    def _cancel_released(self, future: Optional[Future]) -> None:
+        """
+        Cancela a execução liberada, se ela ainda não começou.
+
+        Future.cancel() executa os callbacks (_forget, _deliver) na thread
+        atual, que adquirem o lock; por isso é chamado fora dele.
+        """
+        # cancel() só tem efeito se a tarefa ainda não começou a executar
+        if future is not None and future.cancel():
+            logger.debug("Busca substituída cancelada antes de iniciar")
+
+    def is_current(self, ticket: int) -> bool:
+        """Indica se o ticket pertence ao pedido mais recente."""
+        with self._lock:
+            return ticket == self._latest_ticket
+
+    def cancel_latest(self) -> None:
+        """Invalida o pedido mais recente (ex: a aba foi fechada)."""
+        with self._lock:
+            self._latest_ticket += 1
+            released = self._release_locked(self._latest[1]) if self._latest is not None else None
+            self._latest = None
+        self._cancel_released(released)
+
+    def shutdown(self) -> None:
+        """Invalida pedidos pendentes e encerra o pool."""
+        self.cancel_latest()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
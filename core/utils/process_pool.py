@@ -0,0 +1,79 @@
+"""
+Pool de processos para trabalho pesado de CPU.
+
+Threads do processo da interface disputam o GIL com o mainloop do Tk:
+analisar uma página grande ou construir um índice numa thread faz as
+animações da projeção engasgarem. Este pool executa essas tarefas em
+processos separados; apenas os argumentos e resultados (pequenos) cruzam a
+fronteira entre processos.
+
+As funções submetidas precisam ser de nível de módulo (serializáveis com
+pickle), e os argumentos e resultados, dados simples (str, dict, list...).
+Os processos são iniciados com "spawn", seguro com as threads da interface,
+e apenas no primeiro uso.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessPool:
+    """
+    Executor de processos criado sob demanda e recriado se um processo morrer.
+
+    Attributes:
+        max_workers: Quantidade máxima de processos
+    """
+    MAX_WORKERS = 2
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Pool de processos já encerrado")
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Agenda fn(*args) em um processo do pool."""
+        return self._get_executor().submit(fn, *args)
+
+    def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Executa fn(*args) em um processo e espera o resultado.
+
+        Exceções levantadas por fn são relançadas aqui. Se o pool tiver
+        quebrado (processo encerrado à força), ele é recriado e a tarefa é
+        tentada mais uma vez.
+        """
+        try:
+            return self.submit(fn, *args).result(timeout=timeout)
+        except BrokenProcessPool:
+            logger.warning("Pool de processos interrompido; recriando")
+            with self._lock:
+                broken, self._executor = self._executor, None
+            if broken is not None:
+                broken.shutdown(wait=False, cancel_futures=True)
+            return self.submit(fn, *args).result(timeout=timeout)
+
+    def shutdown(self) -> None:
+        """Encerra os processos; tarefas pendentes são canceladas."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,97 @@
+"""
+Limitador de taxa (token bucket) para chamadas a serviços externos.
+
+Este módulo fornece um limitador que pode ser usado tanto por threads
+(acquire) quanto por corrotinas asyncio (aacquire), compartilhando o
+mesmo orçamento de requisições, e uma variante com um limitador por host
+para buscas em lote.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class RateLimiter:
+    """
+    Limitador de taxa no modelo token bucket.
+
+    Permite rajadas de até `burst` chamadas e, em regime contínuo, no máximo
+    `rate_per_second` chamadas por segundo. Cada chamada reserva um token;
+    se o balde estiver vazio, o chamador espera o tempo necessário fora do
+    lock, de modo que várias threads/corrotinas são atendidas em ordem.
+
+    Attributes:
+        rate_per_second: Taxa sustentada de chamadas por segundo
+        burst: Quantidade máxima de chamadas imediatas acumuladas
+    """
+    def __init__(self, rate_per_second: float, burst: int = 1) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second deve ser maior que zero")
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserva um token e retorna quantos segundos o chamador deve esperar."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate_per_second)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    def acquire(self) -> None:
+        """Bloqueia a thread atual até que a chamada seja permitida."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Versão assíncrona de acquire(): suspende a corrotina sem bloquear o loop."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class HostRateLimiter:
+    """
+    Limita a taxa de chamadas separadamente para cada host.
+
+    Buscas em lote para sites diferentes não disputam o mesmo orçamento, mas
+    cada site recebe no máximo `rate_per_second` requisições por segundo.
+
+    Attributes:
+        rate_per_second: Taxa sustentada de chamadas por segundo, por host
+        burst: Quantidade máxima de chamadas imediatas por host
+    """
+    def __init__(self, rate_per_second: float, burst: int = 1) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second deve ser maior que zero")
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter_for(self, url: str) -> RateLimiter:
+        """Retorna o limitador do host da URL (criado no primeiro uso)."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = RateLimiter(self.rate_per_second, self.burst)
+            return limiter
+
+    def acquire(self, url: str) -> None:
+        """Bloqueia a thread atual até que a chamada ao host da URL seja permitida."""
+        self.limiter_for(url).acquire()
+
+    async def aacquire(self, url: str) -> None:
+        """Versão assíncrona de acquire()."""
+        await self.limiter_for(url).aacquire()
@@ -0,0 +1,44 @@
+"""
+Utilitários de normalização de texto.
+
+Funções usadas para comparar textos em português ignorando acentos,
+maiúsculas e espaços extras (ex: nomes de livros da Bíblia, buscas).
+"""
+
+import re
+import unicodedata
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fold_accents(text: str) -> str:
+    """
+    Remove acentos e diacríticos, mantendo as letras base.
+
+    Ordinais como "º" e "ª" viram "o" e "a" (decomposição NFKD).
+
+    Examples:
+        >>> fold_accents("Êxodo")
+        'Exodo'
+        >>> fold_accents("1ª Coríntios")
+        '1a Corintios'
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def normalize_text(text: str, fold: bool = True) -> str:
+    """
+    Normaliza um texto para comparação: minúsculas, espaços colapsados e,
+    opcionalmente, sem acentos.
+
+    Args:
+        text: Texto de entrada
+        fold: Se True, remove os acentos
+
+    Returns:
+        str: Texto normalizado
+    """
+    if fold:
+        text = fold_accents(text)
+    return _WHITESPACE_RE.sub(" ", text.casefold()).strip()
@@ -1,12 +1,24 @@
 import threading
 import logging
 import time
+import customtkinter as ctk
 from tkinter import messagebox
-from core.exceptions import BibleAPIError, ValidationError
+from core.exceptions import BibleAPIError, BibleReferenceError, ValidationError
+from core.bible_reference import BibleReference, format_parallel_slide, format_verse_slide
+from gui.dialogs import BibleDownloadDialog
 
 logger = logging.getLogger(__name__)
 
 class BibleController:
+    # Quantidade de resultados exibidos pela busca textual
+    SEARCH_RESULTS_LIMIT = 30
+    # Indicador de estado da API (estado do disjuntor → texto, cor)
+    API_STATUS = {
+        "closed": ("● API online", "sea green"),
+        "open": ("● Sem conexão com a API: usando os textos salvos no computador", "orange"),
+        "half_open": ("● Verificando a conexão com a API...", "gray"),
+    }
+
     def __init__(self, master, view_widgets, bible_manager, on_content_selected_callback, playlist_controller):
         self.master = master
         self.view = view_widgets
@@ -15,22 +27,35 @@ class BibleController:
         self.playlist_controller = playlist_controller
         
         self.versions_data = []
+        self.versions_by_name = {}  # nome → versão, para evitar buscas lineares
         self.books_data = []
         # Armazena os versículos do capítulo atualmente selecionado para evitar chamadas repetidas à API
         self.current_chapter_verses = []
+        # Versículos do capítulo em todas as versões exibidas (principal + paralela); vazio sem paralela
+        self.current_parallel_verses = {}
+        # Seleção (versões, livro, capítulo) a que os versículos acima correspondem
+        self._loaded_chapter_key = None
 
         self._setup_callbacks()
+        # O disjuntor da API avisa quando ela cai ou volta (em uma thread de rede)
+        self.manager.add_api_status_listener(lambda state: self._safe_after(0, self._show_api_status, state))
+        self._show_api_status(self.manager.api_status())
         # Inicia o carregamento das versões da Bíblia em uma thread separada para não travar a UI
         # Usa after() para garantir que a thread seja criada após a janela estar totalmente inicializada
         self.master.after(100, lambda: threading.Thread(target=self.populate_versions, daemon=True).start())
 
     def _setup_callbacks(self):
         self.view["version_menu"].configure(command=self.on_version_selected)
+        self.view["parallel_version_menu"].configure(command=self.on_parallel_version_selected)
         self.view["book_menu"].configure(command=self.on_book_selected)
         self.view["chapter_menu"].configure(command=self.on_chapter_selected)
         # O seletor de versículo não precisa de um 'command', pois sua seleção é lida no momento do clique nos botões.
         self.view["btn_load"].configure(command=self.load_selected_content)
         self.view["btn_add_to_playlist"].configure(command=self.add_selected_content_to_playlist)
+        self.view["btn_download"].configure(command=self.download_selected_version)
+        # Enter no campo de referência monta os slides diretamente
+        self.view["reference_entry"].bind("<Return>", lambda event: self.load_reference())
+        self.view["search_entry"].bind("<Return>", lambda event: self.search_text())
 
     def populate_versions(self):
         versions = self.manager.load_versions()
@@ -59,11 +84,13 @@ class BibleController:
 
     def _update_version_menu(self, versions):
         self.versions_data = versions
+        self.versions_by_name = {v['name']: v for v in versions}
         version_menu = self.view["version_menu"]
         version_var = self.view["version_var"]
         if self.versions_data:
             version_names = [v['name'] for v in self.versions_data]
             version_menu.configure(values=version_names)
+            self.view["parallel_version_menu"].configure(values=["Nenhuma"] + version_names)
             if version_names:
                 version_var.set(version_names[0])
                 self.on_version_selected(version_names[0])
@@ -72,8 +99,22 @@ class BibleController:
         # Quando uma versão é selecionada, o próximo passo é popular os livros
         self.populate_books()
 
+    def on_parallel_version_selected(self, selected_version_name):
+        # Recarrega o capítulo atual já com a versão paralela
+        chapter_num = self.view["chapter_var"].get()
+        if chapter_num.isdigit():
+            self.on_chapter_selected(chapter_num)
+
     def populate_books(self):
-        self.books_data = self.manager.load_books()
+        # load_books pode consultar a API (com novas tentativas), por isso roda fora da thread da UI
+        threading.Thread(target=self._threaded_load_books, daemon=True).start()
+
+    def _threaded_load_books(self):
+        books = self.manager.load_books()
+        self._safe_after(0, self._update_book_menu, books)
+
+    def _update_book_menu(self, books):
+        self.books_data = books
         book_menu = self.view["book_menu"]
         book_var = self.view["book_var"]
         if self.books_data:
@@ -86,7 +127,7 @@ class BibleController:
     def on_book_selected(self, selected_book_name):
         chapter_menu = self.view["chapter_menu"]
         chapter_var = self.view["chapter_var"]
-        book_data = next((book for book in self.books_data if book['name'] == selected_book_name), None)
+        book_data = self.manager.get_book_by_name(selected_book_name)
         if book_data:
             num_chapters = book_data.get('chapters', 0)
             chapter_values = [str(i) for i in range(1, num_chapters + 1)]
@@ -96,26 +137,91 @@ class BibleController:
                 self.on_chapter_selected(chapter_values[0])
     
     def on_chapter_selected(self, chapter_num):
-        # Ação ao selecionar um capítulo: buscar os versículos para popular o menu de versículos
-        self.view["verse_menu"].configure(state="disabled")
-        self.view["verse_var"].set("Carregando...")
+        # O menu de versículos vem do catálogo (sem rede); o texto só é buscado ao carregar o conteúdo
+        self.current_chapter_verses = []
+        self.current_parallel_verses = {}
+        self._loaded_chapter_key = None
+        chapter_key = self._get_selected_chapter_key()
+        if chapter_key is None: return
+        
+        versions, book_abbrev, chapter = chapter_key
+        verse_count = self.manager.get_verse_count(versions[0], book_abbrev, chapter)
+        if verse_count:
+            self._set_verse_menu_values([str(n) for n in range(1, verse_count + 1)])
+        else:
+            # Capítulo fora do catálogo: a numeração depende da busca do texto
+            self.view["verse_var"].set("Carregando...")
+            self._request_selected_chapter(chapter_key)
+        # Pré-carrega os capítulos vizinhos (cancela os pré-carregamentos da seleção anterior)
+        self.manager.prefetch_adjacent_chapters(versions[0], book_abbrev, chapter)
+
+    def _get_selected_chapter_key(self):
+        """Retorna (versões, livro, capítulo) da seleção atual ou None se incompleta."""
         version_abbrev = self._get_selected_abbrev('version')
         book_abbrev = self._get_selected_abbrev('book')
-        if not all([version_abbrev, book_abbrev, chapter_num]): return
-        
-        args = (version_abbrev, book_abbrev, int(chapter_num))
-        threading.Thread(target=self._threaded_fetch_verses_for_menu, args=args, daemon=True).start()
+        chapter_num = self.view["chapter_var"].get()
+        if not (version_abbrev and book_abbrev and chapter_num.isdigit()):
+            return None
+        parallel_abbrev = self._get_selected_abbrev('parallel_version')
+        versions = (version_abbrev, parallel_abbrev) if parallel_abbrev else (version_abbrev,)
+        return versions, book_abbrev, int(chapter_num)
 
-    def _threaded_fetch_verses_for_menu(self, version_abbrev, book_abbrev, chapter_num):
-        # Busca os dados em uma thread
-        try:
-            verses_data = self.manager.api_client.get_chapter_verses(version_abbrev, book_abbrev, chapter_num)
-            # Atualiza a UI na thread principal de forma segura
-            self._safe_after(0, self._populate_verse_menu, verses_data)
-        except BibleAPIError as e:
-            logger.error(f"Erro ao buscar versículos - versão: {version_abbrev}, livro: {book_abbrev}, capítulo: {chapter_num}", exc_info=True)
-            # Atualiza a UI para mostrar erro
-            self._safe_after(0, self._populate_verse_menu, None, str(e))
+    def _with_selected_chapter(self, on_ready):
+        """Chama on_ready na thread da UI quando os versículos da seleção atual estiverem carregados."""
+        chapter_key = self._get_selected_chapter_key()
+        if chapter_key is None:
+            return
+        if chapter_key == self._loaded_chapter_key and self.current_chapter_verses:
+            on_ready()
+        else:
+            self._request_selected_chapter(chapter_key, on_ready)
+
+    def _request_selected_chapter(self, chapter_key, on_ready=None):
+        versions, book_abbrev, chapter = chapter_key
+        # O coordenador reaproveita buscas em andamento e descarta seleções já substituídas
+        if len(versions) > 1:
+            # As duas versões são buscadas ao mesmo tempo (uma ida à rede, não duas)
+            self.manager.request_parallel_chapter(
+                list(versions), book_abbrev, chapter,
+                callback=lambda ticket, chapters, error: self._on_parallel_chapter_fetched(
+                    ticket, chapters, error, chapter_key, on_ready)
+            )
+        else:
+            self.manager.request_chapter_verses(
+                versions[0], book_abbrev, chapter,
+                callback=lambda ticket, verses, error: self._on_chapter_verses_fetched(
+                    ticket, verses, error, chapter_key, on_ready)
+            )
+
+    def _on_chapter_verses_fetched(self, ticket, verses_data, error, chapter_key=None, on_ready=None):
+        # Chamado na thread de busca apenas para a seleção mais recente
+        if error is not None:
+            logger.error(f"Erro ao buscar versículos: {error}", exc_info=error)
+            self._safe_after(0, self._populate_verse_menu_if_current, ticket, None, str(error), None, chapter_key)
+        else:
+            self._safe_after(0, self._populate_verse_menu_if_current, ticket, verses_data, None, None,
+                             chapter_key, on_ready)
+
+    def _on_parallel_chapter_fetched(self, ticket, chapters, error, chapter_key=None, on_ready=None):
+        # chapters: versão → versículos, com a versão principal primeiro
+        if error is not None:
+            logger.error(f"Erro ao buscar versículos em paralelo: {error}", exc_info=error)
+            self._safe_after(0, self._populate_verse_menu_if_current, ticket, None, str(error), None, chapter_key)
+        else:
+            main_verses = next(iter(chapters.values()), [])
+            self._safe_after(0, self._populate_verse_menu_if_current, ticket, main_verses, None, chapters,
+                             chapter_key, on_ready)
+
+    def _populate_verse_menu_if_current(self, ticket, verses_data, error_message=None, parallel_chapters=None,
+                                        chapter_key=None, on_ready=None):
+        # Outra seleção pode ter ocorrido entre o fim da busca e a execução na thread da UI
+        if not self.manager.is_current_request(ticket) or chapter_key != self._get_selected_chapter_key():
+            return
+        self.current_parallel_verses = parallel_chapters or {}
+        self._loaded_chapter_key = chapter_key if verses_data else None
+        self._populate_verse_menu(verses_data, error_message)
+        if on_ready is not None and self.current_chapter_verses:
+            on_ready()
     
     def _safe_after(self, delay_ms, callback, *args):
         """Executa after() de forma segura, lidando com RuntimeError se o loop principal não estiver ativo."""
@@ -130,27 +236,36 @@ class BibleController:
                 logger.warning(f"Não foi possível agendar callback {callback.__name__}. Tentando novamente após delay...")
                 threading.Timer(0.5, lambda: self._safe_after(delay_ms, callback, *args)).start()
 
+    def _show_api_status(self, state):
+        text, color = self.API_STATUS.get(state, self.API_STATUS["closed"])
+        self._show_status(text, color)
+
+    def _show_status(self, text, color="gray"):
+        """Mostra um aviso no indicador da aba, sem bloquear o operador com janelas de erro."""
+        self.view["status_label"].configure(text=text, text_color=color)
+
     def _populate_verse_menu(self, verses_data, error_message=None):
-        from tkinter import messagebox
-        
         if error_message:
-            messagebox.showerror("Erro ao Carregar Versículos",
-                                f"Não foi possível carregar os versículos da API.\n\n"
-                                f"Detalhes: {error_message}",
-                                parent=self.master)
+            # Sem janela modal: com a API fora do ar, cada clique geraria um novo diálogo
+            self._show_status(f"Não foi possível carregar os versículos: {error_message}", "orange")
             verses_data = []
         
         self.current_chapter_verses = verses_data or [] # Armazena os versículos carregados
-        verse_menu = self.view["verse_menu"]
-        verse_var = self.view["verse_var"]
         
         if self.current_chapter_verses:
-            verse_numbers = [str(v['number']) for v in self.current_chapter_verses]
-            verse_menu.configure(values=verse_numbers, state="normal")
-            verse_var.set("1") # Define o versículo 1 como padrão
-        else:
-            verse_menu.configure(values=["Nenhum"], state="disabled")
-            verse_var.set("Nenhum")
+            self._show_api_status(self.manager.api_status())
+            # Ajusta o menu à numeração real da versão (versículos omitidos ou divididos)
+            self._set_verse_menu_values([str(v['number']) for v in self.current_chapter_verses])
+        elif error_message is None or self.view["verse_var"].get() == "Carregando...":
+            self.view["verse_menu"].configure(values=["Nenhum"], state="disabled")
+            self.view["verse_var"].set("Nenhum")
+
+    def _set_verse_menu_values(self, verse_numbers):
+        """Preenche o menu de versículos, mantendo o versículo escolhido quando ele ainda existir."""
+        verse_var = self.view["verse_var"]
+        self.view["verse_menu"].configure(values=verse_numbers, state="normal")
+        if verse_var.get() not in verse_numbers:
+            verse_var.set(verse_numbers[0]) # Define o primeiro versículo como padrão
 
     # --- MÉTODO CENTRAL DA MELHORIA ---
     def _get_selected_content(self):
@@ -170,8 +285,15 @@ class BibleController:
             return None, None, 0
 
         # 1. Monta a lista de slides para o capítulo inteiro
-        for verse in self.current_chapter_verses:
-            slides.append(f"{book_name} {chapter_num}:{verse['number']}\n{verse['text']}")
+        if len(self.current_parallel_verses) > 1:
+            # Exibição paralela: cada slide traz o versículo em todas as versões
+            labels = [version.upper() for version in self.current_parallel_verses]
+            for number, texts in self.manager.join_parallel_verses(self.current_parallel_verses):
+                slides.append(format_parallel_slide(book_name, chapter_num, number, list(zip(labels, texts))))
+            title += " (" + " / ".join(labels) + ")"
+        else:
+            for verse in self.current_chapter_verses:
+                slides.append(format_verse_slide(book_name, chapter_num, verse))
 
         # 2. Encontra o índice inicial do versículo selecionado
         if selected_verse_str.isdigit():
@@ -210,6 +332,10 @@ class BibleController:
             messagebox.showwarning("Seleção Incompleta", "Por favor, selecione um capítulo.", parent=self.master)
             return
         
+        # O texto do capítulo é buscado agora, se ainda não estiver carregado
+        self._with_selected_chapter(self._show_selected_content)
+
+    def _show_selected_content(self):
         slides, _, start_index = self._get_selected_content()
         if slides:
             # A mágica acontece aqui: passamos o 'start_index' para o PresentationController
@@ -222,25 +348,127 @@ class BibleController:
         Adiciona o capítulo inteiro à Ordem de Culto, ignorando qual
         versículo individual foi selecionado.
         """
+        self._with_selected_chapter(self._add_loaded_chapter_to_playlist)
+
+    def _add_loaded_chapter_to_playlist(self):
         slides, title, _ = self._get_selected_content() # O start_index é ignorado aqui
         if slides and title:
             self.playlist_controller.add_bible_item(slides, title)
 
+    def download_selected_version(self):
+        """Abre a janela que baixa a versão selecionada inteira para uso sem internet."""
+        version_abbrev = self._get_selected_abbrev('version')
+        if not version_abbrev or not self.books_data:
+            messagebox.showwarning("Seleção Incompleta", "Aguarde o carregamento das versões e dos livros.", parent=self.master)
+            return
+        BibleDownloadDialog(self.master, self.manager, version_abbrev, self.view["version_var"].get(), self.books_data)
+
     def _get_selected_abbrev(self, item_type):
         """Pega a abreviação da versão ou livro selecionado."""
         if item_type == 'version':
-            name = self.view["version_var"].get()
-            data_list = self.versions_data
-            key = 'version'
-            data = next((v for v in data_list if v['name'] == name), None)
-            return data[key] if data else None
+            data = self.versions_by_name.get(self.view["version_var"].get())
+            return data['version'] if data else None
+        elif item_type == 'parallel_version':
+            # "Nenhuma" ou a própria versão principal desativam a exibição paralela
+            data = self.versions_by_name.get(self.view["parallel_version_var"].get())
+            main = self.versions_by_name.get(self.view["version_var"].get())
+            return data['version'] if data and data is not main else None
         elif item_type == 'book':
-            name = self.view["book_var"].get()
-            data_list = self.books_data
-            key = 'abbrev'
-            data = next((b for b in data_list if b['name'] == name), None)
+            data = self.manager.get_book_by_name(self.view["book_var"].get())
             if data:
-                abbrev_obj = data.get(key)
                 # Lida com o formato de abreviação que pode ser um dict ou uma string
-                return abbrev_obj.get('pt', abbrev_obj) if isinstance(abbrev_obj, dict) else abbrev_obj
-        return None
\ No newline at end of file
+                return self.manager.pt_abbrev(data)
+        return None
+
+    def load_reference(self):
+        """
+        Interpreta a referência digitada (ex: "Jo 3:16-18; Sl 23") e carrega
+        os slides na pré-visualização, sem passar pelos menus.
+        """
+        text = self.view["reference_entry"].get().strip()
+        if not text:
+            return
+        version_abbrev = self._get_selected_abbrev('version')
+        if not version_abbrev:
+            messagebox.showwarning("Seleção Incompleta", "Por favor, selecione uma versão da Bíblia.", parent=self.master)
+            return
+        try:
+            # A resolução dos livros usa o índice de apelidos (O(1)) e não acessa a rede
+            references = self.manager.parse_references(text)
+        except BibleReferenceError as e:
+            messagebox.showwarning("Referência Inválida", str(e), parent=self.master)
+            return
+        threading.Thread(
+            target=self._threaded_load_reference, args=(version_abbrev, references), daemon=True
+        ).start()
+
+    def _threaded_load_reference(self, version_abbrev, references, start_verse=None):
+        # Os capítulos vêm do cache quando possível; a API só é consultada para os ausentes
+        try:
+            slides = self.manager.get_reference_slides(version_abbrev, references)
+        except BibleReferenceError as e:
+            message = f"Não foi possível carregar a referência.\n\nDetalhes: {e}"
+            self._safe_after(0, lambda: messagebox.showwarning("Sem Conteúdo", message, parent=self.master))
+            return
+        except BibleAPIError as e:
+            logger.error(f"Erro ao carregar referência - versão: {version_abbrev}, erro: {e}")
+            message = f"Não foi possível carregar a referência: {e}"
+            self._safe_after(0, self._show_status, message, "orange")
+            return
+        start_index = 0
+        if start_verse is not None:
+            # O slide do versículo começa com "Livro C:V"
+            prefix = f"{references[0].book_name} {references[0].chapter}:{start_verse}\n"
+            start_index = next((i for i, slide in enumerate(slides) if slide.startswith(prefix)), 0)
+        self._safe_after(0, self._show_api_status, self.manager.api_status())
+        self._safe_after(0, lambda: self.on_content_selected("bible", slides, start_index=start_index))
+
+    def search_text(self):
+        """Busca versículos pelo texto digitado, usando o índice local da versão selecionada."""
+        query = self.view["search_entry"].get().strip()
+        version_abbrev = self._get_selected_abbrev('version')
+        if not query or not version_abbrev:
+            return
+        # O primeiro uso carrega o índice do disco; as buscas seguintes levam milissegundos
+        threading.Thread(target=self._threaded_search_text, args=(version_abbrev, query), daemon=True).start()
+
+    def _threaded_search_text(self, version_abbrev, query):
+        index = self.manager.get_search_index(version_abbrev)
+        results = index.search(query, limit=self.SEARCH_RESULTS_LIMIT) if index else None
+        self._safe_after(0, self._show_search_results, version_abbrev, results)
+
+    def _show_search_results(self, version_abbrev, results):
+        frame = self.view["search_results_frame"]
+        for widget in frame.winfo_children():
+            widget.destroy()
+
+        if results is None:
+            message = (f"Índice de busca não encontrado para '{version_abbrev}'.\n"
+                       f"Gere com: python -m core.bible_search build {version_abbrev}")
+            ctk.CTkLabel(frame, text=message, text_color="gray", justify="left").pack(fill="x", padx=5, pady=2)
+            return
+        if not results:
+            ctk.CTkLabel(frame, text="Nenhum versículo encontrado", text_color="gray").pack(fill="x", padx=5, pady=2)
+            return
+
+        default_text_color = ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+        for result in results:
+            book = self.manager.get_book_by_abbrev(result.book_abbrev)
+            book_name = book['name'] if book else result.book_abbrev
+            preview = result.text if len(result.text) <= 70 else result.text[:70] + "…"
+            ctk.CTkButton(
+                frame,
+                text=f"{book_name} {result.chapter}:{result.verse} — {preview}",
+                fg_color="transparent",
+                text_color=default_text_color,
+                anchor="w",
+                command=lambda r=result, name=book_name: self.load_search_result(version_abbrev, r, name)
+            ).pack(fill="x", padx=5, pady=2)
+
+    def load_search_result(self, version_abbrev, result, book_name):
+        """Carrega o capítulo do resultado, iniciando a projeção no versículo encontrado."""
+        reference = BibleReference(result.book_abbrev, book_name, result.chapter)
+        threading.Thread(
+            target=self._threaded_load_reference, args=(version_abbrev, [reference], result.verse), daemon=True
+        ).start()
+
@@ -1,9 +1,10 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from gui.dialogs import AddEditSongDialog
+from gui.dialogs import AddEditSongDialog, ArtistImportDialog, BatchImportDialog
 import threading
 import logging
 from core.exceptions import MusicDatabaseError, ScraperError, ValidationError
+from core.music_import import ArtistCatalogImporter, BatchImporter
 from core.validators import validate_url
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,8 @@ class MusicController:
         self.view["btn_edit"].configure(command=self.show_edit_dialog)
         self.view["btn_delete"].configure(command=self.confirm_delete)
         self.view["btn_import"].configure(command=self.show_import_dialog)
+        self.view["btn_import_batch"].configure(command=self.show_batch_import_dialog)
+        self.view["btn_import_artist"].configure(command=self.show_artist_import_dialog)
         self.view["btn_add_to_playlist"].configure(command=self.add_to_playlist)
 
     def build_music_list(self):
@@ -223,6 +226,21 @@ class MusicController:
         thread.start()
         self.view["btn_import"].configure(state="disabled", text="Importando...")
 
+    def show_batch_import_dialog(self):
+        """Abre a importação de várias URLs de uma vez."""
+        BatchImportDialog(self.master, BatchImporter(self.scraper, self.manager),
+                          on_finished=self._on_batch_import_finished)
+
+    def show_artist_import_dialog(self):
+        """Abre a importação do catálogo completo de um artista; a lista é atualizada a cada lote gravado."""
+        ArtistImportDialog(self.master, ArtistCatalogImporter(self.scraper, self.manager),
+                           on_finished=self._on_batch_import_finished)
+
+    def _on_batch_import_finished(self, report):
+        if report.added:
+            self.build_music_list()
+            self.filter_music_list()
+
     def _threaded_import(self, song_url):
         try:
             music_data = self.scraper.fetch_lyrics_from_url(song_url)
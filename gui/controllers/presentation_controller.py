@@ -1,13 +1,37 @@
+import threading
 from tkinter import messagebox
-from screeninfo import get_monitors
-from gui.projection_window import ProjectionWindow
+from gui.projection_window import ProjectionWindow, get_animation_default_color
+from core.monitor_topology import MonitorTopology
+from core.style_profile import StyleProfileCache, section_for
 import customtkinter as ctk
 
+# Indicador exibido na pré-visualização para cada animação
+ANIMATION_INDICATOR_TEXTS = {
+    "Chamas": "🔥 Chamas Ativas",
+    "Chuva": "🌧️ Chuva Ativa",
+    "Espiral": "🌀 Espiral Ativa",
+    "Estrelas Piscando": "⭐ Estrelas Ativas",
+    "Neve": "❄️ Neve Ativa",
+    "Partículas Flutuantes": "✨ Partículas Ativas",
+    "Partículas Pulsantes": "💫 Pulsantes Ativas",
+    "Pétalas": "🌸 Pétalas Ativas",
+    "Poças de Luz": "💡 Poças Ativas"
+}
+
 class PresentationController:
     def __init__(self, master, ui_elements, config_manager):
         self.master = master
         self.ui = ui_elements
         self.config_manager = config_manager
+        # Estilos já convertidos por tipo de conteúdo, descartados quando a configuração muda
+        self.style_profiles = StyleProfileCache(config_manager)
+        # Registrado depois do cache, que já terá descartado os perfis alterados
+        config_manager.add_change_listener(self._on_config_changed)
+        self._preview_profile = None  # Último perfil aplicado à pré-visualização
+        self._preview_font_size = None  # Tamanho da fonte aplicado à pré-visualização
+        # Monitores consultados em um temporizador lento, não a cada redimensionamento
+        self.monitor_topology = MonitorTopology(config_manager)
+        self._schedule_monitor_refresh()
         self.projection_window = None
 
         self.slides = []
@@ -82,11 +106,12 @@ class PresentationController:
         if not self.projection_window or not self.projection_window.winfo_exists():
             return
         
-        style_config = self._get_style_config_for_current_content()
-        self.projection_window.apply_style(style_config)
+        self.projection_window.apply_style(self._get_current_style_profile())
 
     def _update_preview_style(self):
+        """Aplica à pré-visualização apenas o que mudou no perfil de estilo desde a última vez."""
         if self.content_type is None:
+            self._preview_profile = None
             self.ui["preview_frame"].configure(fg_color=self.default_preview_bg)
             self.ui["preview_label"].configure(text_color=self.default_preview_fg)
             self.ui["animation_indicator"].configure(fg_color="transparent")
@@ -94,71 +119,67 @@ class PresentationController:
             self.ui["animation_text_indicator"].configure(text="")
             return
 
-        style_config = self._get_style_config_for_current_content()
-
-        self.ui["preview_frame"].configure(fg_color=style_config['bg_color'])
-        self.ui["preview_label"].configure(text_color=style_config['font_color'])
-        
-        anim_type = style_config.get('animation_type', 'Nenhuma')
-        anim_text_map = {
-            "Chamas": "🔥 Chamas Ativas",
-            "Chuva": "🌧️ Chuva Ativa",
-            "Espiral": "🌀 Espiral Ativa",
-            "Estrelas Piscando": "⭐ Estrelas Ativas",
-            "Neve": "❄️ Neve Ativa",
-            "Partículas Flutuantes": "✨ Partículas Ativas",
-            "Partículas Pulsantes": "💫 Pulsantes Ativas",
-            "Pétalas": "🌸 Pétalas Ativas",
-            "Poças de Luz": "💡 Poças Ativas"
-        }
-        # --- ALTERAÇÃO 1: ATUALIZA O INDICADOR DE TEXTO DA ANIMAÇÃO ---
-        self.ui["animation_text_indicator"].configure(text=anim_text_map.get(anim_type, ""))
-        
-        if anim_type != 'Nenhuma':
-            # Usa a cor padrão da animação
-            from gui.projection_window import get_animation_default_color
-            default_color = get_animation_default_color(anim_type)
-            self.ui["animation_indicator"].configure(fg_color=default_color)
-        else:
-            self.ui["animation_indicator"].configure(fg_color="transparent")
-        
-        # Força o recálculo da fonte com base no tamanho atual
-        current_width = self.ui["preview_frame"].winfo_width()
-        current_height = self.ui["preview_frame"].winfo_height()
-        if current_height > 1 and current_width > 1: # Garante que o widget já tenha sido desenhado
-            self.update_preview_font_size(current_width, current_height)
-
-    def _get_style_config_for_current_content(self):
-        content_map = {"music": "Projection_Music", "bible": "Projection_Bible", "text": "Projection_Text"}
-        section_name = content_map.get(self.content_type, "Projection_Music")
+        profile = self._get_current_style_profile()
+        changed = profile.changed_fields(self._preview_profile)
+        self._preview_profile = profile
 
-        config = {
-            'font_size': self.config_manager.get_int_setting(section_name, 'font_size', 60),
-            'font_color': self.config_manager.get_setting(section_name, 'font_color', 'white'),
-            'bg_color': self.config_manager.get_setting(section_name, 'bg_color', 'black'),
-            'animation_type': 'Nenhuma',  # Padrão: nenhuma animação
-            'text_bg_enabled': self.config_manager.get_setting(section_name, 'text_bg_enabled', 'true'),
-            'text_bg_opacity': self.config_manager.get_setting(section_name, 'text_bg_opacity', '0.75')
-        }
+        if 'bg_color' in changed:
+            self.ui["preview_frame"].configure(fg_color=profile.bg_color)
+        if 'font_color' in changed:
+            self.ui["preview_label"].configure(text_color=profile.font_color)
         
-        # Para músicas, usa a animação do item (se houver)
-        # A animação agora é configurada apenas na Ordem de Culto
-        if self.content_type == 'music':
-            if self.item_animation_data:
-                config['animation_type'] = self.item_animation_data.get('animation_type', 'Nenhuma')
+        if 'animation_type' in changed:
+            # --- ALTERAÇÃO 1: ATUALIZA O INDICADOR DE TEXTO DA ANIMAÇÃO ---
+            self.ui["animation_text_indicator"].configure(text=ANIMATION_INDICATOR_TEXTS.get(profile.animation_type, ""))
+            
+            if profile.has_animation:
+                # Usa a cor padrão da animação
+                self.ui["animation_indicator"].configure(fg_color=get_animation_default_color(profile.animation_type))
             else:
-                # Item antigo sem animação - usa "Nenhuma" como padrão
-                config['animation_type'] = 'Nenhuma'
+                self.ui["animation_indicator"].configure(fg_color="transparent")
         
-        # Para Bíblia e Texto, sempre usa "Nenhuma" (animação removida das configurações)
+        if 'font_size' in changed:
+            # Recalcula a fonte com base no tamanho atual
+            current_width = self.ui["preview_frame"].winfo_width()
+            current_height = self.ui["preview_frame"].winfo_height()
+            if current_height > 1 and current_width > 1: # Garante que o widget já tenha sido desenhado
+                self.update_preview_font_size(current_width, current_height)
+
+    def _get_current_style_profile(self):
+        """
+        Perfil de estilo do conteúdo atual (StyleProfile), sem ler as configurações
+        a cada chamada.
         
-        return config
+        A animação agora é configurada apenas na Ordem de Culto: músicas usam a
+        animação do item (itens antigos, sem animação, usam "Nenhuma"); Bíblia e
+        Texto nunca têm animação.
+        """
+        animation_type = None
+        if self.content_type == 'music' and self.item_animation_data:
+            animation_type = self.item_animation_data.get('animation_type')
+        return self.style_profiles.get(self.content_type, animation_type)
 
     def refresh_styles(self):
         self._update_preview_style()
         if self.projection_window and self.projection_window.winfo_exists():
             self._apply_style_to_projection_window()
 
+    def _on_config_changed(self, changed_keys):
+        """
+        Recebe do ConfigManager as chaves (seção, chave) alteradas.
+        
+        Só reaplica o estilo se a seção do conteúdo atual mudou; a aplicação
+        compara os perfis e toca apenas nos itens afetados.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            self.master.after(0, lambda: self._on_config_changed(changed_keys))
+            return
+        if self.content_type is None:
+            return
+        section = section_for(self.content_type)
+        if any(changed_section == section for changed_section, _ in changed_keys):
+            self.refresh_styles()
+
     # --- ALTERAÇÃO 2: MÉTODO PARA CALCULAR FONTE PROPORCIONAL À ESCALA DA PROJEÇÃO ---
     def update_preview_font_size(self, current_width, current_height):
         """
@@ -173,8 +194,7 @@ class PresentationController:
             return # Evita cálculos se o widget não for visível
 
         # Obtém o tamanho da fonte configurado para a projeção
-        style_config = self._get_style_config_for_current_content()
-        projection_font_size = style_config.get('font_size', 60)
+        projection_font_size = self._get_current_style_profile().font_size
         
         # Obtém a altura da janela de projeção (ou monitor de destino)
         projection_height = self._get_projection_height()
@@ -192,9 +212,26 @@ class PresentationController:
             # Usa arredondamento em vez de truncamento para maior precisão
             new_size = max(8, round(projection_font_size * scale_factor))
         
-        # Aplica a nova fonte ao label de pré-visualização
-        self.ui["preview_label"].configure(font=ctk.CTkFont(size=new_size, weight="bold"))
+        # Aplica a nova fonte ao label de pré-visualização (apenas se o tamanho mudou)
+        if new_size != self._preview_font_size:
+            self._preview_font_size = new_size
+            self.ui["preview_label"].configure(font=ctk.CTkFont(size=new_size, weight="bold"))
     
+    def _schedule_monitor_refresh(self):
+        self.master.after(int(MonitorTopology.REFRESH_INTERVAL_SECONDS * 1000), self._refresh_monitors)
+
+    def _refresh_monitors(self):
+        """Atualiza a lista de monitores e recalcula a pré-visualização se ela mudou."""
+        if self.monitor_topology.refresh():
+            self._recalculate_preview_font()
+        self._schedule_monitor_refresh()
+
+    def _recalculate_preview_font(self):
+        current_width = self.ui["preview_frame"].winfo_width()
+        current_height = self.ui["preview_frame"].winfo_height()
+        if current_height > 1 and current_width > 1:
+            self.update_preview_font_size(current_width, current_height)
+
     def _get_projection_height(self):
         """
         Obtém a altura da janela de projeção ou do monitor de destino.
@@ -206,14 +243,8 @@ class PresentationController:
             if height > 1:
                 return height
         
-        # Caso contrário, tenta obter a altura do monitor de destino
-        try:
-            monitors = get_monitors()
-            target_monitor = monitors[1] if len(monitors) > 1 else monitors[0]
-            return target_monitor.height
-        except (IndexError, Exception):
-            # Se não conseguir obter, retorna 0 para usar cálculo alternativo
-            return 0
+        # Caso contrário, usa a altura do monitor de destino (em cache; 0 para usar cálculo alternativo)
+        return self.monitor_topology.target_size()[1]
     
     def _get_projection_width(self):
         """
@@ -226,14 +257,8 @@ class PresentationController:
             if width > 1:
                 return width
         
-        # Caso contrário, tenta obter a largura do monitor de destino
-        try:
-            monitors = get_monitors()
-            target_monitor = monitors[1] if len(monitors) > 1 else monitors[0]
-            return target_monitor.width
-        except (IndexError, Exception):
-            # Se não conseguir obter, retorna 0 para usar cálculo alternativo
-            return 0
+        # Caso contrário, usa a largura do monitor de destino (em cache; 0 para usar cálculo alternativo)
+        return self.monitor_topology.target_size()[0]
 
     def update_slide_view(self):
         if 0 <= self.current_index < len(self.slides):
@@ -249,6 +274,11 @@ class PresentationController:
             
             if self.projection_window and self.projection_window.winfo_exists():
                 self.projection_window.update_content(slide_text)
+                # Prepara no tempo ocioso o layout do slide atual (aplicado ao fim do
+                # fade-out) e, em seguida, o do próximo e o do anterior
+                neighbours = [self.slides[i] for i in (self.current_index + 1, self.current_index - 1)
+                              if 0 <= i < len(self.slides)]
+                self.projection_window.prepare_slides([slide_text] + neighbours)
         else:
             self.clear_slide_view()
 
@@ -312,10 +342,10 @@ class PresentationController:
             self.projection_window.lift()
             return
 
-        try:
-            monitors = get_monitors()
-            target_monitor = monitors[1] if len(monitors) > 1 else monitors[0]
-        except IndexError:
+        # Ao abrir a projeção, consulta os monitores de novo (podem ter sido conectados agora)
+        self.monitor_topology.refresh()
+        target_monitor = self.monitor_topology.target_monitor()
+        if target_monitor is None:
             messagebox.showerror("Erro", "Nenhum monitor detectado.", parent=self.master)
             return
 
@@ -1,9 +1,13 @@
+import queue
+import threading
+import tkinter
 import customtkinter as ctk
 from tkinter import messagebox
 from tkinter.colorchooser import askcolor
 import logging
 from typing import Optional, Dict
-from core.exceptions import ConfigSaveError, ValidationError
+from core.exceptions import ConfigSaveError, MusicDatabaseError, ValidationError
+from core.music_import import BatchImportReport, split_url_list
 from core.validators import validate_string, validate_color
 from gui.utils.dialog_utils import center_dialog
 
@@ -226,23 +230,26 @@ class SettingsDialog(ctk.CTkToplevel):
                     )
                     return False
 
-            for key, var in vars_dict.items():
-                # Não salva animação (animação é configurada apenas na Ordem de Culto)
-                if key in ('animation_type', 'animation_color'):
-                    continue
-                
-                # Se qualquer chamada ao set_setting falhar, a função inteira retorna False.
-                try:
-                    if not self.config_manager.set_setting(section_name, key, var.get()):
-                        return False
-                except ConfigSaveError as e:
-                    logger.error("Erro ao salvar configuração", exc_info=True)
-                    messagebox.showerror("Erro ao Salvar",
-                                         f"Não foi possível salvar as configurações no arquivo 'config.ini'.\n"
-                                         f"Verifique as permissões de escrita na pasta do programa.\n\n"
-                                         f"Detalhes: {str(e)}",
-                                         parent=self)
-                    return False
+        # Validações passaram em todas as abas: grava tudo de uma vez
+        try:
+            with self.config_manager.batch():
+                for section_name, vars_dict in self.style_vars.items():
+                    for key, var in vars_dict.items():
+                        # Não salva animação (animação é configurada apenas na Ordem de Culto)
+                        if key in ('animation_type', 'animation_color'):
+                            continue
+                        self.config_manager.set_setting(section_name, key, var.get())
+        except ValidationError as e:
+            messagebox.showwarning("Valor Inválido", str(e), parent=self)
+            return False
+        except ConfigSaveError as e:
+            logger.error("Erro ao salvar configuração", exc_info=True)
+            messagebox.showerror("Erro ao Salvar",
+                                 f"Não foi possível salvar as configurações no arquivo 'config.ini'.\n"
+                                 f"Verifique as permissões de escrita na pasta do programa.\n\n"
+                                 f"Detalhes: {str(e)}",
+                                 parent=self)
+            return False
         return True # Se todas foram salvas com sucesso, retorna True.
 
     def _pick_color(self, string_var_to_update):
@@ -369,4 +376,322 @@ class AnimationSelectionDialog(ctk.CTkToplevel):
     def get_data(self) -> Optional[Dict[str, str]]:
         """Retorna os dados selecionados ou None se cancelado."""
         self.wait_window()
-        return self.result
\ No newline at end of file
+        return self.result
+
+# =============================================================================
+# Diálogo de Download de Versão da Bíblia
+# =============================================================================
+
+class BibleDownloadDialog(ctk.CTkToplevel):
+    """
+    Janela que acompanha o download de uma versão da Bíblia para uso sem internet.
+
+    O download roda no loop asyncio do BibleManager; fechar a janela interrompe
+    o download, que pode ser retomado depois de onde parou.
+    """
+    def __init__(self, master, bible_manager, version_abbrev: str, version_name: str, books):
+        super().__init__(master)
+        self.transient(master)
+        self.title("Baixar Versão")
+        self.geometry("440x170")
+        self.resizable(False, False)
+
+        self.manager = bible_manager
+        self.version_abbrev = version_abbrev
+        self.running = True
+
+        ctk.CTkLabel(self, text=f"Baixando {version_name} para uso sem internet",
+                     font=ctk.CTkFont(size=14, weight="bold")).pack(padx=20, pady=(20, 10))
+        self.progress_bar = ctk.CTkProgressBar(self)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill="x", padx=20)
+        self.status_label = ctk.CTkLabel(self, text="Verificando capítulos já baixados...")
+        self.status_label.pack(padx=20, pady=10)
+        self.action_button = ctk.CTkButton(self, text="Cancelar", command=self.on_cancel, width=120)
+        self.action_button.pack(pady=(0, 15))
+
+        self.protocol("WM_DELETE_WINDOW", self.on_cancel)
+        self.after(50, lambda: center_dialog(self, self.master))
+
+        self.job = bible_manager.create_download_job(
+            version_abbrev, books=books, on_progress=lambda progress: self._schedule(self._show_progress, progress)
+        )
+        bible_manager.run_async(
+            self.job.arun(), callback=lambda result, error: self._schedule(self._on_finished, result, error)
+        )
+
+    def _schedule(self, callback, *args):
+        """Reencaminha para a thread da interface (a janela pode já ter sido fechada)."""
+        try:
+            self.after(0, callback, *args)
+        except (RuntimeError, tkinter.TclError):
+            pass
+
+    def _show_progress(self, progress):
+        if not self.winfo_exists():
+            return
+        self.progress_bar.set(progress.fraction)
+        text = f"{progress.completed} de {progress.total} capítulos ({progress.fraction:.0%})"
+        if progress.failed:
+            text += f" — {len(progress.failed)} falha(s)"
+        self.status_label.configure(text=text)
+
+    def _on_finished(self, progress, error):
+        self.running = False
+        if not self.winfo_exists():
+            return
+        self.action_button.configure(text="Fechar")
+        if error is not None:
+            logger.error(f"Erro no download da versão {self.version_abbrev}: {error}", exc_info=error)
+            self.status_label.configure(text=f"O download falhou: {error}")
+        elif progress.failed:
+            self.status_label.configure(
+                text=f"{len(progress.failed)} capítulo(s) não puderam ser baixados. Tente novamente mais tarde."
+            )
+        elif progress.finished:
+            self.progress_bar.set(1)
+            self.status_label.configure(text="Download concluído. Construindo o índice de busca...")
+            threading.Thread(target=self._build_search_index, daemon=True).start()
+
+    def _build_search_index(self):
+        try:
+            count = self.manager.build_search_index(self.version_abbrev)
+            message = f"Versão disponível sem internet ({count} versículos indexados)."
+        except Exception as e:
+            logger.error(f"Erro ao construir o índice de busca - versão: {self.version_abbrev}", exc_info=True)
+            message = f"Download concluído, mas o índice de busca falhou: {e}"
+        self._schedule(lambda: self.winfo_exists() and self.status_label.configure(text=message))
+
+    def on_cancel(self):
+        """Interrompe o download (se ainda estiver em andamento) e fecha a janela."""
+        if self.running:
+            self.job.cancel()
+        self.destroy()
+
+
+# =============================================================================
+# Diálogo de importação de músicas em lote
+# =============================================================================
+class BatchImportDialog(ctk.CTkToplevel):
+    """
+    Janela para importar várias músicas de uma vez a partir de URLs do Letras.mus.br.
+
+    As páginas são baixadas em segundo plano (BatchImporter); os resultados
+    chegam por uma fila que a thread do Tk esvazia periodicamente, atualizando
+    a janela uma vez por lote em vez de uma vez por música. A gravação no
+    banco de dados acontece na thread do Tk, ao final.
+    """
+    # Intervalo (ms) entre as atualizações do andamento
+    PROGRESS_POLL_MS = 150
+    WINDOW_TITLE = "Importar Lista de Músicas"
+    PROMPT = "Cole as URLs do Letras.mus.br (uma por linha):"
+    INPUT_HEIGHT = 140
+
+    def __init__(self, master, importer, on_finished=None):
+        super().__init__(master)
+        self.transient(master)
+        self.title(self.WINDOW_TITLE)
+        self.geometry("560x480")
+
+        self.importer = importer
+        self.on_finished = on_finished
+        self.running = False
+        self.total = 0
+        self.done = 0
+        self._results = queue.Queue()
+        self._fetched = None
+
+        ctk.CTkLabel(self, text=self.PROMPT).pack(anchor="w", padx=20, pady=(15, 5))
+        self.input_textbox = ctk.CTkTextbox(self, height=self.INPUT_HEIGHT)
+        self.input_textbox.pack(fill="x", padx=20)
+        self.progress_bar = ctk.CTkProgressBar(self)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill="x", padx=20, pady=(10, 0))
+        self.status_label = ctk.CTkLabel(self, text="")
+        self.status_label.pack(padx=20, pady=5)
+        self.log_textbox = ctk.CTkTextbox(self, height=140, state="disabled")
+        self.log_textbox.pack(fill="both", expand=True, padx=20)
+
+        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame.pack(pady=10)
+        self.start_button = ctk.CTkButton(button_frame, text="Importar", command=self.on_start, width=120)
+        self.start_button.pack(side="left", padx=5)
+        self.close_button = ctk.CTkButton(button_frame, text="Cancelar", command=self.on_cancel, width=120)
+        self.close_button.pack(side="left", padx=5)
+
+        self.protocol("WM_DELETE_WINDOW", self.on_cancel)
+        self.after(50, lambda: center_dialog(self, self.master))
+
+    def on_start(self):
+        text = self.input_textbox.get("1.0", "end").strip()
+        urls = split_url_list(text)
+        if not urls:
+            messagebox.showwarning("Nenhuma URL", "Cole ao menos uma URL para importar.", parent=self)
+            return
+        self.running = True
+        self.input_textbox.configure(state="disabled")
+        self.start_button.configure(state="disabled")
+        self._start(urls)
+        self.after(self.PROGRESS_POLL_MS, self._drain_results)
+
+    def _start(self, urls):
+        """Inicia a busca em segundo plano."""
+        self.total = len(urls)
+        self.status_label.configure(text=f"Importando 0 de {self.total}...")
+        threading.Thread(target=self._run_in_background, args=(self.importer.fetch_all, urls), daemon=True).start()
+
+    def _run_in_background(self, fetch, *args):
+        try:
+            self._fetched = fetch(*args, on_result=self._results.put)
+        except Exception as e:
+            logger.error("Erro na importação em lote", exc_info=True)
+            self._fetched = e
+
+    def _drain_results(self):
+        """Aplica na janela todos os resultados acumulados desde a última atualização."""
+        if not self.winfo_exists():
+            return
+        # Verificado antes de esvaziar a fila: terminada a busca, nada mais é enfileirado
+        finished = self._fetched is not None
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+        if results:
+            self.done += len(results)
+            self._append_log([
+                f"✔ {result.music_data['title']} - {result.music_data['artist']}" if result.ok
+                else f"✖ {result.url}: {result.error}"
+                for result in results
+            ])
+            self._on_results(results)
+            if self.total:
+                self.progress_bar.set(self.done / self.total)
+            self.status_label.configure(text=self._progress_text())
+        if finished:
+            self._finish()
+        else:
+            self.after(self.PROGRESS_POLL_MS, self._drain_results)
+
+    def _on_results(self, results):
+        """Chamado na thread do Tk com cada lote de resultados recebidos."""
+
+    def _progress_text(self):
+        return f"Importando {self.done} de {self.total}..."
+
+    def _append_log(self, lines):
+        self.log_textbox.configure(state="normal")
+        self.log_textbox.insert("end", "\n".join(lines) + "\n")
+        self.log_textbox.see("end")
+        self.log_textbox.configure(state="disabled")
+
+    def _commit(self, results):
+        """Grava os resultados na biblioteca; retorna o relatório ou None se a gravação falhar."""
+        try:
+            return self.importer.commit(results)
+        except MusicDatabaseError as e:
+            logger.error("Erro ao salvar músicas importadas em lote", exc_info=True)
+            self.status_label.configure(text="Não foi possível salvar as músicas no arquivo 'music_db.json'.")
+            messagebox.showerror("Erro ao Salvar", f"Músicas não foram salvas.\n\nDetalhes: {e}", parent=self)
+            return None
+
+    def _finish(self):
+        self.running = False
+        self.close_button.configure(state="normal", text="Fechar")
+        if isinstance(self._fetched, Exception):
+            self.status_label.configure(text=f"A importação falhou: {self._fetched}")
+            return
+        report = self._commit(self._fetched)
+        if report is not None:
+            self._show_report(report)
+
+    def _show_report(self, report):
+        self.progress_bar.set(1)
+        self.status_label.configure(
+            text=f"{len(report.added)} importada(s), {len(report.duplicates)} já existente(s), "
+                 f"{len(report.failed)} falha(s)."
+        )
+        if self.on_finished is not None:
+            self.on_finished(report)
+
+    def on_cancel(self):
+        """Interrompe a importação (as músicas já obtidas ainda são salvas) ou fecha a janela."""
+        if self.running:
+            self.importer.cancel()
+            self.close_button.configure(state="disabled", text="Cancelando...")
+            return
+        self.destroy()
+
+
+class ArtistImportDialog(BatchImportDialog):
+    """
+    Janela para importar o catálogo completo de um artista do Letras.mus.br.
+
+    As músicas que já estão na biblioteca são puladas antes do download; as
+    demais são gravadas a cada lote de resultados recebido, de modo que a
+    biblioteca cresce durante a importação.
+    """
+    WINDOW_TITLE = "Importar Catálogo do Artista"
+    PROMPT = "URL da página do artista no Letras.mus.br (ex: https://www.letras.mus.br/artista/):"
+    INPUT_HEIGHT = 40
+
+    def __init__(self, master, importer, on_finished=None):
+        super().__init__(master, importer, on_finished)
+        self.report = BatchImportReport()
+        # Primeira falha ao gravar um lote: a importação é cancelada e nada mais é gravado
+        self._save_error = None
+
+    def _start(self, urls):
+        self.status_label.configure(text="Listando as músicas do artista...")
+        threading.Thread(target=self._run_in_background, args=(self._fetch_catalog, urls[0]), daemon=True).start()
+
+    def _fetch_catalog(self, artist_url, on_result):
+        """Executado em segundo plano: lista o catálogo e baixa as músicas novas."""
+        _, new_songs, known = self.importer.list_new_songs(artist_url)
+        self.report.duplicates.extend(known)
+        self.total = len(new_songs)
+        return self.importer.fetch_all([song["url"] for song in new_songs], on_result=on_result)
+
+    def _on_results(self, results):
+        self.report.results.extend(results)
+        if self._save_error is not None:
+            return
+        try:
+            partial = self.importer.commit(results)
+        except MusicDatabaseError as e:
+            logger.error("Erro ao salvar músicas do catálogo do artista", exc_info=True)
+            self._save_error = e
+            self.importer.cancel()
+            self.close_button.configure(state="disabled", text="Cancelando...")
+            return
+        self.report.added.extend(partial.added)
+        self.report.duplicates.extend(partial.duplicates)
+        if partial.added and self.on_finished is not None:
+            self.on_finished(partial)
+
+    def _progress_text(self):
+        if self._save_error is not None:
+            return f"Não foi possível salvar as músicas; cancelando a importação... ({self._save_error})"
+        return super()._progress_text()
+
+    def _finish(self):
+        self.running = False
+        self.close_button.configure(state="normal", text="Fechar")
+        if isinstance(self._fetched, Exception):
+            self.status_label.configure(text=f"A importação falhou: {self._fetched}")
+            return
+        if self._save_error is not None:
+            self.status_label.configure(
+                text=f"Importação interrompida: não foi possível salvar as músicas no arquivo "
+                     f"'music_db.json' ({len(self.report.added)} salva(s) antes da falha). "
+                     f"Detalhes: {self._save_error}"
+            )
+            return
+        self.report.cancelled = self.importer.cancelled
+        self.progress_bar.set(1)
+        self.status_label.configure(
+            text=f"{len(self.report.added)} importada(s), {len(self.report.duplicates)} já na biblioteca, "
+                 f"{len(self.report.failed)} falha(s)."
+        )
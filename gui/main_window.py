@@ -4,6 +4,7 @@ from core.bible_manager import BibleManager
 # --- IMPORTAÇÃO MODIFICADA ---
 from core.services.letras_scraper import LetrasScraper
 from core.config_manager import ConfigManager
+from core.utils.process_pool import ProcessPool
 from .controllers.presentation_controller import PresentationController
 from .controllers.music_controller import MusicController
 from .controllers.bible_controller import BibleController
@@ -21,8 +22,10 @@ class MainWindow(ctk.CTk):
         # Gerenciadores de Lógica
         self.config_manager = ConfigManager()
         self.music_manager = MusicManager()
-        self.bible_manager = BibleManager()
-        self.letras_scraper = LetrasScraper()
+        # Análise de HTML e construção de índices rodam em outros processos
+        self.cpu_pool = ProcessPool()
+        self.bible_manager = BibleManager(cpu_pool=self.cpu_pool)
+        self.letras_scraper = LetrasScraper(cpu_pool=self.cpu_pool)
 
         # Configuração do Layout Principal
         self.grid_columnconfigure(0, weight=1)
@@ -250,8 +253,14 @@ class MainWindow(ctk.CTk):
         self.btn_import_music = ctk.CTkButton(top_actions_frame, text="Importar (URL)")
         self.btn_import_music.grid(row=0, column=1, padx=5, pady=5)
 
+        self.btn_import_batch_music = ctk.CTkButton(top_actions_frame, text="Importar Lista")
+        self.btn_import_batch_music.grid(row=0, column=2, padx=5, pady=5)
+
+        self.btn_import_artist_music = ctk.CTkButton(top_actions_frame, text="Importar Artista")
+        self.btn_import_artist_music.grid(row=0, column=3, padx=5, pady=5)
+
         self.btn_add_manual_music = ctk.CTkButton(top_actions_frame, text="Adicionar Nova")
-        self.btn_add_manual_music.grid(row=0, column=2, padx=5, pady=5)
+        self.btn_add_manual_music.grid(row=0, column=4, padx=5, pady=5)
         
         # --- Lista de Músicas (no meio) ---
         self.music_scroll_frame = ctk.CTkScrollableFrame(tab, label_text=None)
@@ -280,37 +289,46 @@ class MainWindow(ctk.CTk):
         options_frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
         options_frame.grid_columnconfigure(1, weight=1)
         
-        # O texto "Navegar por Referência" foi removido.
+        # Linha 0: Referência digitada (ex: "Jo 3:16-18; Sl 23"), carregada com Enter
+        ctk.CTkLabel(options_frame, text="Referência:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        self.bible_reference_entry = ctk.CTkEntry(options_frame, placeholder_text="Ex: Jo 3:16-18; Sl 23; 1Co 13")
+        self.bible_reference_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
 
-        # Linha 0: Versão
-        ctk.CTkLabel(options_frame, text="Versão:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        # Linha 1: Versão
+        ctk.CTkLabel(options_frame, text="Versão:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.bible_version_var = ctk.StringVar(value="Carregando...")
         self.bible_version_optionmenu = ctk.CTkOptionMenu(options_frame, variable=self.bible_version_var, values=["..."])
-        self.bible_version_optionmenu.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        self.bible_version_optionmenu.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
 
-        # Linha 1: Livro
-        ctk.CTkLabel(options_frame, text="Livro:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
+        # Linha 2: Versão paralela (exibida lado a lado com a principal)
+        ctk.CTkLabel(options_frame, text="Paralela:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
+        self.bible_parallel_version_var = ctk.StringVar(value="Nenhuma")
+        self.bible_parallel_version_optionmenu = ctk.CTkOptionMenu(options_frame, variable=self.bible_parallel_version_var, values=["Nenhuma"])
+        self.bible_parallel_version_optionmenu.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
+
+        # Linha 3: Livro
+        ctk.CTkLabel(options_frame, text="Livro:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
         self.bible_book_var = ctk.StringVar(value="Aguardando...")
         self.bible_book_optionmenu = ctk.CTkOptionMenu(options_frame, variable=self.bible_book_var, values=["..."])
-        self.bible_book_optionmenu.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self.bible_book_optionmenu.grid(row=3, column=1, padx=5, pady=5, sticky="ew")
 
-        # Linha 2: Capítulo
-        ctk.CTkLabel(options_frame, text="Capítulo:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
+        # Linha 4: Capítulo
+        ctk.CTkLabel(options_frame, text="Capítulo:").grid(row=4, column=0, padx=5, pady=5, sticky="w")
         self.bible_chapter_var = ctk.StringVar(value="Aguardando...")
         self.bible_chapter_optionmenu = ctk.CTkOptionMenu(options_frame, variable=self.bible_chapter_var, values=["..."])
-        self.bible_chapter_optionmenu.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
+        self.bible_chapter_optionmenu.grid(row=4, column=1, padx=5, pady=5, sticky="ew")
 
         # --- INÍCIO DA ADIÇÃO DO SELETOR DE VERSÍCULO ---
-        # Linha 3: Versículo
-        ctk.CTkLabel(options_frame, text="Versículo:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        # Linha 5: Versículo
+        ctk.CTkLabel(options_frame, text="Versículo:").grid(row=5, column=0, padx=5, pady=5, sticky="w")
         self.bible_verse_var = ctk.StringVar(value="Aguardando...")
         self.bible_verse_optionmenu = ctk.CTkOptionMenu(options_frame, variable=self.bible_verse_var, values=["..."], state="disabled")
-        self.bible_verse_optionmenu.grid(row=3, column=1, padx=5, pady=5, sticky="ew")
+        self.bible_verse_optionmenu.grid(row=5, column=1, padx=5, pady=5, sticky="ew")
         # --- FIM DA ADIÇÃO ---
 
-        # Linha 4: Botões
+        # Linha 6: Botões
         bottom_frame = ctk.CTkFrame(options_frame)
-        bottom_frame.grid(row=4, column=0, columnspan=2, padx=0, pady=10, sticky="ew")
+        bottom_frame.grid(row=6, column=0, columnspan=2, padx=0, pady=10, sticky="ew")
         bottom_frame.grid_columnconfigure((0, 1), weight=1)
 
         self.btn_load_verses = ctk.CTkButton(bottom_frame, text="Carregar e Visualizar")
@@ -319,6 +337,24 @@ class MainWindow(ctk.CTk):
         self.btn_add_to_playlist_bible = ctk.CTkButton(bottom_frame, text="Adicionar à Ordem", fg_color="sea green", hover_color="dark sea green")
         self.btn_add_to_playlist_bible.grid(row=0, column=1, padx=(5,0), sticky="ew")
 
+        # Download da versão selecionada para uso sem internet
+        self.btn_download_bible = ctk.CTkButton(bottom_frame, text="Baixar versão para uso offline", fg_color="gray", hover_color="gray40")
+        self.btn_download_bible.grid(row=1, column=0, columnspan=2, pady=(5, 0), sticky="ew")
+
+        # Estado da API e avisos de carregamento (no lugar de janelas de erro)
+        self.bible_status_label = ctk.CTkLabel(bottom_frame, text="", anchor="w", justify="left")
+        self.bible_status_label.grid(row=2, column=0, columnspan=2, pady=(5, 0), sticky="ew")
+
+        # Linha 7: Busca por texto nos versículos armazenados localmente
+        ctk.CTkLabel(options_frame, text="Buscar texto:").grid(row=7, column=0, padx=5, pady=5, sticky="w")
+        self.bible_search_entry = ctk.CTkEntry(options_frame, placeholder_text='Ex: lâmpada pés ou "lâmpada para os meus pés"')
+        self.bible_search_entry.grid(row=7, column=1, padx=5, pady=5, sticky="ew")
+
+        # Linha 8: Resultados da busca
+        options_frame.grid_rowconfigure(8, weight=1)
+        self.bible_search_results_frame = ctk.CTkScrollableFrame(options_frame)
+        self.bible_search_results_frame.grid(row=8, column=0, columnspan=2, padx=5, pady=(0, 5), sticky="nsew")
+
     # --- ALTERAÇÃO 2: MÉTODO PARA CHAMAR O CONTROLADOR QUANDO A JANELA REDIMENSIONA ---
     def _on_preview_resize(self, event):
         """
@@ -375,6 +411,8 @@ class MainWindow(ctk.CTk):
             "btn_edit": self.btn_edit_song,
             "btn_delete": self.btn_delete_song,
             "btn_import": self.btn_import_music,
+            "btn_import_batch": self.btn_import_batch_music,
+            "btn_import_artist": self.btn_import_artist_music,
             "btn_add_to_playlist": self.btn_add_to_playlist_music
         }
         self.music_controller = MusicController(
@@ -386,13 +424,20 @@ class MainWindow(ctk.CTk):
         # O controlador da Bíblia também recebe a referência ao controlador da Playlist.
         bible_ui = {
             "version_menu": self.bible_version_optionmenu, "version_var": self.bible_version_var,
+            "parallel_version_menu": self.bible_parallel_version_optionmenu,
+            "parallel_version_var": self.bible_parallel_version_var,
             "book_menu": self.bible_book_optionmenu, "book_var": self.bible_book_var,
             "chapter_menu": self.bible_chapter_optionmenu, "chapter_var": self.bible_chapter_var,
             # --- INÍCIO DA ADIÇÃO ---
             "verse_menu": self.bible_verse_optionmenu, "verse_var": self.bible_verse_var,
             # --- FIM DA ADIÇÃO ---
+            "reference_entry": self.bible_reference_entry,
+            "search_entry": self.bible_search_entry,
+            "search_results_frame": self.bible_search_results_frame,
             "btn_load": self.btn_load_verses,
             "btn_add_to_playlist": self.btn_add_to_playlist_bible,
+            "btn_download": self.btn_download_bible,
+            "status_label": self.bible_status_label,
         }
         self.bible_controller = BibleController(
             self, bible_ui, self.bible_manager,
@@ -412,12 +457,9 @@ class MainWindow(ctk.CTk):
 
     def show_settings_dialog(self):
         """Abre o diálogo de configurações."""
-        dialog = SettingsDialog(master=self, config_manager=self.config_manager)
-        dialog.wait_window() # Esta linha pausa a execução até a janela de diálogo ser fechada
-
-        # --- ALTERAÇÃO 4: AVISAMOS O CONTROLADOR PARA ATUALIZAR OS ESTILOS ---
-        # Assim que a janela fecha, mandamos o controlador recarregar os estilos.
-        self.presentation_controller.refresh_styles()
+        # As alterações salvas chegam ao PresentationController pelo listener do
+        # ConfigManager, que reaplica apenas o que mudou
+        SettingsDialog(master=self, config_manager=self.config_manager)
 
     def toggle_theme(self):
         """Alterna entre os temas Claro e Escuro."""
@@ -434,4 +476,6 @@ class MainWindow(ctk.CTk):
     def on_closing(self):
         """Lida com o fechamento da janela principal."""
         self.presentation_controller.on_closing()
+        self.bible_manager.shutdown()
+        self.cpu_pool.shutdown()
         self.destroy()
\ No newline at end of file
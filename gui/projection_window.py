@@ -1,5 +1,8 @@
 import customtkinter as ctk
 import tkinter as tk
+import tkinter.font as tkfont
+from core.slide_layout import SlideLayoutEngine, text_background
+from core.style_profile import StyleProfile
 from .animations import (
     FireAnimation, RainAnimation, SpiralAnimation,
     BlinkingStarsAnimation, SnowAnimation, FloatingParticlesAnimation,
@@ -19,6 +22,19 @@ ANIMATION_DEFAULT_COLORS = {
     "Poças de Luz": "#4169E1"         # Azul royal
 }
 
+# Classe de cada animação, pelo nome exibido
+ANIMATION_CLASSES = {
+    "Chamas": FireAnimation,
+    "Chuva": RainAnimation,
+    "Espiral": SpiralAnimation,
+    "Estrelas Piscando": BlinkingStarsAnimation,
+    "Neve": SnowAnimation,
+    "Partículas Flutuantes": FloatingParticlesAnimation,
+    "Partículas Pulsantes": PulsingParticlesAnimation,
+    "Pétalas": PetalsAnimation,
+    "Poças de Luz": LightPoolsAnimation
+}
+
 # Função auxiliar para obter a cor padrão de uma animação
 def get_animation_default_color(animation_type: str) -> str:
     """Retorna a cor padrão para um tipo de animação."""
@@ -38,10 +54,16 @@ class ProjectionWindow(ctk.CTkToplevel):
         
         self.is_fading, self._after_id_fade = False, None
         
-        self.font_color = 'white'
-        self.bg_color = 'black'
-        self.text_bg_enabled = True
-        self.text_bg_opacity = 0.75
+        # Perfil de estilo aplicado (StyleProfile); o padrão vale até o primeiro apply_style
+        self.style_profile = StyleProfile('music')
+        self._style_applied = False
+        # Quebra de linhas e caixas dos slides, calculadas antes da troca (ver prepare_slides)
+        self.layout_engine = SlideLayoutEngine(self._measure_text, self._font_linespace)
+        self._fonts = {}  # tupla da fonte → tkinter.font.Font usada nas medidas
+        self._current_text = ""
+        self._after_id_prepare = None
+        self.font_color = self.style_profile.font_color
+        self.bg_color = self.style_profile.bg_color
 
         self.overrideredirect(True)
         self.geometry(f"{target_monitor_geometry['width']}x{target_monitor_geometry['height']}+{target_monitor_geometry['x']}+{target_monitor_geometry['y']}")
@@ -95,20 +117,44 @@ class ProjectionWindow(ctk.CTkToplevel):
 
     # ... (O restante do arquivo permanece exatamente o mesmo, não precisa ser alterado) ...
 
-    def apply_style(self, style_config):
-        animation_map = {
-            "Chamas": FireAnimation,
-            "Chuva": RainAnimation,
-            "Espiral": SpiralAnimation,
-            "Estrelas Piscando": BlinkingStarsAnimation,
-            "Neve": SnowAnimation,
-            "Partículas Flutuantes": FloatingParticlesAnimation,
-            "Partículas Pulsantes": PulsingParticlesAnimation,
-            "Pétalas": PetalsAnimation,
-            "Poças de Luz": LightPoolsAnimation
-        }
-        new_anim_name = style_config.get('animation_type', 'Nenhuma')
-        new_anim_class = animation_map.get(new_anim_name)
+    def apply_style(self, profile):
+        """
+        Aplica um StyleProfile (já convertido; nenhuma configuração é lida aqui).
+        
+        Apenas os itens do Tk afetados pelos campos que mudaram em relação ao
+        perfil aplicado são reconfigurados, para que alterar uma configuração
+        durante o culto não reinicie a animação nem redesenhe o restante.
+        """
+        changed = profile.changed_fields(self.style_profile if self._style_applied else None)
+        self.style_profile, self._style_applied = profile, True
+        if not changed:
+            return
+
+        if 'animation_type' in changed:
+            self._apply_animation(profile.animation_type)
+
+        if 'bg_color' in changed:
+            self.bg_color = profile.bg_color
+            self.main_canvas.configure(bg=self.bg_color)
+
+        text_options = {}
+        if 'font_color' in changed:
+            self.font_color = profile.font_color
+            text_options['fill'] = self.font_color
+        if 'font_size' in changed:
+            text_options['font'] = profile.font
+        if text_options:
+            # Atualiza o texto do canvas diretamente
+            self.main_canvas.itemconfig(self.text_id, **text_options)
+
+        if changed & {'font_size', 'text_bg_enabled', 'text_bg_opacity'}:
+            # A quebra de linhas ou a visibilidade do fundo mudou: o fundo é
+            # posicionado (ou ocultado) de acordo com o layout do slide atual
+            self._apply_current_layout()
+
+    def _apply_animation(self, animation_type):
+        """Troca a animação de fundo (ou a remove) e mantém o texto acima dela."""
+        new_anim_class = ANIMATION_CLASSES.get(animation_type)
         current_anim_class = self.animation.__class__ if self.animation else None
 
         if new_anim_class is not current_anim_class:
@@ -127,28 +173,7 @@ class ProjectionWindow(ctk.CTkToplevel):
         
         if self.animation:
             # Usa a cor padrão da animação
-            self.animation.particle_color = ANIMATION_DEFAULT_COLORS.get(new_anim_name, '#FFFFFF')
-
-        self.bg_color = style_config.get('bg_color')
-        self.font_color = style_config.get('font_color')
-        # Configuração do fundo semi-transparente
-        self.text_bg_enabled = str(style_config.get('text_bg_enabled', 'true')).lower() in ('1','true','yes','on')
-        try:
-            self.text_bg_opacity = float(style_config.get('text_bg_opacity', 0.75))
-        except (TypeError, ValueError):
-            self.text_bg_opacity = 0.75
-        self.text_bg_opacity = min(1.0, max(0.0, self.text_bg_opacity))
-        self.main_canvas.configure(bg=self.bg_color)
-        font_size = int(style_config.get('font_size'))
-        # Atualiza o texto do canvas diretamente
-        font_tuple = ("Arial", font_size, "bold")
-        self.main_canvas.itemconfig(
-            self.text_id,
-            fill=self.font_color,
-            font=font_tuple
-        )
-        # Atualiza o fundo do texto
-        self._update_text_background()
+            self.animation.particle_color = get_animation_default_color(animation_type)
         # Garante que fundo e texto fiquem acima das animações
         self.main_canvas.tag_raise("projection_text_bg")
         self.main_canvas.tag_raise("projection_text")
@@ -183,50 +208,66 @@ class ProjectionWindow(ctk.CTkToplevel):
         self._fade_out(lambda: self._update_text_and_fade_in(text))
 
     def _update_text_and_fade_in(self, text):
-        # Atualiza o texto diretamente no canvas
-        self.main_canvas.itemconfig(self.text_id, text=text)
-        # Atualiza o fundo do texto baseado no tamanho do texto
-        self._update_text_background()
+        # Texto já quebrado e fundo já medido (normalmente preparados no tempo ocioso)
+        self._current_text = text
+        layout = self._current_layout()
+        self.main_canvas.itemconfig(self.text_id, text=layout.text)
+        self._place_text_background(layout)
         self._fade_in()
+
+    def prepare_slides(self, texts):
+        """
+        Calcula no tempo ocioso o layout dos slides (o atual, durante o
+        fade-out, e os que podem vir a seguir), para que a troca apenas
+        aplique o resultado.
+        """
+        if self._after_id_prepare:
+            self.after_cancel(self._after_id_prepare)
+        self._after_id_prepare = self.after_idle(lambda: self._prepare_layouts(list(texts)))
+
+    def _prepare_layouts(self, texts):
+        self._after_id_prepare = None
+        if not self.winfo_exists():
+            return
+        width, height = self._canvas_size()
+        if width > 1:
+            self.layout_engine.prepare(texts, self.style_profile.font, (width, height))
+
+    def _canvas_size(self):
+        return self.main_canvas.winfo_width(), self.main_canvas.winfo_height()
+
+    def _current_layout(self):
+        return self.layout_engine.layout(self._current_text, self.style_profile.font, self._canvas_size())
+
+    def _get_font(self, font):
+        if font not in self._fonts:
+            family, size, weight = font
+            self._fonts[font] = tkfont.Font(root=self, family=family, size=size, weight=weight)
+        return self._fonts[font]
+
+    def _measure_text(self, font, text):
+        return self._get_font(font).measure(text)
+
+    def _font_linespace(self, font):
+        return self._get_font(font).metrics("linespace")
     
-    def _apply_text_background_style(self):
-        """Aplica estado e opacidade do fundo atrás do texto."""
-        if not self.text_bg_enabled or self.text_bg_opacity <= 0.01:
-            self.main_canvas.itemconfig(self.text_bg_id, state="hidden")
+    def _apply_current_layout(self):
+        """Reaplica o texto quebrado e o fundo do slide atual (após mudar a fonte ou o tamanho)."""
+        if self.main_canvas.winfo_width() <= 1:
             return
-        # Mapeia opacidade para padrões de stipple
-        if self.text_bg_opacity >= 0.85:
-            stipple = "gray75"
-        elif self.text_bg_opacity >= 0.6:
-            stipple = "gray50"
-        elif self.text_bg_opacity >= 0.35:
-            stipple = "gray25"
-        else:
-            stipple = "gray12"
-        self.main_canvas.itemconfig(self.text_bg_id, stipple=stipple, state="normal")
+        layout = self._current_layout()
+        self.main_canvas.itemconfig(self.text_id, text=layout.text)
+        self._place_text_background(layout)
 
-    def _update_text_background(self):
-        """Atualiza o retângulo de fundo do texto baseado na bounding box do texto."""
-        if not self.text_bg_enabled or self.text_bg_opacity <= 0.01:
+    def _place_text_background(self, layout):
+        """Posiciona o retângulo de fundo já calculado pelo layout (sem consultar a bbox do texto)."""
+        background = text_background(layout, self.style_profile)
+        if background is None:
             self.main_canvas.itemconfig(self.text_bg_id, state="hidden")
             return
-        try:
-            # Obtém a bounding box do texto
-            bbox = self.main_canvas.bbox(self.text_id)
-            if bbox:
-                # Adiciona padding ao redor do texto
-                padding = 20
-                x1 = bbox[0] - padding
-                y1 = bbox[1] - padding
-                x2 = bbox[2] + padding
-                y2 = bbox[3] + padding
-                self.main_canvas.coords(self.text_bg_id, x1, y1, x2, y2)
-                self._apply_text_background_style()
-            else:
-                # Mesmo sem bbox, aplica estado (útil para limpar/ocultar)
-                self._apply_text_background_style()
-        except:
-            pass  # Se não conseguir obter bbox, ignora
+        rect, stipple = background
+        self.main_canvas.coords(self.text_bg_id, *rect)
+        self.main_canvas.itemconfig(self.text_bg_id, stipple=stipple, state="normal")
     
     def _fade_out(self, on_finish_callback=None):
         self.is_fading = True
@@ -270,9 +311,9 @@ class ProjectionWindow(ctk.CTkToplevel):
         # Reposiciona o texto no centro e ajusta wraplength
         center_x, center_y = width / 2, height / 2
         self.main_canvas.coords(self.text_id, center_x, center_y)
-        self.main_canvas.itemconfig(self.text_id, width=int(width * 0.9))
-        # Atualiza o fundo do texto
-        self._update_text_background()
+        self.main_canvas.itemconfig(self.text_id, width=SlideLayoutEngine.wrap_width(width))
+        # Texto quebrado e fundo para o novo tamanho
+        self._apply_current_layout()
         # Garante que o fundo fique atrás do texto principal, mas ambos acima das animações
         self.main_canvas.tag_lower("projection_text_bg", "projection_text")
         self.main_canvas.tag_raise("projection_text_bg")
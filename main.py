@@ -1,3 +1,4 @@
+import multiprocessing
 import customtkinter as ctk
 from gui.main_window import MainWindow
 from dotenv import load_dotenv
@@ -6,6 +7,9 @@ from core.logging_config import setup_logging
 load_dotenv()
 
 if __name__ == "__main__":
+    # Necessário para o pool de processos no executável empacotado (Windows)
+    multiprocessing.freeze_support()
+
     # Configura logging antes de iniciar a aplicação
     setup_logging()
     
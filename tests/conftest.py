@@ -7,6 +7,9 @@ Este módulo contém fixtures e configurações comuns usadas em todos os testes
 import pytest
 import tempfile
 import os
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
 from typing import Dict, Any
@@ -199,3 +202,128 @@ def temp_bible_cache(tmp_path):
     if cache_file.exists():
         cache_file.unlink()
 
+
+@pytest.fixture(autouse=True)
+def isolated_bible_storage(tmp_path, monkeypatch):
+    """
+    Redireciona o armazenamento local da Bíblia e os índices de busca para
+    um diretório temporário, evitando que os testes gravem em data/.
+    
+    Também desativa a revalidação da lista de livros em segundo plano, que
+    acessaria a API real (os testes de revalidação reduzem o TTL).
+    
+    Yields:
+        Path do diretório temporário usado como raiz
+    """
+    root = tmp_path / "bible_storage"
+    monkeypatch.setattr("core.bible_manager.BIBLE_STORE_DIR", root / "bible")
+    monkeypatch.setattr("core.bible_manager.BIBLE_SEARCH_INDEX_DIR", root / "bible_index")
+    monkeypatch.setattr("core.bible_manager.BibleManager.BOOKS_CACHE_TTL_SECONDS", float("inf"))
+    yield root
+
+
+@pytest.fixture(autouse=True)
+def isolated_letras_cache(tmp_path, monkeypatch):
+    """
+    Redireciona o cache de páginas do Letras.mus.br para um diretório temporário.
+    
+    Yields:
+        Path do diretório do cache
+    """
+    cache_dir = tmp_path / "letras_pages"
+    monkeypatch.setattr("core.services.letras_scraper.LETRAS_PAGE_CACHE_DIR", cache_dir)
+    yield cache_dir
+
+
+class StubHTTPServer:
+    """
+    Servidor HTTP local para testes de clientes HTTP.
+    
+    Cada rota recebe uma lista de respostas servidas em sequência; a última
+    resposta é repetida quando a lista acaba. Todas as requisições recebidas
+    ficam registradas em `requests`.
+    """
+    def __init__(self):
+        self.routes: Dict[str, list] = {}
+        self.requests: list = []
+        self.connections: set = set()
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Permite keep-alive
+
+            def do_GET(self):
+                stub._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+
+    def add_route(self, path, *responses):
+        """
+        Registra respostas para um caminho.
+        
+        Cada resposta é um dict com 'status', 'body' (dict/list/str),
+        'headers' (opcional) e 'delay' (segundos, opcional).
+        """
+        self.routes[path] = list(responses)
+
+    def _handle(self, handler):
+        path = handler.path.split("?")[0]
+        with self._lock:
+            self.requests.append({"path": path, "headers": dict(handler.headers)})
+            self.connections.add(handler.client_address)
+            responses = self.routes.get(path)
+            if not responses:
+                response = {"status": 404, "body": {"msg": "not found"}}
+            elif len(responses) > 1:
+                response = responses.pop(0)
+            else:
+                response = responses[0]
+        if response.get("delay"):
+            # Event.wait em vez de time.sleep: os testes costumam substituir time.sleep
+            threading.Event().wait(response["delay"])
+        body = response.get("body", "")
+        payload = body.encode("utf-8") if isinstance(body, str) else json.dumps(body).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        headers.update(response.get("headers", {}))
+        try:
+            handler.send_response(response.get("status", 200))
+            for name, value in headers.items():
+                handler.send_header(name, value)
+            handler.send_header("Content-Length", str(len(payload)))
+            handler.end_headers()
+            handler.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # O cliente desistiu (ex: teste de timeout)
+            handler.close_connection = True
+
+    def count(self, path):
+        """Retorna quantas requisições o caminho recebeu."""
+        with self._lock:
+            return sum(1 for r in self.requests if r["path"] == path)
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub_http_server():
+    """
+    Inicia um servidor HTTP local para testar clientes sem acessar a internet.
+    
+    Yields:
+        StubHTTPServer em execução (encerrado ao final do teste)
+    """
+    server = StubHTTPServer()
+    yield server
+    server.close()
@@ -8,9 +8,11 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 import requests
 import json
+import asyncio
+import threading
 
 from core.services.bible_api_client import BibleAPIClient
-from core.exceptions import BibleAPIError
+from core.exceptions import BibleAPIError, BibleAPIUnavailableError
 
 
 class TestBibleAPIClient:
@@ -27,7 +29,7 @@ class TestBibleAPIClient:
         assert "version" in versions[0]
         assert "name" in versions[0]
     
-    @patch('core.services.bible_api_client.requests.get')
+    @patch('core.services.bible_api_client.requests.Session.get')
     def test_get_books_success(self, mock_get):
         """Testa obter livros com sucesso."""
         # Mock de resposta bem-sucedida
@@ -40,6 +42,7 @@ class TestBibleAPIClient:
                 "testament": "VT"
             }
         ]
+        mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
         
@@ -51,7 +54,7 @@ class TestBibleAPIClient:
         assert "name" in books[0]
         mock_get.assert_called_once()
     
-    @patch('core.services.bible_api_client.requests.get')
+    @patch('core.services.bible_api_client.requests.Session.get')
     def test_make_request_network_error(self, mock_get):
         """Testa erro de rede na requisição."""
         # Mock de erro de rede
@@ -62,11 +65,12 @@ class TestBibleAPIClient:
         with pytest.raises(BibleAPIError):
             client._make_request("/books")
     
-    @patch('core.services.bible_api_client.requests.get')
+    @patch('core.services.bible_api_client.requests.Session.get')
     def test_make_request_json_error(self, mock_get):
         """Testa erro de JSON inválido na resposta."""
         # Mock de resposta inválida
         mock_response = Mock()
+        mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
         mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
         mock_get.return_value = mock_response
@@ -76,7 +80,7 @@ class TestBibleAPIClient:
         with pytest.raises(BibleAPIError):
             client._make_request("/books")
     
-    @patch('core.services.bible_api_client.requests.get')
+    @patch('core.services.bible_api_client.requests.Session.get')
     def test_get_chapter_verses(self, mock_get):
         """Testa obter versículos de um capítulo."""
         # Mock de resposta bem-sucedida
@@ -87,6 +91,7 @@ class TestBibleAPIClient:
                 {"number": 2, "text": "E a terra era sem forma..."}
             ]
         }
+        mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
         
@@ -97,3 +102,201 @@ class TestBibleAPIClient:
         assert len(verses) == 2
         assert verses[0]["number"] == 1
 
+
+class TestBibleAPIClientHTTP:
+    """Testes do BibleAPIClient contra um servidor HTTP local."""
+    
+    @pytest.fixture(autouse=True)
+    def _no_backoff_sleep(self):
+        """Evita esperas reais entre novas tentativas."""
+        with patch('core.services.bible_api_client.time.sleep') as mock_sleep:
+            self.mock_sleep = mock_sleep
+            yield
+    
+    def test_reuses_pooled_connection(self, stub_http_server):
+        """Testa que requisições consecutivas reutilizam a mesma conexão (keep-alive)."""
+        stub_http_server.add_route("/verses/nvi/gn/1", {"status": 200, "body": {"verses": [{"number": 1, "text": "a"}]}})
+        stub_http_server.add_route("/verses/nvi/gn/2", {"status": 200, "body": {"verses": [{"number": 1, "text": "b"}]}})
+        client = BibleAPIClient(token="abc", base_url=stub_http_server.base_url)
+        
+        client.get_chapter_verses("nvi", "gn", 1)
+        client.get_chapter_verses("nvi", "gn", 2)
+        
+        assert len(stub_http_server.connections) == 1
+        assert stub_http_server.requests[0]["headers"]["Authorization"] == "Bearer abc"
+    
+    def test_retries_transient_status(self, stub_http_server):
+        """Testa novas tentativas em respostas 503 até obter sucesso."""
+        stub_http_server.add_route(
+            "/books",
+            {"status": 503, "body": {"msg": "indisponível"}},
+            {"status": 503, "body": {"msg": "indisponível"}, "headers": {"Retry-After": "1"}},
+            {"status": 200, "body": [{"abbrev": {"pt": "gn"}, "name": "Gênesis", "chapters": 50, "testament": "VT"}]},
+        )
+        client = BibleAPIClient(base_url=stub_http_server.base_url)
+        
+        books = client.get_books()
+        
+        assert books[0]["abbrev"] == "gn"
+        assert stub_http_server.count("/books") == 3
+        assert self.mock_sleep.call_count == 2
+        # A segunda espera respeita o cabeçalho Retry-After
+        assert self.mock_sleep.call_args_list[1][0][0] == 1.0
+    
+    def test_gives_up_after_max_retries(self, stub_http_server):
+        """Testa que o número de tentativas é limitado."""
+        stub_http_server.add_route("/books", {"status": 500, "body": {"msg": "erro"}})
+        client = BibleAPIClient(base_url=stub_http_server.base_url)
+        
+        with pytest.raises(BibleAPIError):
+            client.get_books()
+        
+        assert stub_http_server.count("/books") == BibleAPIClient.MAX_RETRIES + 1
+    
+    def test_client_error_is_not_retried(self, stub_http_server):
+        """Testa que erros 4xx (exceto 429) não são repetidos."""
+        stub_http_server.add_route("/verses/nvi/xx/1", {"status": 404, "body": {"msg": "não encontrado"}})
+        client = BibleAPIClient(base_url=stub_http_server.base_url)
+        
+        with pytest.raises(BibleAPIError):
+            client.get_chapter_verses("nvi", "xx", 1)
+        
+        assert stub_http_server.count("/verses/nvi/xx/1") == 1
+        self.mock_sleep.assert_not_called()
+    
+    def test_read_timeout(self, stub_http_server):
+        """Testa que uma resposta lenta não trava a thread indefinidamente."""
+        stub_http_server.add_route("/books", {"status": 200, "body": [], "delay": 0.5})
+        client = BibleAPIClient(base_url=stub_http_server.base_url)
+        client.READ_TIMEOUT = 0.1
+        client.MAX_RETRIES = 1
+        
+        with pytest.raises(BibleAPIError):
+            client.get_books()
+        
+        stats = client.get_latency_stats()["/books"]
+        assert stats["count"] == 2
+        assert stats["failures"] == 2
+    
+    def test_records_latency_per_endpoint(self, stub_http_server):
+        """Testa o registro de latência agrupado por endpoint."""
+        stub_http_server.add_route("/verses/nvi/gn/1", {"status": 200, "body": {"verses": []}})
+        stub_http_server.add_route("/verses/acf/gn/1", {"status": 200, "body": {"verses": []}})
+        client = BibleAPIClient(base_url=stub_http_server.base_url)
+        
+        client.get_chapter_verses("nvi", "gn", 1)
+        client.get_chapter_verses("acf", "gn", 1)
+        
+        stats = client.get_latency_stats()
+        assert stats["/verses"]["count"] == 2
+        assert stats["/verses"]["avg"] > 0
+    
+    def test_aget_book_limits_concurrency(self, stub_http_server):
+        """Testa que aget_book busca todos os capítulos respeitando o limite de concorrência."""
+        for chapter in range(1, 7):
+            stub_http_server.add_route(
+                f"/verses/nvi/sl/{chapter}",
+                {"status": 200, "body": {"verses": [{"number": 1, "text": f"cap {chapter}"}]}, "delay": 0.05}
+            )
+        client = BibleAPIClient(base_url=stub_http_server.base_url, max_concurrency=2, rate_per_second=1000)
+        in_flight = []
+        active = [0]
+        original = client.get_chapter_verses
+        lock = threading.Lock()
+        
+        def tracking(*args):
+            with lock:
+                active[0] += 1
+                in_flight.append(active[0])
+            try:
+                return original(*args)
+            finally:
+                with lock:
+                    active[0] -= 1
+        
+        client.get_chapter_verses = tracking
+        book = asyncio.run(client.aget_book("nvi", "sl", 6))
+        
+        assert sorted(book) == [1, 2, 3, 4, 5, 6]
+        assert book[3][0]["text"] == "cap 3"
+        assert max(in_flight) <= 2
+    
+    def test_aget_book_reports_failed_chapters(self, stub_http_server):
+        """Testa que capítulos com falha são informados na exceção."""
+        stub_http_server.add_route("/verses/nvi/ob/1", {"status": 200, "body": {"verses": []}})
+        client = BibleAPIClient(base_url=stub_http_server.base_url)
+        
+        with pytest.raises(BibleAPIError, match=r"\[2\]"):
+            asyncio.run(client.aget_book("nvi", "ob", 2))
+
+    def test_circuit_opens_after_consecutive_failures(self, stub_http_server):
+        """Testa que, com o disjuntor aberto, as chamadas falham sem acessar a rede."""
+        stub_http_server.add_route("/verses/nvi/gn/1", {"status": 500, "body": {"msg": "erro"}})
+        client = BibleAPIClient(base_url=stub_http_server.base_url)
+        client.MAX_RETRIES = 0
+        client._schedule_probe = Mock()
+        
+        for _ in range(BibleAPIClient.CIRCUIT_FAILURE_THRESHOLD):
+            with pytest.raises(BibleAPIError):
+                client.get_chapter_verses("nvi", "gn", 1)
+        
+        with pytest.raises(BibleAPIUnavailableError):
+            client.get_chapter_verses("nvi", "gn", 1)
+        assert not client.is_available()
+        client._schedule_probe.assert_called_once()
+        assert stub_http_server.count("/verses/nvi/gn/1") == BibleAPIClient.CIRCUIT_FAILURE_THRESHOLD
+    
+    def test_probe_closes_circuit(self, stub_http_server):
+        """Testa que a sondagem em segundo plano reabre o acesso quando a API responde."""
+        stub_http_server.add_route("/books", {"status": 503, "body": {"msg": "indisponível"}})
+        client = BibleAPIClient(base_url=stub_http_server.base_url)
+        client.MAX_RETRIES = 0
+        client._schedule_probe = Mock()
+        client.circuit_breaker.recovery_timeout = 0
+        for _ in range(BibleAPIClient.CIRCUIT_FAILURE_THRESHOLD):
+            with pytest.raises(BibleAPIError):
+                client.get_books()
+        
+        # Sondagem com a API ainda fora do ar: o disjuntor continua aberto e nova sondagem é agendada
+        client._probe()
+        assert not client.is_available()
+        assert client._schedule_probe.call_count == 2
+        
+        stub_http_server.add_route("/books", {"status": 200, "body": []})
+        client._probe()
+        
+        assert client.is_available()
+        assert client.get_books() == []
+    
+    def test_client_errors_do_not_open_circuit(self, stub_http_server):
+        """Testa que respostas 4xx (a API está no ar) não abrem o disjuntor."""
+        stub_http_server.add_route("/verses/nvi/xx/1", {"status": 404, "body": {"msg": "não encontrado"}})
+        client = BibleAPIClient(base_url=stub_http_server.base_url)
+        
+        for _ in range(BibleAPIClient.CIRCUIT_FAILURE_THRESHOLD + 1):
+            with pytest.raises(BibleAPIError):
+                client.get_chapter_verses("nvi", "xx", 1)
+        
+        assert client.is_available()
+    
+    def test_conditional_request_not_modified(self, stub_http_server):
+        """Testa a revalidação com If-None-Match e a resposta 304."""
+        stub_http_server.add_route(
+            "/verses/nvi/gn/1",
+            {"status": 200, "body": {"verses": [{"number": 1, "text": "a"}]},
+             "headers": {"ETag": '"v1"', "Last-Modified": "Sun, 01 Jan 2023 00:00:00 GMT"}},
+            {"status": 304, "body": ""},
+        )
+        client = BibleAPIClient(base_url=stub_http_server.base_url)
+        
+        verses, validators = client.get_chapter_verses_if_modified("nvi", "gn", 1)
+        assert verses == [{"number": 1, "text": "a"}]
+        assert validators == {"etag": '"v1"', "last_modified": "Sun, 01 Jan 2023 00:00:00 GMT"}
+        
+        verses, current = client.get_chapter_verses_if_modified("nvi", "gn", 1, validators)
+        
+        assert verses is None
+        assert current == validators
+        headers = stub_http_server.requests[-1]["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Sun, 01 Jan 2023 00:00:00 GMT"
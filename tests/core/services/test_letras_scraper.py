@@ -9,15 +9,26 @@ from unittest.mock import Mock, patch, MagicMock
 import requests
 from bs4 import BeautifulSoup
 
-from core.services.letras_scraper import LetrasScraper
+from core.services.letras_scraper import LetrasScraper, benchmark_parsing, main
 from core.exceptions import ScraperError, ScraperNetworkError, ScraperParseError, ValidationError
 
 
+def make_page(noise=50):
+    """Página no formato do Letras.mus.br, com menus, anúncios e scripts ao redor da letra."""
+    nav = "".join(f'<li class="menu-item"><a href="/g/{i}">Gênero {i}</a></li>' for i in range(noise))
+    scripts = "".join(f'<script>dataLayer.push({{"ev": {i}}});</script>' for i in range(noise))
+    ads = "".join(f'<div class="ad-slot"><span>Publicidade {i}</span></div>' for i in range(noise))
+    return f"""<html><head>{scripts}</head><body><nav><ul>{nav}</ul></nav>{ads}
+    <div class="cnt-head"><div class="title-content"><h1 class="textStyle-primary">Hino Teste</h1>
+    <h2 class="textStyle-secondary"><a href="/coral/">Coral Teste</a></h2></div></div>
+    <div class="lyric"><div class="lyric-original"><p>Linha 1<br>Linha 2</p><p>Linha 3</p>
+    <div class="send-lyrics">Enviar</div></div></div><footer>{nav}</footer></body></html>"""
+
+
 class TestLetrasScraper:
     """Testes para a classe LetrasScraper."""
     
-    @patch('core.services.letras_scraper.requests.get')
-    def test_fetch_lyrics_success(self, mock_get):
+    def test_fetch_lyrics_success(self):
         """Testa buscar letra com sucesso."""
         # Mock de HTML válido
         html_content = """
@@ -38,9 +49,11 @@ class TestLetrasScraper:
         mock_response = Mock()
         mock_response.text = html_content
         mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-        
-        scraper = LetrasScraper()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        scraper = LetrasScraper(session=Mock())
+        scraper.session.get.return_value = mock_response
+
         result = scraper.fetch_lyrics_from_url("https://www.letras.mus.br/artista/musica")
         
         assert result is not None
@@ -49,16 +62,15 @@ class TestLetrasScraper:
         assert 'lyrics_full' in result
         assert len(result['lyrics_full']) > 0
     
-    @patch('core.services.letras_scraper.requests.get')
-    def test_fetch_lyrics_network_error(self, mock_get):
+    def test_fetch_lyrics_network_error(self):
         """Testa erro de rede ao buscar letra."""
         # Mock de erro de rede
-        mock_get.side_effect = requests.exceptions.RequestException("Network error")
-        
-        scraper = LetrasScraper()
+        scraper = LetrasScraper(session=Mock())
+        scraper.session.get.side_effect = requests.exceptions.RequestException("Network error")
         
         with pytest.raises(ScraperNetworkError):
             scraper.fetch_lyrics_from_url("https://www.letras.mus.br/artista/musica")
+        assert scraper.get_latency_stats()["/letra"]["failures"] == 1
     
     def test_fetch_lyrics_invalid_url(self):
         """Testa URL inválida."""
@@ -67,8 +79,7 @@ class TestLetrasScraper:
         with pytest.raises(ValidationError):
             scraper.fetch_lyrics_from_url("invalid-url")
     
-    @patch('core.services.letras_scraper.requests.get')
-    def test_fetch_lyrics_parse_error(self, mock_get):
+    def test_fetch_lyrics_parse_error(self):
         """Testa erro ao fazer parse do HTML."""
         # Mock de HTML sem elementos esperados
         html_content = "<html><body><p>Conteúdo sem estrutura esperada</p></body></html>"
@@ -76,10 +87,116 @@ class TestLetrasScraper:
         mock_response = Mock()
         mock_response.text = html_content
         mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        scraper = LetrasScraper(session=Mock())
+        scraper.session.get.return_value = mock_response
+        
+        with pytest.raises(ScraperParseError):
+            scraper.fetch_lyrics_from_url("https://www.letras.mus.br/artista/musica")
+    
+    def test_reuses_pooled_connection(self, stub_http_server):
+        """Testa que importações seguidas reutilizam a mesma conexão (keep-alive)."""
+        html_content = '<div class="title-content"><h1 class="textStyle-primary">Hino</h1></div>' \
+                       '<div class="lyric-original"><p>Estrofe</p></div>'
+        stub_http_server.add_route("/artista/musica", {"status": 200, "body": html_content,
+                                                       "headers": {"Content-Type": "text/html"}})
+        scraper = LetrasScraper(page_cache=None)
+        url = f"{stub_http_server.base_url}/artista/musica"
+        
+        with patch('core.services.letras_scraper.validate_url', side_effect=lambda value, **kwargs: value):
+            for _ in range(3):
+                assert scraper.fetch_lyrics_from_url(url)["title"] == "Hino"
+        scraper.close()
+        
+        assert len(stub_http_server.connections) == 1
+        headers = stub_http_server.requests[0]["headers"]
+        assert "gzip" in headers["Accept-Encoding"]
+        assert headers["User-Agent"] == LetrasScraper.USER_AGENT
+        assert scraper.get_latency_stats()["/letra"]["count"] == 3
+    
+    def test_parse_page_only_keeps_lyric_regions(self):
+        """Testa que menus, anúncios e scripts ficam fora da árvore analisada."""
+        scraper = LetrasScraper(session=Mock())
+        html = make_page()
         
+        regions = str(scraper._parse_regions(html))
+        result = scraper.parse_page(html)
+        
+        assert "Publicidade" not in regions and "dataLayer" not in regions
+        assert result == {"title": "Hino Teste", "artist": "Coral Teste",
+                          "lyrics_full": "Linha 1\nLinha 2\n\nLinha 3"}
+    
+    def test_parse_page_falls_back_to_full_page(self):
+        """Testa que, se as regiões conhecidas mudarem, a página inteira é analisada."""
+        scraper = LetrasScraper(session=Mock())
+        
+        with patch.object(LetrasScraper, 'REGION_CLASSES', ['classe-que-nao-existe']):
+            result = scraper.parse_page(make_page())
+        
+        assert result["lyrics_full"] == "Linha 1\nLinha 2\n\nLinha 3"
+    
+    def test_benchmark_command(self, tmp_path, capsys):
+        """Testa o benchmark de análise sobre páginas salvas."""
+        page = tmp_path / "hino.html"
+        page.write_text(make_page(), encoding="utf-8")
+        
+        assert benchmark_parsing([make_page()], repeat=1)["pages"] == 1
+        assert main([str(page), "--repeat", "1"]) == 0
+        assert "ms/página" in capsys.readouterr().out
+    
+    def test_cached_page_is_not_downloaded_again(self):
+        """Testa que reimportar a mesma música (com outra forma da URL) usa o cache."""
+        mock_response = Mock(status_code=200, text=make_page(), headers={"ETag": '"p1"'})
+        scraper = LetrasScraper(session=Mock())
+        scraper.session.get.return_value = mock_response
+        
+        first = scraper.fetch_lyrics_from_url("https://www.letras.mus.br/coral/hino/")
+        second = scraper.fetch_lyrics_from_url("https://www.letras.mus.br/coral/hino?origem=busca")
+        
+        assert first == second
+        assert scraper.session.get.call_count == 1
+        assert scraper.parse_cached_page("https://www.letras.mus.br/coral/hino")["title"] == "Hino Teste"
+        assert scraper.parse_cached_page("https://www.letras.mus.br/coral/outro/") is None
+    
+    def test_stale_page_is_revalidated(self, stub_http_server):
+        """Testa a revalidação condicional (304) e o uso do cache com o site inacessível."""
+        stub_http_server.add_route(
+            "/coral/hino/",
+            {"status": 200, "body": make_page(), "headers": {"Content-Type": "text/html", "ETag": '"p1"'}},
+            {"status": 304, "body": ""},
+        )
+        url = f"{stub_http_server.base_url}/coral/hino/"
         scraper = LetrasScraper()
+        scraper.page_cache.ttl_seconds = 0
         
+        with patch('core.services.letras_scraper.validate_url', side_effect=lambda value, **kwargs: value):
+            scraper.fetch_lyrics_from_url(url)
+            result = scraper.fetch_lyrics_from_url(url)
+            assert stub_http_server.requests[-1]["headers"]["If-None-Match"] == '"p1"'
+            assert result["title"] == "Hino Teste"
+            
+            scraper.session.get = Mock(side_effect=requests.exceptions.ConnectionError("sem rede"))
+            assert scraper.fetch_lyrics_from_url(url)["title"] == "Hino Teste"
+        assert stub_http_server.count("/coral/hino/") == 2
+    
+    def test_parse_artist_page(self):
+        """Testa listar as músicas da página do artista, sem subpáginas nem links externos."""
+        html = """<div class="title-content"><h1 class="textStyle-primary">Coral Teste</h1></div>
+        <ul><li class="songList-table-row"><a class="songList-table-songName" href="/coral/hino-1/">Hino 1</a></li>
+        <li class="songList-table-row"><a class="songList-table-songName" href="/coral/hino-2/">Hino 2</a></li>
+        <li class="songList-table-row"><a class="songList-table-songName" href="/coral/hino-1/#letra">Hino 1</a></li>
+        <li class="songList-table-row"><a class="songList-table-songName" href="/coral/discografia/">Discos</a></li>
+        <li class="songList-table-row"><a class="songList-table-songName" href="/outro/hino/">Outro</a></li></ul>"""
+        scraper = LetrasScraper(session=Mock())
+        
+        page = scraper.parse_artist_page(html, "https://www.letras.mus.br/coral/")
+        
+        assert page["artist"] == "Coral Teste"
+        assert page["songs"] == [
+            {"title": "Hino 1", "url": "https://www.letras.mus.br/coral/hino-1/"},
+            {"title": "Hino 2", "url": "https://www.letras.mus.br/coral/hino-2/"},
+        ]
         with pytest.raises(ScraperParseError):
-            scraper.fetch_lyrics_from_url("https://www.letras.mus.br/artista/musica")
+            scraper.parse_artist_page("<html></html>", "https://www.letras.mus.br/coral/")
 
@@ -0,0 +1,103 @@
+"""
+Testes para o catálogo da Bíblia.
+
+Este módulo contém testes unitários para o BibleCatalog e para o uso do
+catálogo pelo BibleManager (menus preenchidos sem acessar a API).
+"""
+
+import json
+import pytest
+from unittest.mock import patch, Mock
+
+from core.bible_catalog import BibleCatalog
+from core.bible_manager import BibleManager
+from core.paths import BIBLE_CATALOG_PATH
+
+
+@pytest.fixture
+def catalog():
+    """Catálogo distribuído com o projeto."""
+    return BibleCatalog.load(BIBLE_CATALOG_PATH)
+
+
+class TestBibleCatalog:
+    """Testes para a classe BibleCatalog."""
+
+    def test_shipped_catalog(self, catalog):
+        """Testa o catálogo distribuído: 66 livros e contagens conhecidas."""
+        assert len(catalog.books) == 66
+        assert catalog.books[0] == {"abbrev": "gn", "name": "Gênesis", "testament": "VT", "chapters": 50}
+        assert catalog.verse_count("jo", 3) == 36
+        assert catalog.verse_count("SL", 119) == 176
+        assert catalog.verse_count("ap", 22) == 21
+
+    def test_every_book_has_a_count_per_chapter(self, catalog):
+        """Testa que cada livro tem uma contagem para cada capítulo."""
+        for book in catalog.books:
+            assert catalog.verse_count(book["abbrev"], book["chapters"]) is not None
+            assert catalog.verse_count(book["abbrev"], book["chapters"] + 1) is None
+
+    def test_unknown_book_or_chapter(self, catalog):
+        """Testa que livros e capítulos fora do catálogo retornam None."""
+        assert catalog.verse_count("xx", 1) is None
+        assert catalog.verse_count("jo", 0) is None
+
+    def test_learned_count_overrides_catalog_per_version(self, catalog):
+        """Testa que a numeração observada vale apenas para a versão em que foi vista."""
+        catalog.learn("NVI", "mt", 17, 26)
+
+        assert catalog.verse_count("mt", 17, "nvi") == 26
+        assert catalog.verse_count("mt", 17, "acf") == 27
+        assert catalog.verse_count("mt", 17) == 27
+
+    @pytest.mark.parametrize("content", [None, "{}", json.dumps({"format": 99, "books": []})])
+    def test_missing_or_incompatible_file(self, tmp_path, content):
+        """Testa que um arquivo ausente ou de outro formato resulta em catálogo vazio."""
+        path = tmp_path / "catalog.json"
+        if content is not None:
+            path.write_text(content, encoding="utf-8")
+
+        catalog = BibleCatalog.load(path)
+
+        assert not catalog
+        assert catalog.verse_count("jo", 3) is None
+
+
+class TestBibleManagerCatalog:
+    """Testes para o uso do catálogo pelo BibleManager."""
+
+    def test_verse_count_without_network(self, tmp_path):
+        """Testa que a contagem de versículos não consulta a API."""
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = Mock()
+
+            assert manager.get_verse_count("nvi", "jo", 3) == 36
+            manager.api_client.get_chapter_verses.assert_not_called()
+
+    def test_verse_count_learned_from_fetched_chapter(self, tmp_path):
+        """Testa que a numeração real do capítulo corrige o catálogo."""
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = Mock()
+            manager.api_client.get_chapter_verses.return_value = [
+                {"number": n, "text": f"texto {n}"} for n in range(1, 27) if n != 21
+            ]
+
+            manager.get_chapter_verses("nvi", "mt", 17)
+
+            assert manager.get_verse_count("nvi", "mt", 17) == 26
+            assert manager.get_verse_count("acf", "mt", 17) == 27
+
+    def test_load_books_falls_back_to_catalog(self, tmp_path):
+        """Testa que, sem cache e sem API, a lista de livros vem do catálogo."""
+        with patch('core.bible_manager.BIBLE_BOOKS_CACHE_PATH', str(tmp_path / "books.json")):
+            manager = BibleManager()
+            manager.api_client = Mock()
+            manager.api_client.get_books.side_effect = Exception("sem conexão")
+
+            books = manager.load_books()
+
+            assert len(books) == 66
+            assert manager.get_book_by_name("João")["abbrev"] == "jo"
+            assert manager.get_book_by_abbrev("sl")["chapters"] == 150
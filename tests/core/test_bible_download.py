@@ -0,0 +1,137 @@
+"""
+Testes para o download de versões da Bíblia.
+
+Este módulo contém testes unitários para o BibleDownloadJob: download
+completo, retomada, falhas, cancelamento e limite de concorrência.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch, Mock
+
+from core.bible_download import BibleDownloadJob, main
+from core.bible_store import BibleStore
+from core.exceptions import BibleAPIError
+
+
+BOOKS = [{"abbrev": "ob", "name": "Obadias", "chapters": 1}, {"abbrev": "jn", "name": "Jonas", "chapters": 4}]
+
+
+class FakeClient:
+    """Cliente assíncrono que registra as chamadas e a concorrência máxima."""
+
+    def __init__(self, failing=(), delay=0.0):
+        self.calls = []
+        self.failing = set(failing)
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def aget_chapter_verses(self, version, book, chapter):
+        self.calls.append((version, book, chapter))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if (book, chapter) in self.failing:
+                raise BibleAPIError("falha")
+            return [{"number": 1, "text": f"{book} {chapter}"}]
+        finally:
+            self.active -= 1
+
+
+def make_job(tmp_path, client, **kwargs):
+    kwargs.setdefault("rate_per_second", 1000)
+    return BibleDownloadJob(client, BibleStore(tmp_path / "bible"), "NVI", BOOKS, **kwargs)
+
+
+class TestBibleDownloadJob:
+    """Testes para a classe BibleDownloadJob."""
+
+    def test_downloads_every_chapter(self, tmp_path):
+        """Testa que todos os capítulos são gravados e o andamento é registrado."""
+        client = FakeClient()
+        updates = []
+        job = make_job(tmp_path, client, on_progress=updates.append)
+
+        progress = job.run()
+
+        assert progress.finished and not progress.failed
+        assert (progress.completed, progress.total) == (5, 5)
+        assert job.store.get_chapter("nvi", "jn", 4) == [{"number": 1, "text": "jn 4"}]
+        assert updates[-1].completed == 5
+        assert json.loads(job.progress_path.read_text(encoding="utf-8"))["finished"] is True
+
+    def test_resumes_where_it_stopped(self, tmp_path):
+        """Testa que capítulos já armazenados não são baixados de novo."""
+        store = BibleStore(tmp_path / "bible")
+        store.save_chapter("nvi", "ob", 1, [{"number": 1, "text": "já salvo"}])
+        store.save_chapter("nvi", "jn", 1, [{"number": 1, "text": "já salvo"}])
+        client = FakeClient()
+
+        progress = make_job(tmp_path, client).run()
+
+        assert sorted(client.calls) == [("nvi", "jn", 2), ("nvi", "jn", 3), ("nvi", "jn", 4)]
+        assert progress.skipped == 2
+        assert progress.completed == 5
+
+    def test_failed_chapters_are_retried_next_run(self, tmp_path):
+        """Testa que falhas são registradas e o capítulo fica pendente."""
+        progress = make_job(tmp_path, FakeClient(failing={("jn", 2)})).run()
+
+        assert progress.failed == [("jn", 2)]
+        assert not progress.finished
+
+        client = FakeClient()
+        progress = make_job(tmp_path, client).run()
+
+        assert client.calls == [("nvi", "jn", 2)]
+        assert progress.finished
+
+    def test_bounded_concurrency(self, tmp_path):
+        """Testa que não há mais requisições simultâneas que o permitido."""
+        client = FakeClient(delay=0.01)
+
+        make_job(tmp_path, client, max_concurrency=2).run()
+
+        assert client.max_active == 2
+
+    def test_cancel(self, tmp_path):
+        """Testa que o cancelamento interrompe o download e mantém o que foi gravado."""
+        client = FakeClient()
+        job = make_job(tmp_path, client, max_concurrency=1)
+        job.on_progress = lambda progress: job.cancel() if progress.completed >= 2 else None
+
+        progress = job.run()
+
+        assert progress.cancelled
+        assert progress.completed == 2
+        assert job.pending_chapters() == [("jn", 2), ("jn", 3), ("jn", 4)]
+
+
+class TestBibleDownloadCli:
+    """Testes para a linha de comando."""
+
+    def test_download_selected_books(self, tmp_path, capsys):
+        """Testa o download de livros escolhidos pela linha de comando."""
+        client = FakeClient()
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"), \
+             patch('core.bible_manager.BibleAPIClient', return_value=client), \
+             patch('core.bible_manager.BibleManager.load_books', return_value=BOOKS):
+            exit_code = main(["nvi", "--books", "ob", "--rate", "1000"])
+
+        assert exit_code == 0
+        assert client.calls == [("nvi", "ob", 1)]
+        assert "1/1 capítulos" in capsys.readouterr().out
+
+    def test_failures_return_error_code(self, tmp_path, capsys):
+        """Testa que falhas resultam em código de saída 1."""
+        client = FakeClient(failing={("ob", 1)})
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"), \
+             patch('core.bible_manager.BibleAPIClient', return_value=client), \
+             patch('core.bible_manager.BibleManager.load_books', return_value=BOOKS):
+            exit_code = main(["nvi", "--books", "ob", "--rate", "1000"])
+
+        assert exit_code == 1
+        assert "rode novamente" in capsys.readouterr().err
@@ -5,10 +5,11 @@ Este módulo contém testes unitários para todas as funcionalidades do BibleMan
 """
 
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, MagicMock, AsyncMock
 from pathlib import Path
 import json
 import tempfile
+import asyncio
 
 from core.bible_manager import BibleManager
 from core.exceptions import BibleAPIError
@@ -105,3 +106,354 @@ class TestBibleManager:
             assert len(versions) == 1
             assert versions[0]['version'] == "nvi"
 
+    
+    def test_get_chapter_verses_uses_cache(self, mock_api_client, tmp_path):
+        """Testa que um capítulo lido uma vez é servido pelo cache."""
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = mock_api_client
+            
+            first = manager.get_chapter_verses("nvi", "gn", 1)
+            second = manager.get_chapter_verses("NVI", "gn", 1)
+            
+            assert first == second
+            mock_api_client.get_chapter_verses.assert_called_once_with("nvi", "gn", 1)
+            stats = manager.get_cache_stats()
+            assert stats["memory_hits"] == 1
+            assert stats["misses"] == 1
+    
+    def test_get_chapter_verses_persists_to_disk(self, mock_api_client, tmp_path):
+        """Testa que o cache em disco sobrevive a uma nova instância."""
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = mock_api_client
+            manager.get_chapter_verses("nvi", "gn", 1)
+            
+            other = BibleManager()
+            other.api_client = Mock()
+            verses = other.get_chapter_verses("nvi", "gn", 1)
+            
+            assert len(verses) == 2
+            other.api_client.get_chapter_verses.assert_not_called()
+            assert other.get_cache_stats()["disk_hits"] == 1
+    
+    def test_get_chapter_verses_does_not_cache_empty(self, tmp_path):
+        """Testa que respostas vazias não são armazenadas no cache."""
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = Mock()
+            manager.api_client.get_chapter_verses.return_value = []
+            
+            manager.get_chapter_verses("nvi", "gn", 1)
+            manager.get_chapter_verses("nvi", "gn", 1)
+            
+            assert manager.api_client.get_chapter_verses.call_count == 2
+    
+    def test_get_chapter_verses_api_error(self, tmp_path):
+        """Testa que erros da API são propagados quando não há cache."""
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = Mock()
+            manager.api_client.get_chapter_verses.side_effect = BibleAPIError("falha")
+            
+            with pytest.raises(BibleAPIError):
+                manager.get_chapter_verses("nvi", "gn", 1)
+    
+    def test_get_adjacent_chapters(self, mock_api_client, tmp_path):
+        """Testa a lista de capítulos vizinhos, incluindo livros vizinhos."""
+        cache_file = tmp_path / "bible_books_cache.json"
+        cache_file.write_text(json.dumps(mock_api_client.get_books.return_value))
+        
+        with patch('core.bible_manager.BIBLE_BOOKS_CACHE_PATH', str(cache_file)):
+            manager = BibleManager()
+            manager.load_books()
+            
+            assert manager.get_adjacent_chapters("gn", 3) == [("gn", 4), ("gn", 2), ("ex", 1)]
+            assert manager.get_adjacent_chapters("ex", 1) == [("ex", 2), ("gn", 1)]
+            assert manager.get_adjacent_chapters("xxx", 1) == []
+    
+    def test_prefetch_adjacent_chapters(self, mock_api_client, tmp_path):
+        """Testa que os capítulos vizinhos são carregados no cache em segundo plano."""
+        cache_file = tmp_path / "bible_books_cache.json"
+        cache_file.write_text(json.dumps(mock_api_client.get_books.return_value))
+        
+        with patch('core.bible_manager.BIBLE_BOOKS_CACHE_PATH', str(cache_file)), \
+             patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"), \
+             patch.object(BibleManager, 'PREFETCH_DELAY_SECONDS', 0):
+            manager = BibleManager()
+            manager.api_client = mock_api_client
+            manager.load_books()
+            
+            futures = manager.prefetch_adjacent_chapters("nvi", "gn", 3)
+            for future in futures:
+                future.result(timeout=5)
+            
+            assert len(futures) == 3
+            manager.get_chapter_verses("nvi", "gn", 4)
+            assert manager.get_cache_stats()["memory_hits"] == 1
+            manager.shutdown()
+    
+    def test_prefetch_skips_cached_chapters_off_the_caller_thread(self, mock_api_client, tmp_path):
+        """Testa que capítulos já em cache não são buscados e que o cache é consultado na tarefa."""
+        import threading
+        cache_file = tmp_path / "bible_books_cache.json"
+        cache_file.write_text(json.dumps(mock_api_client.get_books.return_value))
+
+        with patch('core.bible_manager.BIBLE_BOOKS_CACHE_PATH', str(cache_file)), \
+             patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"), \
+             patch.object(BibleManager, 'PREFETCH_DELAY_SECONDS', 0):
+            manager = BibleManager()
+            manager.api_client = mock_api_client
+            manager.load_books()
+            manager.get_chapter_verses("nvi", "gn", 4)
+            mock_api_client.get_chapter_verses.reset_mock()
+            caller = threading.current_thread()
+            original_contains = manager.chapter_cache.contains
+            checked_in = []
+
+            def tracking_contains(key):
+                checked_in.append(threading.current_thread())
+                return original_contains(key)
+
+            manager.chapter_cache.contains = tracking_contains
+            for future in manager.prefetch_adjacent_chapters("nvi", "gn", 3):
+                future.result(timeout=5)
+            manager.shutdown()
+
+            assert caller not in checked_in
+            fetched = [c.args for c in mock_api_client.get_chapter_verses.call_args_list]
+            assert ("nvi", "gn", 4) not in fetched
+            assert len(fetched) == 2
+
+    def test_prefetch_is_cancelled_when_selection_changes(self, mock_api_client, tmp_path):
+        """Testa que uma nova seleção cancela os pré-carregamentos anteriores."""
+        cache_file = tmp_path / "bible_books_cache.json"
+        cache_file.write_text(json.dumps(mock_api_client.get_books.return_value))
+        
+        with patch('core.bible_manager.BIBLE_BOOKS_CACHE_PATH', str(cache_file)), \
+             patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"), \
+             patch.object(BibleManager, 'PREFETCH_DELAY_SECONDS', 30):
+            manager = BibleManager()
+            manager.api_client = mock_api_client
+            manager.load_books()
+            
+            old_futures = manager.prefetch_adjacent_chapters("nvi", "gn", 3)
+            manager.cancel_prefetch()
+            for future in old_futures:
+                if not future.cancelled():
+                    future.result(timeout=5)
+            
+            mock_api_client.get_chapter_verses.assert_not_called()
+            manager.shutdown()
+
+    def test_request_chapter_verses_delivers_only_latest(self, tmp_path):
+        """Testa que apenas a seleção mais recente chega ao callback."""
+        import threading
+        release = threading.Event()
+
+        def fake_get_chapter(version, book, chapter):
+            if chapter == 1:
+                release.wait(5)
+            return [{"number": 1, "text": f"capítulo {chapter}"}]
+
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = Mock()
+            manager.api_client.get_chapter_verses.side_effect = fake_get_chapter
+            delivered = []
+            done = threading.Event()
+
+            def callback(ticket, verses, error):
+                delivered.append((ticket, verses, error))
+                done.set()
+
+            old_ticket = manager.request_chapter_verses("nvi", "gn", 1, callback)
+            new_ticket = manager.request_chapter_verses("nvi", "gn", 2, callback)
+            assert done.wait(5)
+            release.set()
+            manager.shutdown()
+
+            assert not manager.is_current_request(old_ticket)
+            assert delivered == [(new_ticket, [{"number": 1, "text": "capítulo 2"}], None)]
+
+    def test_request_chapter_verses_coalesces_identical_requests(self, tmp_path):
+        """Testa que seleções repetidas do mesmo capítulo geram uma única busca."""
+        import threading
+        release = threading.Event()
+        done = threading.Event()
+
+        def fake_get_chapter(version, book, chapter):
+            release.wait(5)
+            return [{"number": 1, "text": "texto"}]
+
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = Mock()
+            manager.api_client.get_chapter_verses.side_effect = fake_get_chapter
+
+            manager.request_chapter_verses("nvi", "gn", 1, lambda *args: None)
+            manager.request_chapter_verses("nvi", "gn", 1, lambda *args: done.set())
+            release.set()
+            assert done.wait(5)
+            manager.shutdown()
+
+            manager.api_client.get_chapter_verses.assert_called_once_with("nvi", "gn", 1)
+
+    def test_load_book_async(self, mock_api_client, tmp_path):
+        """Testa carregar um livro inteiro no loop assíncrono usando o cache."""
+        cache_file = tmp_path / "bible_books_cache.json"
+        books = [{"abbrev": {"pt": "ob", "en": "oba"}, "name": "Obadias", "chapters": 3, "testament": "VT"}]
+        cache_file.write_text(json.dumps(books))
+        
+        with patch('core.bible_manager.BIBLE_BOOKS_CACHE_PATH', str(cache_file)), \
+             patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = mock_api_client
+            mock_api_client.aget_chapter_verses = AsyncMock(return_value=[{"number": 1, "text": "x"}])
+            manager.get_chapter_verses("nvi", "ob", 1)  # Capítulo 1 já em cache
+            received = []
+            writes_on_loop = []
+            remember = manager._remember_chapter
+            
+            def tracking_remember(*args, **kwargs):
+                # A gravação dos capítulos (E/S de arquivo) não pode rodar na thread do loop
+                try:
+                    asyncio.get_running_loop()
+                    writes_on_loop.append(args[0])
+                except RuntimeError:
+                    pass
+                return remember(*args, **kwargs)
+            
+            manager._remember_chapter = tracking_remember
+            future = manager.load_book_async("nvi", "ob", lambda result, error: received.append((result, error)))
+            chapters = future.result(timeout=5)
+            manager.shutdown()
+            
+            assert sorted(chapters) == [1, 2, 3]
+            assert mock_api_client.aget_chapter_verses.await_count == 2
+            assert received[0][1] is None
+            assert writes_on_loop == []
+            # A leitura do cache feita pelo carregamento em lote não altera os contadores
+            assert manager.get_cache_stats()["misses"] == 1
+    
+    def test_aload_book_unknown_book(self, tmp_path):
+        """Testa que um livro inexistente gera BibleAPIError."""
+        cache_file = tmp_path / "bible_books_cache.json"
+        cache_file.write_text(json.dumps([{"abbrev": "gn", "name": "Gênesis", "chapters": 50}]))
+        
+        with patch('core.bible_manager.BIBLE_BOOKS_CACHE_PATH', str(cache_file)):
+            manager = BibleManager()
+            
+            with pytest.raises(BibleAPIError):
+                asyncio.run(manager.aload_book("nvi", "xx"))
+
+    def test_get_parallel_chapter_fetches_versions_concurrently(self, tmp_path):
+        """Testa que as versões são buscadas ao mesmo tempo e passam pelo cache."""
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_get_chapter(version, book, chapter):
+            # Só passa da barreira se as duas versões estiverem sendo buscadas juntas
+            barrier.wait()
+            return [{"number": 1, "text": f"{version} 1"}, {"number": 2, "text": f"{version} 2"}]
+
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = Mock()
+            manager.api_client.get_chapter_verses.side_effect = fake_get_chapter
+
+            chapters = manager.get_parallel_chapter(["nvi", "acf"], "gn", 1)
+            again = manager.get_parallel_chapter(["nvi", "acf"], "gn", 1)
+            manager.shutdown()
+
+            assert list(chapters) == ["nvi", "acf"]
+            assert chapters["acf"][0]["text"] == "acf 1"
+            assert again == chapters
+            assert manager.api_client.get_chapter_verses.call_count == 2
+
+    def test_join_parallel_verses(self):
+        """Testa a junção por número de versículo, com versículos ausentes em uma versão."""
+        joined = BibleManager.join_parallel_verses({
+            "nvi": [{"number": 1, "text": "a1"}, {"number": 2, "text": "a2"}],
+            "acf": [{"number": 1, "text": "b1"}, {"number": 3, "text": "b3"}],
+        })
+
+        assert joined == [(1, ["a1", "b1"]), (2, ["a2", None]), (3, [None, "b3"])]
+
+    def test_request_parallel_chapter(self, mock_api_client, tmp_path):
+        """Testa que o pedido paralelo entrega um dict versão → versículos."""
+        import threading
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = mock_api_client
+            received = {}
+            done = threading.Event()
+
+            def callback(ticket, chapters, error):
+                received.update(chapters=chapters, error=error)
+                done.set()
+
+            manager.request_parallel_chapter(["NVI", "acf"], "gn", 1, callback)
+            assert done.wait(5)
+            manager.shutdown()
+
+            assert received["error"] is None
+            assert list(received["chapters"]) == ["nvi", "acf"]
+
+
+    def test_offline_fallback_when_circuit_is_open(self, tmp_path):
+        """Testa que, com a API fora do ar, capítulos salvos são servidos sem acessar a rede."""
+        from core.exceptions import BibleAPIUnavailableError
+        from core.services.bible_api_client import BibleAPIClient
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.api_client = BibleAPIClient(session=MagicMock())
+            manager.api_client._schedule_probe = Mock()
+            manager.bible_store.save_chapter("nvi", "jo", 3, [{"number": 16, "text": "Porque Deus..."}])
+            for _ in range(BibleAPIClient.CIRCUIT_FAILURE_THRESHOLD):
+                manager.api_client.circuit_breaker.record_failure()
+            
+            assert manager.api_status() == "open"
+            assert manager.get_chapter_verses("nvi", "jo", 3)[0]["number"] == 16
+            with pytest.raises(BibleAPIUnavailableError):
+                manager.get_chapter_verses("nvi", "jo", 4)
+            manager.api_client.session.get.assert_not_called()
+    
+    def test_stale_chapter_is_served_and_revalidated(self, mock_api_client, tmp_path):
+        """Testa que um capítulo vencido é servido na hora e revalidado com GET condicional."""
+        with patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+            manager = BibleManager()
+            manager.chapter_cache.disk.set(("nvi", "gn", 1), [{"number": 1, "text": "antigo"}], {"etag": '"v1"'})
+            manager.api_client = mock_api_client
+            mock_api_client.get_chapter_verses_if_modified.return_value = (None, {"etag": '"v1"'})
+            
+            with patch('core.utils.cache.time.time', return_value=10 ** 11):
+                verses = manager.get_chapter_verses("nvi", "gn", 1)
+                manager.fetch_coordinator.fetch(("revalidate", "nvi", "gn", 1), Mock()).result(timeout=5)
+            
+            assert verses == [{"number": 1, "text": "antigo"}]
+            mock_api_client.get_chapter_verses_if_modified.assert_called_once_with("nvi", "gn", 1, {"etag": '"v1"'})
+            mock_api_client.get_chapter_verses.assert_not_called()
+            manager.shutdown()
+    
+    def test_stale_books_cache_is_revalidated(self, sample_bible_data, tmp_path, monkeypatch):
+        """Testa que a lista de livros no formato antigo é usada e atualizada em segundo plano."""
+        monkeypatch.setattr(BibleManager, "BOOKS_CACHE_TTL_SECONDS", 0)
+        cache_file = tmp_path / "bible_books_cache.json"
+        cache_file.write_text(json.dumps([sample_bible_data]))
+        updated = dict(sample_bible_data, name="Gênesis (revisado)")
+        
+        with patch('core.bible_manager.BIBLE_BOOKS_CACHE_PATH', str(cache_file)):
+            manager = BibleManager()
+            manager.api_client = Mock()
+            manager.api_client.get_books_if_modified.return_value = ([updated], {"etag": '"b2"', "last_modified": None})
+            
+            books = manager.load_books()
+            assert books[0]['name'] == "Gênesis"
+            manager._schedule_books_revalidation({}).result(timeout=5)
+            
+            manager.api_client.get_books.assert_not_called()
+            assert manager.get_book_by_abbrev("gn")['name'] == "Gênesis (revisado)"
+            saved = json.loads(cache_file.read_text(encoding="utf-8"))
+            assert saved["etag"] == '"b2"' and saved["books"] == [updated]
+            manager.shutdown()
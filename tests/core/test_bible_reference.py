@@ -0,0 +1,140 @@
+"""
+Testes para o parser de referências bíblicas.
+
+Este módulo contém testes unitários para a normalização de apelidos de
+livros, a interpretação de referências e a resolução pelo BibleManager.
+"""
+
+import pytest
+from unittest.mock import patch, Mock
+
+from core.bible_manager import BibleManager
+from core.bible_reference import BibleReference, format_parallel_slide, normalize_book_alias, parse_references
+from core.exceptions import BibleReferenceError
+from core.paths import BIBLE_BOOKS_CACHE_PATH
+
+
+BOOKS = {
+    "jo": {"abbrev": "jo", "name": "João", "chapters": 21},
+    "sl": {"abbrev": "sl", "name": "Salmos", "chapters": 150},
+    "1co": {"abbrev": "1co", "name": "1ª Coríntios", "chapters": 16},
+}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """BibleManager com a lista de livros distribuída junto com o projeto."""
+    with patch('core.bible_manager.BIBLE_BOOKS_CACHE_PATH', str(BIBLE_BOOKS_CACHE_PATH)), \
+         patch('core.bible_manager.BIBLE_CHAPTER_CACHE_DIR', tmp_path / "chapters"):
+        bible_manager = BibleManager()
+        bible_manager.api_client = Mock()
+        bible_manager.load_books()
+        yield bible_manager
+
+
+class TestNormalizeBookAlias:
+    """Testes para normalize_book_alias."""
+
+    @pytest.mark.parametrize("alias", ["1ª Coríntios", "1a corintios", "I Coríntios", "primeira coríntios", "1 Coríntios"])
+    def test_ordinals_share_the_same_key(self, alias):
+        """Testa que as formas de ordinal resultam na mesma chave."""
+        assert normalize_book_alias(alias) == "1corintios"
+
+    def test_abbreviation_spacing(self):
+        """Testa que "1 Co" e "1Co" são equivalentes."""
+        assert normalize_book_alias("1 Co") == normalize_book_alias("1Co") == "1co"
+
+    def test_fold_is_optional(self):
+        """Testa que os acentos podem ser preservados."""
+        assert normalize_book_alias("Jó", fold=False) == "jó"
+        assert normalize_book_alias("Jó") == "jo"
+
+
+class TestParseReferences:
+    """Testes para parse_references."""
+
+    def test_multiple_references(self):
+        """Testa uma lista de referências separadas por ";"."""
+        references = parse_references("Jo 3:16-18; Sl 23; 1Co 13", lambda text: BOOKS.get(text.lower()))
+
+        assert references == [
+            BibleReference("jo", "João", 3, 16, 18),
+            BibleReference("sl", "Salmos", 23),
+            BibleReference("1co", "1ª Coríntios", 13),
+        ]
+        assert references[0].label == "João 3:16-18"
+        assert references[1].label == "Salmos 23"
+
+    def test_single_verse_and_dot_separator(self):
+        """Testa versículo único com "." como separador."""
+        reference = parse_references("jo 3.16", lambda text: BOOKS.get(text.lower()))[0]
+
+        assert reference.includes(16)
+        assert not reference.includes(17)
+        assert reference.label == "João 3:16"
+
+    @pytest.mark.parametrize("text", ["", "Jo", "Xy 3", "Jo 30", "Jo 3:18-16", "; ;"])
+    def test_invalid_references(self, text):
+        """Testa que referências inválidas geram BibleReferenceError."""
+        with pytest.raises(BibleReferenceError):
+            parse_references(text, lambda value: BOOKS.get(value.lower()))
+
+
+class TestFormatParallelSlide:
+    """Testes para format_parallel_slide."""
+
+    def test_skips_missing_versions(self):
+        """Testa que versões sem o versículo não aparecem no slide."""
+        slide = format_parallel_slide("João", 3, 16, [("NVI", "Porque Deus..."), ("ACF", None)])
+
+        assert slide == "João 3:16\nNVI: Porque Deus..."
+
+    def test_multiple_versions(self):
+        """Testa o slide com duas versões."""
+        slide = format_parallel_slide("João", 3, 16, [("NVI", "a"), ("ACF", "b")])
+
+        assert slide == "João 3:16\nNVI: a\n\nACF: b"
+
+
+class TestBibleManagerAliases:
+    """Testes para o índice de apelidos do BibleManager."""
+
+    @pytest.mark.parametrize("alias,expected", [
+        ("Jo", "João"), ("joao", "João"), ("João", "João"), ("Jó", "Jó"), ("job", "Jó"),
+        ("1Co", "1ª Coríntios"), ("I Coríntios", "1ª Coríntios"), ("primeira corintios", "1ª Coríntios"),
+        ("1º Samuel", "1º Samuel"), ("2 Reis", "2º Reis"), ("2kgs", "2º Reis"),
+        ("Sl", "Salmos"), ("ps", "Salmos"), ("exodo", "Êxodo"), ("Gen", "Gênesis"), ("ap", "Apocalipse"),
+    ])
+    def test_resolve_book(self, manager, alias, expected):
+        """Testa nomes, nomes sem acento, abreviações pt/en e ordinais."""
+        assert manager.resolve_book(alias)["name"] == expected
+
+    def test_resolve_unknown_book(self, manager):
+        """Testa que um apelido desconhecido retorna None."""
+        assert manager.resolve_book("livro inexistente") is None
+
+    def test_get_book_by_name(self, manager):
+        """Testa a busca pelo nome exibido nos menus."""
+        assert manager.get_book_by_name("Salmos")["abbrev"] == "sl"
+        assert manager.get_book_by_name("Inexistente") is None
+
+    def test_get_reference_slides(self, manager):
+        """Testa a montagem dos slides de uma referência com intervalo."""
+        manager.api_client.get_chapter_verses.return_value = [
+            {"number": n, "text": f"texto {n}"} for n in range(1, 21)
+        ]
+        references = manager.parse_references("Jo 3:16-18; Jo 3:20")
+        slides = manager.get_reference_slides("nvi", references)
+
+        assert slides == [
+            "João 3:16\ntexto 16", "João 3:17\ntexto 17", "João 3:18\ntexto 18", "João 3:20\ntexto 20"
+        ]
+        # O mesmo capítulo é buscado uma única vez (a segunda referência vem do cache)
+        manager.api_client.get_chapter_verses.assert_called_once_with("nvi", "jo", 3)
+
+    def test_get_reference_slides_empty_range(self, manager):
+        """Testa que um intervalo sem versículos gera BibleReferenceError."""
+        manager.api_client.get_chapter_verses.return_value = [{"number": 1, "text": "texto"}]
+
+        with pytest.raises(BibleReferenceError):
+            manager.get_reference_slides("nvi", manager.parse_references("Jo 3:40"))
@@ -0,0 +1,121 @@
+"""
+Testes para a busca textual da Bíblia.
+
+Este módulo contém testes unitários para o índice invertido, as consultas
+por frase e a integração com o BibleManager.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from core.bible_manager import BibleManager
+from core.bible_search import BibleSearchIndex, main, tokenize
+from core.bible_store import BibleStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Armazenamento com alguns versículos de exemplo."""
+    bible_store = BibleStore(tmp_path / "bible")
+    bible_store.save_chapter("nvi", "sl", 119, [
+        {"number": 105, "text": "A tua palavra é lâmpada que ilumina os meus passos e luz que clareia o meu caminho."},
+        {"number": 106, "text": "Prometi sob juramento e o cumprirei: vou obedecer às tuas justas ordenanças."},
+    ])
+    bible_store.save_chapter("nvi", "jo", 3, [
+        {"number": 16, "text": "Porque Deus tanto amou o mundo que deu o seu Filho Unigênito."},
+        {"number": 17, "text": "Pois Deus enviou o seu Filho ao mundo, não para condenar o mundo."},
+    ])
+    bible_store.save_chapter("nvi", "mt", 5, [
+        {"number": 15, "text": "E, também, ninguém acende uma lâmpada e a coloca debaixo de uma vasilha."},
+    ])
+    return bible_store
+
+
+class TestBibleSearchIndex:
+    """Testes para a classe BibleSearchIndex."""
+    
+    def test_tokenize_folds_accents(self):
+        """Testa que os termos ficam em minúsculas e sem acentos."""
+        assert tokenize("Lâmpada, LUZ!") == ["lampada", "luz"]
+    
+    def test_search_ignores_accents_and_ranks(self, store):
+        """Testa que versículos com mais termos da consulta ficam à frente."""
+        index = BibleSearchIndex.build(store, "nvi")
+        
+        results = index.search("lampada passos")
+        
+        assert [(r.book_abbrev, r.chapter, r.verse) for r in results] == [("sl", 119, 105), ("mt", 5, 15)]
+        assert results[0].score > results[1].score
+    
+    def test_phrase_query(self, store):
+        """Testa que frases entre aspas exigem os termos em sequência."""
+        index = BibleSearchIndex.build(store, "nvi")
+        
+        assert [r.verse for r in index.search('"enviou o seu filho"')] == [17]
+        assert index.search('"filho enviou"') == []
+    
+    def test_stopwords_only_query(self, store):
+        """Testa que uma consulta só com palavras comuns ainda encontra resultados."""
+        index = BibleSearchIndex.build(store, "nvi")
+        
+        assert index.search("que")
+        assert index.search("") == []
+    
+    def test_book_order_breaks_ties(self, store):
+        """Testa que a ordem canônica é usada para desempatar resultados."""
+        index = BibleSearchIndex.build(store, "nvi", book_order=["sl", "mt", "jo"])
+        
+        assert [r.book_abbrev for r in index.search("mundo")] == ["jo", "jo"]
+        assert index._docs[0][0] == "sl"
+    
+    def test_save_and_load(self, store, tmp_path):
+        """Testa que o índice gravado em disco produz os mesmos resultados."""
+        index = BibleSearchIndex.build(store, "nvi")
+        path = tmp_path / "index" / "nvi.json"
+        index.save(path)
+        
+        loaded = BibleSearchIndex.load(path)
+        
+        assert len(loaded) == len(index)
+        assert loaded.search("lâmpada") == index.search("lâmpada")
+        assert BibleSearchIndex.load(tmp_path / "ausente.json") is None
+
+
+class TestBibleManagerSearch:
+    """Testes para a busca textual pelo BibleManager."""
+    
+    def test_fetched_chapters_are_stored_and_searchable(self, tmp_path, mock_api_client):
+        """Testa que capítulos obtidos da API entram no armazenamento e no índice."""
+        manager = BibleManager()
+        manager.api_client = mock_api_client
+        manager.chapter_cache.disk.directory = tmp_path / "chapters"
+        manager.books = mock_api_client.get_books.return_value
+        
+        assert manager.search_verses("nvi", "princípio") == []  # Ainda sem índice
+        manager.get_chapter_verses("nvi", "gn", 1)
+        manager.build_search_index("nvi")
+        
+        results = manager.search_verses("nvi", "principio")
+        assert [(r.book_abbrev, r.chapter, r.verse) for r in results] == [("gn", 1, 1)]
+    
+    def test_store_is_used_before_api(self, tmp_path):
+        """Testa que um capítulo armazenado localmente não é buscado na API."""
+        manager = BibleManager()
+        manager.api_client = Mock()
+        manager.chapter_cache.disk.directory = tmp_path / "chapters"
+        manager.bible_store.save_chapter("nvi", "gn", 1, [{"number": 1, "text": "x"}])
+        
+        assert manager.get_chapter_verses("nvi", "gn", 1) == [{"number": 1, "text": "x"}]
+        manager.api_client.get_chapter_verses.assert_not_called()
+
+
+class TestCommandLine:
+    """Testes para a linha de comando."""
+    
+    def test_search_without_index(self, tmp_path, monkeypatch, capsys):
+        """Testa que a busca sem índice orienta a construção."""
+        monkeypatch.setattr("core.bible_search.BIBLE_SEARCH_INDEX_DIR", tmp_path)
+        monkeypatch.setattr("core.bible_search.index_path", lambda version: tmp_path / f"{version}.json")
+        
+        assert main(["search", "nvi", "luz"]) == 1
+        assert "build nvi" in capsys.readouterr().err
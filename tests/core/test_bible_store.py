@@ -0,0 +1,46 @@
+"""
+Testes para o BibleStore.
+
+Este módulo contém testes unitários para o armazenamento local do texto bíblico.
+"""
+
+import pytest
+
+from core.bible_store import BibleStore
+
+
+class TestBibleStore:
+    """Testes para a classe BibleStore."""
+    
+    def test_save_and_get_chapter(self, tmp_path):
+        """Testa gravar e ler um capítulo (versão e livro sem diferenciar maiúsculas)."""
+        store = BibleStore(tmp_path)
+        verses = [{"number": 1, "text": "No princípio"}]
+        
+        store.save_chapter("NVI", "gn", 1, verses)
+        
+        assert store.get_chapter("nvi", "GN", 1) == verses
+        assert store.has_chapter("nvi", "gn", 1)
+        assert store.get_chapter("nvi", "gn", 2) is None
+    
+    def test_iter_chapters_in_numeric_order(self, tmp_path):
+        """Testa que os capítulos são percorridos em ordem numérica."""
+        store = BibleStore(tmp_path)
+        for chapter in (10, 2, 1):
+            store.save_chapter("nvi", "sl", chapter, [{"number": 1, "text": f"salmo {chapter}"}])
+        store.save_chapter("acf", "sl", 1, [{"number": 1, "text": "outra versão"}])
+        
+        chapters = [(book, chapter) for book, chapter, _ in store.iter_chapters("nvi")]
+        
+        assert chapters == [("sl", 1), ("sl", 2), ("sl", 10)]
+        assert store.chapter_count("nvi") == 3
+        assert store.versions() == ["acf", "nvi"]
+    
+    def test_corrupted_chapter_is_ignored(self, tmp_path):
+        """Testa que um arquivo ilegível é tratado como ausente."""
+        store = BibleStore(tmp_path)
+        store.save_chapter("nvi", "gn", 1, [{"number": 1, "text": "x"}])
+        (tmp_path / "nvi" / "gn" / "1.json").write_text("{inválido")
+        
+        assert store.get_chapter("nvi", "gn", 1) is None
+        assert list(store.iter_chapters("nvi")) == []
@@ -5,13 +5,13 @@ Este módulo contém testes unitários para todas as funcionalidades do ConfigMa
 """
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from pathlib import Path
 import configparser
 import tempfile
 
 from core.config_manager import ConfigManager
-from core.exceptions import ConfigSaveError
+from core.exceptions import ConfigSaveError, ValidationError
 
 
 class TestConfigManager:
@@ -100,3 +100,120 @@ font_size = 70
             value = manager.get_int_setting("Projection_Music", "nonexistent", fallback=60)
             assert value == 60
 
+    
+    def test_get_setting_served_from_memory(self, tmp_path):
+        """Testa que leituras repetidas não releem o arquivo."""
+        config_file = tmp_path / "config.ini"
+        config_file.write_text("[Projection_Music]\nfont_size = 70\n", encoding='utf-8')
+        
+        with patch('core.config_manager.CONFIG_PATH', str(config_file)):
+            manager = ConfigManager()
+            manager.RELOAD_CHECK_INTERVAL_SECONDS = 0
+            with patch.object(configparser.ConfigParser, 'read') as mock_read:
+                for _ in range(10):
+                    assert manager.get_int_setting("Projection_Music", "font_size") == 70
+                    assert manager.get_setting("Projection_Music", "font_size") == "70"
+            
+            mock_read.assert_not_called()
+    
+    def test_external_change_reloaded_after_invalidate(self, tmp_path):
+        """Testa que uma alteração externa do arquivo é lida após invalidate()."""
+        config_file = tmp_path / "config.ini"
+        config_file.write_text("[Projection_Music]\nfont_size = 70\nfont_color = white\n", encoding='utf-8')
+        
+        with patch('core.config_manager.CONFIG_PATH', str(config_file)):
+            manager = ConfigManager()
+            config_file.write_text("[Projection_Music]\nfont_size = 90\n", encoding='utf-8')
+            
+            # Dentro do intervalo de verificação, o valor em memória é mantido
+            assert manager.get_setting("Projection_Music", "font_size") == "70"
+            manager.invalidate()
+            assert manager.get_setting("Projection_Music", "font_size") == "90"
+            # Chaves removidas do arquivo também somem da memória
+            assert manager.get_setting("Projection_Music", "font_color") is None
+    
+    def test_own_writes_do_not_trigger_reload(self, tmp_path):
+        """Testa que salvar pelo próprio ConfigManager não provoca releitura."""
+        config_file = tmp_path / "config.ini"
+        config_file.write_text("", encoding='utf-8')
+        
+        with patch('core.config_manager.CONFIG_PATH', str(config_file)):
+            manager = ConfigManager()
+            manager.set_setting("Projection_Music", "font_size", "80")
+            manager.invalidate()
+            with patch.object(manager, 'load_config') as mock_load:
+                assert manager.get_setting("Projection_Music", "font_size") == "80"
+            
+            mock_load.assert_not_called()
+
+
+class TestConfigBatch:
+    """Testes para as alterações em lote (batch)."""
+    
+    @pytest.fixture
+    def manager(self, tmp_path):
+        config_file = tmp_path / "config.ini"
+        config_file.write_text("[Projection_Music]\nfont_size = 70\nfont_color = white\n", encoding='utf-8')
+        with patch('core.config_manager.CONFIG_PATH', str(config_file)):
+            yield ConfigManager()
+    
+    def test_batch_writes_once_and_notifies_once(self, manager, tmp_path):
+        """Testa que um batch grava o arquivo uma vez e notifica com todas as chaves alteradas."""
+        notifications = []
+        manager.add_change_listener(notifications.append)
+        
+        with patch.object(manager, '_save_config_file', wraps=manager._save_config_file) as mock_save:
+            with manager.batch():
+                manager.set_setting("Projection_Music", "font_size", 80)
+                manager.set_setting("Projection_Music", "font_color", "white")  # Sem mudança
+                manager.set_setting("Projection_Bible", "bg_color", "#000033")
+                assert notifications == []
+        
+        mock_save.assert_called_once()
+        assert notifications == [frozenset({("Projection_Music", "font_size"), ("Projection_Bible", "bg_color")})]
+        assert "font_size = 80" in (tmp_path / "config.ini").read_text(encoding='utf-8')
+    
+    def test_unchanged_value_is_not_written(self, manager):
+        """Testa que definir o valor atual não grava o arquivo nem notifica."""
+        listener = Mock()
+        manager.add_change_listener(listener)
+        
+        with patch.object(manager, '_save_config_file') as mock_save:
+            assert manager.set_setting("Projection_Music", "font_size", "70") is True
+        
+        mock_save.assert_not_called()
+        listener.assert_not_called()
+    
+    def test_invalid_value_discards_batch(self, manager):
+        """Testa que um valor inválido descarta todas as alterações do batch."""
+        with pytest.raises(ValidationError):
+            with manager.batch():
+                manager.set_setting("Projection_Music", "font_size", 80)
+                manager.set_setting("Projection_Music", "font_color", "não-é-cor")
+        
+        assert manager.get_setting("Projection_Music", "font_size") == "70"
+    
+    def test_save_failure_rolls_back_memory(self, manager):
+        """Testa que uma falha de gravação desfaz as alterações em memória."""
+        listener = Mock()
+        manager.add_change_listener(listener)
+        
+        with patch('builtins.open', side_effect=IOError("sem permissão")):
+            with pytest.raises(ConfigSaveError):
+                with manager.batch():
+                    manager.set_setting("Projection_Music", "font_size", 80)
+                    manager.set_setting("Projection_Text", "font_size", 50)
+        
+        assert manager.get_setting("Projection_Music", "font_size") == "70"
+        assert manager.get_setting("Projection_Text", "font_size") is None
+        listener.assert_not_called()
+    
+    def test_nested_batch_joins_outer(self, manager):
+        """Testa que um batch aninhado só grava ao final do mais externo."""
+        with patch.object(manager, '_save_config_file') as mock_save:
+            with manager.batch():
+                with manager.batch():
+                    manager.set_setting("Projection_Music", "font_size", 80)
+                mock_save.assert_not_called()
+        
+        mock_save.assert_called_once()
@@ -0,0 +1,181 @@
+"""
+Testes para o pipeline de importação de músicas.
+
+Este módulo contém testes unitários para o ImportPipeline: estágios
+sobrepostos, gravação em lotes, deduplicação, falhas e métricas.
+"""
+
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import patch
+
+from core.exceptions import ScraperParseError, ValidationError
+from core.import_pipeline import ImportPipeline, main, normalize_music_data
+from core.music_manager import MusicManager
+
+
+class FakeScraper:
+    """Scraper que registra a ordem dos eventos de busca e análise."""
+
+    def __init__(self, delay=0.0, network_errors=(), parse_errors=()):
+        self.delay = delay
+        self.network_errors = set(network_errors)
+        self.parse_errors = set(parse_errors)
+        self.events = []
+        self._lock = threading.Lock()
+
+    def get_page_html(self, url):
+        time.sleep(self.delay)
+        if url in self.network_errors:
+            raise requests.exceptions.ConnectionError("sem conexão")
+        with self._lock:
+            self.events.append(("fetched", url))
+        return url.rstrip("/").split("/")[-1]
+
+    def parse_page(self, html, url=""):
+        with self._lock:
+            self.events.append(("parsed", url))
+        if url in self.parse_errors:
+            raise ScraperParseError("letra não encontrada")
+        return {"title": f"  Hino   {html} ", "artist": "Coral", "lyrics_full": f"Verso {html}\r\n\r\n\r\nFim  "}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """MusicManager com banco de dados temporário."""
+    db_file = tmp_path / "music_db.json"
+    db_file.write_text("[]")
+    with patch('core.music_manager.MUSIC_DB_PATH', str(db_file)):
+        yield MusicManager()
+
+
+def song_url(slug):
+    return f"https://www.letras.mus.br/coral/{slug}/"
+
+
+class TestImportPipeline:
+    """Testes para a classe ImportPipeline."""
+
+    def test_imports_and_writes_in_batches(self, manager):
+        """Testa que todas as músicas são normalizadas e gravadas em lotes."""
+        pipeline = ImportPipeline(FakeScraper(), manager, write_batch_size=2, rate_per_second=1000)
+        received = []
+
+        with patch.object(manager, 'add_music_batch', wraps=manager.add_music_batch) as add_batch:
+            report = pipeline.run([song_url(n) for n in range(5)], on_result=received.append)
+
+        assert sorted(song['title'] for song in report.added) == [f"Hino {n}" for n in range(5)]
+        assert report.added[0]['slides'] == [f"Verso {report.added[0]['title'][-1]}", "Fim"]
+        assert 3 <= add_batch.call_count < 5
+        assert len(received) == 5
+        metrics = pipeline.metrics()
+        assert list(metrics) == ["fetch", "parse", "normalize", "dedupe", "persist"]
+        assert all(stage["processed"] == 5 for stage in metrics.values())
+        assert all(stage["queue_depth"] == 0 for stage in metrics.values())
+        assert metrics["fetch"]["throughput"] > 0
+
+    def test_stages_overlap(self, manager):
+        """Testa que a análise começa antes de todas as páginas serem baixadas."""
+        scraper = FakeScraper(delay=0.02)
+        pipeline = ImportPipeline(scraper, manager, fetch_workers=2, rate_per_second=1000)
+
+        pipeline.run([song_url(n) for n in range(8)])
+
+        first_parse = scraper.events.index(next(event for event in scraper.events if event[0] == "parsed"))
+        last_fetch = max(i for i, event in enumerate(scraper.events) if event[0] == "fetched")
+        assert first_parse < last_fetch
+
+    def test_duplicates_and_failures(self, manager):
+        """Testa que duplicatas e falhas são registradas sem interromper as demais."""
+        manager.add_music("Hino a", "Coral", "Letra")
+        scraper = FakeScraper(network_errors={song_url("b")}, parse_errors={song_url("c")})
+        pipeline = ImportPipeline(scraper, manager, rate_per_second=1000)
+
+        report = pipeline.run([song_url("a"), song_url("b"), song_url("c"), song_url("d"), "https://example.com/x"])
+
+        assert [song['title'] for song in report.added] == ["Hino d"]
+        assert [song['title'] for song in report.duplicates] == ["Hino a"]
+        assert sorted(result.url for result in report.failed) == sorted(
+            [song_url("b"), song_url("c"), "https://example.com/x"]
+        )
+        metrics = pipeline.metrics()
+        assert metrics["fetch"]["failed"] == 1
+        assert metrics["parse"]["failed"] == 1
+
+    def test_cancel_discards_pending_urls(self, manager):
+        """Testa que, cancelado, o pipeline não baixa as URLs restantes."""
+        scraper = FakeScraper()
+        pipeline = ImportPipeline(scraper, manager, fetch_workers=1, rate_per_second=1000)
+        fetch = scraper.get_page_html
+
+        def fetch_then_cancel(url):
+            pipeline.cancel()
+            return fetch(url)
+
+        scraper.get_page_html = fetch_then_cancel
+        report = pipeline.run([song_url(n) for n in range(10)])
+
+        assert report.cancelled
+        assert len(report.added) == 1
+        assert [event[0] for event in scraper.events].count("fetched") == 1
+        # As URLs não baixadas também aparecem no relatório, como canceladas
+        assert len(report.results) == 10
+        assert len(report.failed) == 9
+        assert all("cancelada" in str(result.error) for result in report.failed)
+
+    def test_failing_callback_does_not_block_pipeline(self, manager):
+        """Testa que um erro no callback de resultado não trava o pipeline."""
+        scraper = FakeScraper(parse_errors={song_url(1)})
+        pipeline = ImportPipeline(scraper, manager, rate_per_second=1000, write_batch_size=2)
+
+        def broken_callback(result):
+            raise RuntimeError("falha na interface")
+
+        result = {}
+        thread = threading.Thread(
+            target=lambda: result.setdefault("report", pipeline.run([song_url(n) for n in range(5)], broken_callback)),
+            daemon=True
+        )
+        thread.start()
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        report = result["report"]
+        assert len(report.results) == 5
+        assert len(report.added) == 4
+
+
+class TestNormalizeMusicData:
+    """Testes para a normalização das músicas."""
+
+    def test_normalizes_whitespace(self):
+        """Testa a limpeza de espaços e quebras de linha."""
+        music = normalize_music_data({"title": " Hino\n Novo ", "artist": "Coral ",
+                                      "lyrics_full": "a  \r\nb\r\n\r\n\r\n\r\nc\n"})
+
+        assert music == {"title": "Hino Novo", "artist": "Coral", "lyrics_full": "a\nb\n\nc"}
+
+    def test_empty_fields_are_rejected(self):
+        """Testa que campos vazios levantam ValidationError."""
+        with pytest.raises(ValidationError):
+            normalize_music_data({"title": "Hino", "artist": "Coral", "lyrics_full": " \n\n "})
+
+
+class TestImportPipelineCli:
+    """Testes para a linha de comando."""
+
+    def test_imports_urls_from_file(self, manager, tmp_path, capsys):
+        """Testa a importação de um arquivo de URLs com o resumo das métricas."""
+        urls_file = tmp_path / "urls.txt"
+        urls_file.write_text(f"{song_url('a')}\n{song_url('b')}\n", encoding="utf-8")
+
+        with patch('core.services.letras_scraper.LetrasScraper', return_value=FakeScraper()), \
+             patch('core.music_manager.MusicManager', return_value=manager):
+            exit_code = main([str(urls_file), "--rate", "1000"])
+
+        assert exit_code == 0
+        output = capsys.readouterr().out
+        assert "2 importada(s)" in output
+        assert "persist" in output
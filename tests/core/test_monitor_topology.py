@@ -0,0 +1,74 @@
+"""
+Testes para o MonitorTopology.
+
+Este módulo contém testes unitários para a topologia de monitores em cache.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from core.config_manager import ConfigManager
+from core.monitor_topology import MonitorTopology
+
+
+def monitor(x, width, height):
+    return SimpleNamespace(x=x, y=0, width=width, height=height)
+
+
+PRIMARY = monitor(0, 1920, 1080)
+PROJECTOR = monitor(1920, 1280, 720)
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("[Display]\nprojection_monitor_index = \n", encoding='utf-8')
+    with patch('core.config_manager.CONFIG_PATH', str(config_file)):
+        yield ConfigManager()
+
+
+class TestMonitorTopology:
+    """Testes para a classe MonitorTopology."""
+
+    def test_lookups_are_served_from_memory(self):
+        """Testa que os monitores são consultados uma única vez até o próximo refresh."""
+        query = Mock(return_value=[PRIMARY, PROJECTOR])
+        topology = MonitorTopology(query=query)
+
+        for _ in range(5):
+            assert topology.target_size() == (1280, 720)
+
+        query.assert_called_once()
+
+    def test_refresh_reports_changes(self):
+        """Testa que refresh() indica se a lista de monitores mudou."""
+        query = Mock(return_value=[PRIMARY])
+        topology = MonitorTopology(query=query)
+        assert topology.target_monitor() is PRIMARY
+
+        assert topology.refresh() is False
+        query.return_value = [PRIMARY, PROJECTOR]
+        assert topology.refresh() is True
+        assert topology.target_monitor() is PROJECTOR
+
+    def test_query_failure_means_no_monitor(self):
+        """Testa que uma falha na consulta não interrompe a aplicação."""
+        topology = MonitorTopology(query=Mock(side_effect=RuntimeError("sem tela")))
+
+        assert topology.target_monitor() is None
+        assert topology.target_size() == (0, 0)
+
+    def test_configured_index_selects_monitor(self, config_manager):
+        """Testa que projection_monitor_index escolhe o monitor e acompanha alterações."""
+        topology = MonitorTopology(config_manager, query=Mock(return_value=[PRIMARY, PROJECTOR]))
+        assert topology.target_monitor() is PROJECTOR
+
+        config_manager.set_setting("Display", "projection_monitor_index", "0")
+        assert topology.target_monitor() is PRIMARY
+
+        # Fora do intervalo ou inválido: volta para a escolha automática
+        config_manager.set_setting("Display", "projection_monitor_index", "5")
+        assert topology.target_monitor() is PROJECTOR
+        config_manager.set_setting("Display", "projection_monitor_index", "segundo")
+        assert topology.target_monitor() is PROJECTOR
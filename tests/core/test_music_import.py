@@ -0,0 +1,173 @@
+"""
+Testes para a importação de músicas em lote.
+
+Este módulo contém testes unitários para o BatchImporter: validação e
+deduplicação das URLs, busca concorrente, gravação única e cancelamento.
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from core.exceptions import ScraperNetworkError, ValidationError
+from core.music_import import ArtistCatalogImporter, BatchImporter, normalize_song_url, split_url_list
+from core.music_manager import MusicManager
+
+
+class FakeScraper:
+    """Scraper que devolve uma letra por URL e registra a concorrência máxima."""
+
+    def __init__(self, failing=(), delay=0.0):
+        self.calls = []
+        self.failing = set(failing)
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def fetch_artist_songs(self, artist_url):
+        return {"artist": "Coral", "songs": [{"title": f"Hino {n}", "url": song_url(n)} for n in range(5)]}
+
+    def fetch_lyrics_from_url(self, url):
+        with self._lock:
+            self.calls.append(url)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if url in self.failing:
+                raise ScraperNetworkError("sem conexão")
+            slug = url.rstrip("/").split("/")[-1]
+            return {"title": f"Hino {slug}", "artist": "Coral", "lyrics_full": f"Letra {slug}"}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """MusicManager com banco de dados temporário."""
+    db_file = tmp_path / "music_db.json"
+    db_file.write_text("[]")
+    with patch('core.music_manager.MUSIC_DB_PATH', str(db_file)):
+        yield MusicManager()
+
+
+def song_url(slug):
+    return f"https://www.letras.mus.br/coral/{slug}/"
+
+
+class TestUrlHelpers:
+    """Testes para a normalização e separação de URLs."""
+
+    def test_normalize_song_url(self):
+        """Testa que variações da mesma URL resultam na mesma chave."""
+        assert normalize_song_url("https://WWW.Letras.mus.br/coral/hino?utm=x#letra") == song_url("hino")
+        assert normalize_song_url(song_url("hino")) == song_url("hino")
+
+    def test_split_url_list(self):
+        """Testa separar URLs coladas em linhas, espaços ou vírgulas."""
+        assert split_url_list(" a\nb, c;\n\n d ") == ["a", "b", "c", "d"]
+
+
+class TestBatchImporter:
+    """Testes para a classe BatchImporter."""
+
+    def test_imports_every_url_with_one_write(self, manager):
+        """Testa que todas as músicas são gravadas com uma única escrita."""
+        scraper = FakeScraper()
+        importer = BatchImporter(scraper, manager, rate_per_second=1000)
+        received = []
+
+        with patch.object(manager, 'save_music_db', wraps=manager.save_music_db) as save:
+            report = importer.run([song_url(n) for n in range(5)], on_result=received.append)
+
+        assert save.call_count == 1
+        assert [song['title'] for song in report.added] == [f"Hino {n}" for n in range(5)]
+        assert len(received) == 5
+        assert not report.failed
+
+    def test_invalid_and_repeated_urls(self, manager):
+        """Testa que URLs inválidas viram falhas e URLs repetidas são buscadas uma vez."""
+        scraper = FakeScraper()
+        importer = BatchImporter(scraper, manager, rate_per_second=1000)
+
+        report = importer.run([song_url("a"), "https://example.com/x", song_url("a") + "?x=1"])
+
+        assert scraper.calls == [song_url("a")]
+        assert len(report.added) == 1
+        assert isinstance(report.failed[0].error, ValidationError)
+
+    def test_skips_songs_already_in_library(self, manager):
+        """Testa que músicas já existentes (ou repetidas no lote) não são gravadas."""
+        manager.add_music("Hino a", "Coral", "Letra")
+        importer = BatchImporter(FakeScraper(), manager, rate_per_second=1000)
+
+        report = importer.run([song_url("a"), song_url("b"), song_url("B")])
+
+        assert [song['title'] for song in report.added] == ["Hino b"]
+        assert [song['title'] for song in report.duplicates] == ["Hino a", "Hino B"]
+
+    def test_failures_do_not_stop_the_batch(self, manager):
+        """Testa que uma página com erro não impede as demais."""
+        importer = BatchImporter(FakeScraper(failing={song_url("b")}), manager, rate_per_second=1000)
+
+        report = importer.run([song_url("a"), song_url("b"), song_url("c")])
+
+        assert len(report.added) == 2
+        assert [result.url for result in report.failed] == [song_url("b")]
+
+    def test_bounded_concurrency(self, manager):
+        """Testa que não há mais buscas simultâneas que o permitido."""
+        scraper = FakeScraper(delay=0.02)
+        importer = BatchImporter(scraper, manager, max_workers=2, rate_per_second=1000)
+
+        importer.fetch_all([song_url(n) for n in range(6)])
+
+        assert scraper.max_active == 2
+
+    def test_cancel_keeps_fetched_songs(self, manager):
+        """Testa que o cancelamento interrompe as buscas e mantém as já concluídas."""
+        scraper = FakeScraper(delay=0.01)
+        importer = BatchImporter(scraper, manager, max_workers=1, rate_per_second=1000)
+
+        results = importer.fetch_all([song_url(n) for n in range(10)],
+                                     on_result=lambda result: importer.cancel())
+        report = importer.commit(results)
+
+        assert report.cancelled
+        assert len(scraper.calls) < 10
+        assert len(report.added) >= 1
+
+
+class TestArtistCatalogImporter:
+    """Testes para a classe ArtistCatalogImporter."""
+
+    def test_known_songs_are_not_fetched(self, manager):
+        """Testa que músicas já na biblioteca são puladas antes do download."""
+        manager.add_music("Hino 1", "Coral", "Letra")
+        scraper = FakeScraper()
+        importer = ArtistCatalogImporter(scraper, manager, rate_per_second=1000)
+
+        report = importer.run_catalog("https://www.letras.mus.br/coral/")
+
+        assert song_url(1) not in scraper.calls
+        assert len(scraper.calls) == 4
+        assert sorted(song['title'] for song in report.added) == ["Hino 0", "Hino 2", "Hino 3", "Hino 4"]
+        assert [song['title'] for song in report.duplicates] == ["Hino 1"]
+
+    def test_songs_are_committed_in_batches_as_they_arrive(self, manager, monkeypatch):
+        """Testa que as músicas entram na biblioteca em lotes durante a importação."""
+        monkeypatch.setattr(ArtistCatalogImporter, "COMMIT_BATCH_SIZE", 2)
+        importer = ArtistCatalogImporter(FakeScraper(), manager, rate_per_second=1000)
+        library_sizes = []
+
+        with patch.object(manager, 'add_music_batch', wraps=manager.add_music_batch) as add_batch:
+            importer.run_catalog("https://www.letras.mus.br/coral/",
+                                 on_result=lambda result: library_sizes.append(len(manager.music_database)))
+
+        assert add_batch.call_count == 3
+        assert library_sizes[2] == 2
+        assert len(manager.music_database) == 5
+
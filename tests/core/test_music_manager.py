@@ -241,4 +241,54 @@ class TestMusicManager:
             slides = manager.get_lyrics_slides("nonexistent-id")
             
             assert slides == []
+    
+    def test_add_music_batch_single_write(self, tmp_path):
+        """Testa que o lote é gravado de uma vez e indexado."""
+        db_file = tmp_path / "music_db.json"
+        db_file.write_text("[]")
+        songs = [
+            {"title": "Hino A", "artist": "Coral", "lyrics_full": "Estrofe 1\n\nEstrofe 2"},
+            {"title": "Hino B", "artist": "Coral", "lyrics_full": "Estrofe única"},
+        ]
+        
+        with patch('core.music_manager.MUSIC_DB_PATH', str(db_file)):
+            manager = MusicManager()
+            with patch.object(manager, 'save_music_db', wraps=manager.save_music_db) as save:
+                added = manager.add_music_batch(songs)
+            
+            assert save.call_count == 1
+            assert [song['title'] for song in added] == ["Hino A", "Hino B"]
+            assert added[0]['slides'] == ["Estrofe 1", "Estrofe 2"]
+            assert manager.is_duplicate("hino b", "CORAL")
+            assert len(json.loads(db_file.read_text(encoding="utf-8"))) == 2
+    
+    def test_add_music_batch_rolls_back_on_save_error(self, sample_music_data, tmp_path):
+        """Testa que nenhuma música do lote fica na memória se a gravação falhar."""
+        db_file = tmp_path / "music_db.json"
+        db_file.write_text(json.dumps([sample_music_data]))
+        
+        with patch('core.music_manager.MUSIC_DB_PATH', str(db_file)):
+            manager = MusicManager()
+            with patch.object(manager, 'save_music_db', side_effect=MusicDatabaseError("disco cheio")):
+                with pytest.raises(MusicDatabaseError):
+                    manager.add_music_batch([{"title": "Nova", "artist": "X", "lyrics_full": "Letra"}])
+            
+            assert len(manager.music_database) == 1
+            assert not manager.is_duplicate("Nova", "X")
+            assert manager.is_duplicate(sample_music_data['title'], sample_music_data['artist'])
+    
+    def test_add_music_batch_validates_everything_first(self, tmp_path):
+        """Testa que uma entrada inválida impede o lote inteiro."""
+        db_file = tmp_path / "music_db.json"
+        db_file.write_text("[]")
+        
+        with patch('core.music_manager.MUSIC_DB_PATH', str(db_file)):
+            manager = MusicManager()
+            with pytest.raises(ValidationError):
+                manager.add_music_batch([
+                    {"title": "Boa", "artist": "X", "lyrics_full": "Letra"},
+                    {"title": "", "artist": "X", "lyrics_full": "Letra"},
+                ])
+            
+            assert manager.music_database == []
 
@@ -0,0 +1,82 @@
+"""
+Testes para o SlideLayoutEngine.
+
+Este módulo contém testes unitários para a quebra de linhas e o cálculo
+antecipado do layout dos slides.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from core.slide_layout import SlideLayoutEngine, text_background
+from core.style_profile import StyleProfile
+
+FONT = ("Arial", 10, "bold")
+
+
+@pytest.fixture
+def measure():
+    """Fonte monoespaçada fictícia: 10 px por caractere."""
+    return Mock(side_effect=lambda font, text: 10 * len(text))
+
+
+@pytest.fixture
+def engine(measure):
+    return SlideLayoutEngine(measure, lambda font: 20)
+
+
+class TestSlideLayoutEngine:
+    """Testes para a classe SlideLayoutEngine."""
+
+    def test_wrap_breaks_at_spaces_and_keeps_line_breaks(self, engine):
+        """Testa a quebra nos espaços, mantendo as quebras de linha (e estrofes) do texto."""
+        assert engine.wrap("um dois tres quatro\n\nfim", FONT, 90) == ["um dois", "tres", "quatro", "", "fim"]
+
+    def test_wrap_splits_long_words(self, engine):
+        """Testa que uma palavra mais larga que a linha é quebrada por caractere."""
+        assert engine.wrap("ab abcdefgh", FONT, 30) == ["ab", "abc", "def", "gh"]
+
+    def test_layout_centers_text_and_background(self, engine):
+        """Testa a caixa do texto centralizada e o retângulo de fundo com margem."""
+        layout = engine.layout("um dois tres", FONT, (100, 200))  # Largura útil: 90 px
+
+        assert layout.text == "um dois\ntres"
+        assert layout.line_count == 2
+        assert layout.text_bbox == (15.0, 80.0, 85.0, 120.0)
+        assert layout.background_rect == (-5.0, 60.0, 105.0, 140.0)
+
+    def test_empty_text_has_no_background(self, engine):
+        """Testa que um slide vazio não tem retângulo de fundo."""
+        assert engine.layout("", FONT, (100, 200)).background_rect is None
+
+    def test_prepared_layout_is_reused(self, engine, measure):
+        """Testa que o layout preparado antes da troca não é medido de novo."""
+        engine.prepare(["um dois", "tres"], FONT, (100, 200))
+        assert engine.is_prepared("tres", FONT, (100, 200))
+        calls = measure.call_count
+
+        engine.layout("um dois", FONT, (100, 200))
+
+        assert measure.call_count == calls
+        # Outro tamanho de canvas ou outra fonte exigem um novo layout
+        assert not engine.is_prepared("tres", FONT, (200, 200))
+        assert not engine.is_prepared("tres", ("Arial", 12, "bold"), (100, 200))
+
+
+class TestTextBackground:
+    """Testes para a posição e visibilidade do fundo atrás do texto."""
+
+    def test_opacity_change_on_empty_slide_keeps_background_hidden(self, engine):
+        """Testa que mudar a opacidade com o slide vazio não exibe um retângulo sem texto."""
+        empty = engine.layout("", FONT, (100, 200))
+
+        for opacity in (0.0, 0.5, 0.9):
+            assert text_background(empty, StyleProfile('music', text_bg_opacity=opacity)) is None
+
+    def test_background_shown_at_layout_coordinates(self, engine):
+        """Testa que o fundo que volta a aparecer (opacidade de 0 para visível) usa as coordenadas do layout."""
+        layout = engine.layout("um dois tres", FONT, (100, 200))
+
+        assert text_background(layout, StyleProfile('music', text_bg_opacity=0.0)) is None
+        assert text_background(layout, StyleProfile('music', text_bg_opacity=0.9)) == (layout.background_rect, "gray75")
+        assert text_background(layout, StyleProfile('music', text_bg_enabled=False)) is None
@@ -0,0 +1,107 @@
+"""
+Testes para os perfis de estilo da projeção.
+
+Este módulo contém testes unitários para StyleProfile e StyleProfileCache.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from core.config_manager import ConfigManager
+from core.style_profile import StyleProfile, StyleProfileCache
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    config_file = tmp_path / "config.ini"
+    config_file.write_text(
+        "[Projection_Music]\nfont_size = 70\nfont_color = white\nbg_color = black\n"
+        "text_bg_enabled = true\ntext_bg_opacity = 0.5\n"
+        "[Projection_Bible]\nfont_size = 60\nfont_color = #FFFFE0\nbg_color = #000033\n",
+        encoding='utf-8'
+    )
+    with patch('core.config_manager.CONFIG_PATH', str(config_file)):
+        yield ConfigManager()
+
+
+class TestStyleProfile:
+    """Testes para a classe StyleProfile."""
+
+    def test_from_config_parses_types(self, config_manager):
+        """Testa que os valores do config.ini são convertidos para os tipos da interface."""
+        profile = StyleProfile.from_config(config_manager, 'music')
+
+        assert profile.font_size == 70
+        assert profile.font == ("Arial", 70, "bold")
+        assert profile.text_bg_enabled is True
+        assert profile.text_bg_opacity == 0.5
+        assert profile.text_bg_stipple == "gray25"
+        assert not profile.has_animation
+
+    def test_invalid_values_use_defaults(self, config_manager):
+        """Testa que valores inválidos ou ausentes usam o padrão (opacidade limitada a 0..1)."""
+        config_manager.config.set("Projection_Bible", "text_bg_opacity", "muito")
+        config_manager.config.set("Projection_Bible", "font_size", "grande")
+
+        profile = StyleProfile.from_config(config_manager, 'bible')
+
+        assert profile.font_size == 60
+        assert profile.text_bg_opacity == 0.75
+        assert StyleProfile('text', text_bg_opacity=0.0).text_bg_stipple is None
+        assert StyleProfile('text', text_bg_enabled=False).text_bg_stipple is None
+
+    def test_profile_is_immutable(self):
+        """Testa que o perfil não pode ser alterado depois de criado."""
+        with pytest.raises(AttributeError):
+            StyleProfile('music').font_size = 10
+
+    def test_changed_fields(self):
+        """Testa a lista de campos que mudaram entre dois perfis."""
+        old = StyleProfile('music', font_size=70)
+        new = StyleProfile('bible', font_size=80, bg_color='#000033')
+
+        assert new.changed_fields(old) == {'font_size', 'bg_color'}
+        assert new.changed_fields(new) == frozenset()
+        assert 'animation_type' in new.changed_fields(None)
+        assert 'content_type' not in new.changed_fields(None)
+
+
+class TestStyleProfileCache:
+    """Testes para a classe StyleProfileCache."""
+
+    def test_profiles_are_reused_without_reading_config(self, config_manager):
+        """Testa que perfis prontos são reaproveitados sem consultar as configurações."""
+        cache = StyleProfileCache(config_manager)
+        first = cache.get('music', 'Neve')
+
+        with patch.object(config_manager, 'get_setting') as mock_get:
+            for _ in range(5):
+                assert cache.get('music', 'Neve') is first
+            assert cache.get('music').animation_type == 'Nenhuma'
+
+        mock_get.assert_not_called()
+        assert first.animation_type == 'Neve'
+        assert cache.get('bible', 'Neve').animation_type == 'Nenhuma'
+
+    def test_config_change_invalidates_only_changed_section(self, config_manager):
+        """Testa que alterar uma seção descarta apenas os perfis dela."""
+        cache = StyleProfileCache(config_manager)
+        music, bible = cache.get('music'), cache.get('bible')
+
+        config_manager.set_setting("Projection_Music", "font_size", 90)
+
+        assert cache.get('music').font_size == 90
+        assert cache.get('bible') is bible
+        assert music.font_size == 70
+
+    def test_external_file_change_invalidates(self, config_manager, tmp_path):
+        """Testa que uma edição externa do config.ini chega aos perfis."""
+        cache = StyleProfileCache(config_manager)
+        assert cache.get('bible').font_size == 60
+
+        config_file = tmp_path / "config.ini"
+        config_file.write_text(config_file.read_text(encoding='utf-8').replace("font_size = 60", "font_size = 100"),
+                               encoding='utf-8')
+        config_manager.invalidate()
+
+        assert cache.get('bible').font_size == 100
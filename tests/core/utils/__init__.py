@@ -0,0 +1,4 @@
+"""
+Testes para utilitários core.
+"""
+
@@ -0,0 +1,170 @@
+"""
+Testes para as estruturas de cache.
+
+Este módulo contém testes unitários para LRUCache, DiskCache e TwoTierCache.
+"""
+
+import pytest
+import os
+import time
+from unittest.mock import patch
+
+from core.utils.cache import LRUCache, DiskCache, TwoTierCache
+
+
+class TestLRUCache:
+    """Testes para a classe LRUCache."""
+    
+    def test_get_and_set(self):
+        """Testa armazenar e recuperar valores contando acertos e falhas."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+    
+    def test_evicts_least_recently_used(self):
+        """Testa que a entrada menos usada é descartada ao exceder a capacidade."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # 'a' passa a ser a mais recente
+        cache.set("c", 3)
+        
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+    
+    def test_invalid_capacity(self):
+        """Testa que capacidade não positiva é rejeitada."""
+        with pytest.raises(ValueError):
+            LRUCache(max_entries=0)
+
+
+class TestDiskCache:
+    """Testes para a classe DiskCache."""
+    
+    def test_persists_between_instances(self, tmp_path):
+        """Testa que entradas gravadas são lidas por outra instância."""
+        DiskCache(tmp_path / "cache").set(("nvi", "jo", 3), [{"number": 16}])
+        
+        other = DiskCache(tmp_path / "cache")
+        
+        assert other.get(("nvi", "jo", 3)) == [{"number": 16}]
+        assert other.hits == 1
+    
+    def test_missing_directory_is_a_miss(self, tmp_path):
+        """Testa que um diretório inexistente não é criado apenas para leitura."""
+        cache = DiskCache(tmp_path / "inexistente")
+        
+        assert cache.get("x") is None
+        assert cache.misses == 1
+        assert not (tmp_path / "inexistente").exists()
+    
+    def test_expired_entry_is_removed(self, tmp_path):
+        """Testa que entradas com TTL vencido são tratadas como ausentes."""
+        cache = DiskCache(tmp_path, ttl_seconds=10)
+        cache.set("chave", "valor")
+        
+        with patch('core.utils.cache.time.time', return_value=time.time() + 60):
+            assert cache.get("chave") is None
+        assert cache.total_bytes() == 0
+    
+    def test_evicts_oldest_when_over_size(self, tmp_path):
+        """Testa o despejo das entradas menos acessadas ao exceder max_bytes."""
+        cache = DiskCache(tmp_path, max_bytes=10_000)
+        cache.set("antiga", "x" * 4000)
+        # Garante horários de acesso distintos
+        old_path = cache._path_for("antiga")
+        os.utime(old_path, (time.time() - 100, time.time() - 100))
+        cache._index = None
+        cache.set("nova", "y" * 4000)
+        cache.set("outra", "z" * 4000)
+        
+        assert cache.get("antiga") is None
+        assert cache.get("nova") == "y" * 4000
+        assert cache.total_bytes() <= 10_000
+    
+    def test_corrupted_entry_is_discarded(self, tmp_path):
+        """Testa que um arquivo de cache corrompido é tratado como ausente."""
+        cache = DiskCache(tmp_path)
+        cache.set("chave", "valor")
+        cache._path_for("chave").write_text("{inválido", encoding="utf-8")
+        
+        assert cache.get("chave") is None
+        assert not cache._path_for("chave").exists()
+    
+    def test_clear(self, tmp_path):
+        """Testa remover todas as entradas."""
+        cache = DiskCache(tmp_path)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        cache.clear()
+        
+        assert cache.get("a") is None
+        assert cache.total_bytes() == 0
+
+
+class TestTwoTierCache:
+    """Testes para a classe TwoTierCache."""
+    
+    def test_disk_hit_is_promoted_to_memory(self, tmp_path):
+        """Testa que um acerto no disco é promovido para a memória."""
+        disk = DiskCache(tmp_path)
+        disk.set("chave", "valor")
+        cache = TwoTierCache(LRUCache(4), disk)
+        
+        assert cache.get("chave") == "valor"
+        assert cache.get("chave") == "valor"
+        
+        stats = cache.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 0
+    
+    def test_miss_and_delete(self, tmp_path):
+        """Testa falha de busca e remoção nos dois níveis."""
+        cache = TwoTierCache(LRUCache(4), DiskCache(tmp_path))
+        assert cache.get("chave") is None
+        
+        cache.set("chave", "valor")
+        cache.delete("chave")
+        
+        assert cache.get("chave") is None
+        assert cache.stats()["misses"] == 2
+    
+    def test_peek_does_not_change_stats(self, tmp_path):
+        """Testa que peek() lê os dois níveis sem alterar contadores nem promover."""
+        disk = DiskCache(tmp_path)
+        disk.set("disco", "valor")
+        cache = TwoTierCache(LRUCache(4), disk)
+        
+        assert cache.peek("disco") == "valor"
+        assert cache.peek("ausente") is None
+        
+        assert cache.stats() == {"memory_hits": 0, "disk_hits": 0, "misses": 0, "memory_entries": 0}
+        assert disk.hits == 0 and disk.misses == 0
+    
+    def test_get_entry_serves_stale_entry_with_metadata(self, tmp_path):
+        """Testa que get_entry() devolve entradas vencidas (stale) e refresh() renova o TTL."""
+        disk = DiskCache(tmp_path, ttl_seconds=10)
+        disk.set("chave", "valor", {"etag": '"v1"'})
+        cache = TwoTierCache(LRUCache(4), disk)
+        
+        with patch('core.utils.cache.time.time', return_value=time.time() + 60):
+            entry = cache.get_entry("chave")
+            assert entry.value == "valor"
+            assert entry.metadata == {"etag": '"v1"'}
+            assert entry.stale
+            
+            assert disk.refresh("chave", {"etag": '"v2"'})
+            entry = disk.get_entry("chave")
+        
+        assert not entry.stale
+        assert entry.metadata == {"etag": '"v2"'}
+        assert cache.get_entry("ausente") is None
+        assert not disk.refresh("ausente")
@@ -0,0 +1,72 @@
+"""
+Testes para o disjuntor (circuit breaker).
+
+Este módulo contém testes unitários para as transições de estado do
+CircuitBreaker e a notificação dos listeners.
+"""
+
+import pytest
+
+from core.utils.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Testes para a classe CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Testa que o disjuntor abre apenas ao atingir o limite de falhas seguidas."""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+        assert breaker.seconds_until_probe() > 0
+
+    def test_probe_only_after_recovery_timeout(self):
+        """Testa que a sondagem só é permitida depois do tempo de recuperação."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+        breaker.record_failure()
+
+        assert not breaker.begin_probe()
+
+        breaker.recovery_timeout = 0
+        assert breaker.begin_probe()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        # Chamadas normais continuam suspensas durante a sondagem
+        assert not breaker.allow_request()
+        assert not breaker.begin_probe()
+
+    @pytest.mark.parametrize("probe_succeeds,expected", [(True, CircuitBreaker.CLOSED), (False, CircuitBreaker.OPEN)])
+    def test_probe_result(self, probe_succeeds, expected):
+        """Testa que a sondagem fecha o disjuntor ou o mantém aberto."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+        breaker.begin_probe()
+
+        if probe_succeeds:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+        assert breaker.state == expected
+
+    def test_listeners_receive_state_changes(self):
+        """Testa que os listeners são avisados de cada mudança de estado, e só delas."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        states = []
+        breaker.add_listener(states.append)
+        breaker.add_listener(lambda state: 1 / 0)  # Erros em um listener não afetam os demais
+
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.begin_probe()
+        breaker.record_success()
+
+        assert states == [CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN, CircuitBreaker.CLOSED]
@@ -0,0 +1,82 @@
+"""
+Testes para o EventLoopThread.
+
+Este módulo contém testes unitários para o loop asyncio em thread dedicada.
+"""
+
+import pytest
+import asyncio
+import threading
+
+from core.utils.event_loop_thread import EventLoopThread
+
+
+class TestEventLoopThread:
+    """Testes para a classe EventLoopThread."""
+    
+    def test_submit_returns_result_through_callback(self):
+        """Testa que o resultado chega pelo callback, fora da thread chamadora."""
+        loop_thread = EventLoopThread()
+        received = {}
+        done = threading.Event()
+        
+        async def work():
+            await asyncio.sleep(0)
+            return 42
+        
+        def callback(result, error):
+            received.update(result=result, error=error, thread=threading.current_thread())
+            done.set()
+        
+        future = loop_thread.submit(work(), callback)
+        
+        assert future.result(timeout=2) == 42
+        assert done.wait(2)
+        assert received["result"] == 42
+        assert received["error"] is None
+        assert received["thread"] is not threading.current_thread()
+        loop_thread.stop()
+    
+    def test_submit_reports_errors(self):
+        """Testa que exceções da corrotina são entregues ao callback."""
+        loop_thread = EventLoopThread()
+        errors = []
+        done = threading.Event()
+        
+        async def failing():
+            raise ValueError("falha")
+        
+        loop_thread.submit(failing(), lambda result, error: (errors.append(error), done.set()))
+        
+        assert done.wait(2)
+        assert isinstance(errors[0], ValueError)
+        loop_thread.stop()
+    
+    def test_stop_cancels_pending_tasks(self):
+        """Testa que stop() encerra a thread mesmo com tarefas pendentes."""
+        loop_thread = EventLoopThread()
+        future = loop_thread.submit(asyncio.sleep(60))
+        
+        loop_thread.stop()
+        
+        assert not loop_thread.is_running()
+        assert future.cancelled()
+    
+    def test_cancelled_task_reports_cancelled_error(self):
+        """Testa que o callback recebe CancelledError quando a tarefa é cancelada."""
+        from concurrent.futures import CancelledError
+        loop_thread = EventLoopThread()
+        received = []
+        done = threading.Event()
+        
+        def callback(result, error):
+            received.append((result, error))
+            done.set()
+        
+        future = loop_thread.submit(asyncio.sleep(60), callback)
+        future.cancel()
+        
+        assert done.wait(2)
+        assert received[0][0] is None
+        assert isinstance(received[0][1], CancelledError)
+        loop_thread.stop()
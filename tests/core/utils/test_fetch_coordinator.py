@@ -0,0 +1,161 @@
+"""
+Testes para o FetchCoordinator.
+
+Este módulo contém testes unitários para a junção de buscas idênticas
+(single-flight) e o descarte de seleções substituídas.
+"""
+
+import pytest
+import threading
+
+from core.utils.fetch_coordinator import FetchCoordinator
+
+
+class TestFetchCoordinator:
+    """Testes para a classe FetchCoordinator."""
+
+    def test_fetch_coalesces_identical_in_flight_requests(self):
+        """Testa que buscas idênticas em andamento executam o loader uma única vez."""
+        coordinator = FetchCoordinator(max_workers=2)
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            release.wait(2)
+            return "resultado"
+
+        first = coordinator.fetch("chave", loader)
+        second = coordinator.fetch("chave", loader)
+        release.set()
+
+        assert first is second
+        assert first.result(timeout=2) == "resultado"
+        assert len(calls) == 1
+        assert coordinator.coalesced == 1
+        coordinator.shutdown()
+
+    def test_fetch_runs_again_after_completion(self):
+        """Testa que uma busca concluída não é reaproveitada."""
+        coordinator = FetchCoordinator()
+        calls = []
+
+        coordinator.fetch("chave", lambda: calls.append(1)).result(timeout=2)
+        coordinator.fetch("chave", lambda: calls.append(1)).result(timeout=2)
+
+        assert len(calls) == 2
+        coordinator.shutdown()
+
+    def test_only_latest_request_reaches_callback(self):
+        """Testa que pedidos substituídos não chamam o callback."""
+        coordinator = FetchCoordinator(max_workers=2)
+        release = threading.Event()
+        delivered = []
+        done = threading.Event()
+
+        def slow_loader():
+            release.wait(2)
+            return "antigo"
+
+        def callback(ticket, result, error):
+            delivered.append((ticket, result, error))
+            done.set()
+
+        coordinator.request_latest("a", slow_loader, callback)
+        latest = coordinator.request_latest("b", lambda: "novo", callback)
+        assert done.wait(2)
+        assert coordinator.is_current(latest)
+        release.set()
+        coordinator.shutdown()
+
+        assert delivered == [(latest, "novo", None)]
+
+    def test_superseded_pending_request_is_cancelled(self):
+        """Testa que um pedido substituído que ainda não começou é cancelado no pool."""
+        coordinator = FetchCoordinator(max_workers=1)
+        release = threading.Event()
+        calls = []
+
+        # Ocupa a única thread do pool
+        blocker = coordinator.fetch("ocupado", lambda: release.wait(2))
+        coordinator.request_latest("a", lambda: calls.append("a"), lambda *args: None)
+        coordinator.request_latest("b", lambda: calls.append("b"), lambda *args: None)
+        release.set()
+        blocker.result(timeout=2)
+        coordinator.fetch("fim", lambda: None).result(timeout=2)
+
+        assert calls == ["b"]
+        assert coordinator.superseded == 1
+        coordinator.shutdown()
+
+    def test_superseded_request_shared_with_other_caller_keeps_running(self):
+        """Testa que a execução não é cancelada enquanto outro interessado a aguarda."""
+        coordinator = FetchCoordinator(max_workers=1)
+        release = threading.Event()
+
+        blocker = coordinator.fetch("ocupado", lambda: release.wait(2))
+        coordinator.request_latest("a", lambda: "valor", lambda *args: None)
+        shared = coordinator.fetch("a", lambda: "outro")
+        coordinator.request_latest("b", lambda: None, lambda *args: None)
+        release.set()
+        blocker.result(timeout=2)
+
+        assert shared.result(timeout=2) == "valor"
+        coordinator.shutdown()
+
+    def test_errors_are_delivered_to_latest_callback(self):
+        """Testa que exceções do loader chegam ao callback do pedido atual."""
+        coordinator = FetchCoordinator()
+        received = {}
+        done = threading.Event()
+
+        def loader():
+            raise ValueError("falhou")
+
+        def callback(ticket, result, error):
+            received.update(result=result, error=error)
+            done.set()
+
+        coordinator.request_latest("a", loader, callback)
+
+        assert done.wait(2)
+        assert received["result"] is None
+        assert isinstance(received["error"], ValueError)
+        coordinator.shutdown()
+
+    def test_run_shared_lets_fetch_join_running_work(self):
+        """Testa que fetch() reaproveita uma execução iniciada por run_shared()."""
+        coordinator = FetchCoordinator()
+        started = threading.Event()
+        release = threading.Event()
+        results = {}
+
+        def loader():
+            started.set()
+            release.wait(2)
+            return "compartilhado"
+
+        worker = threading.Thread(target=lambda: results.update(shared=coordinator.run_shared("a", loader)))
+        worker.start()
+        assert started.wait(2)
+        joined = coordinator.fetch("a", lambda: "repetido")
+        release.set()
+        worker.join(2)
+
+        assert joined.result(timeout=2) == "compartilhado"
+        assert results["shared"] is joined
+        coordinator.shutdown()
+
+    def test_cancel_latest_invalidates_pending_ticket(self):
+        """Testa que cancel_latest() impede a entrega do pedido pendente."""
+        coordinator = FetchCoordinator()
+        release = threading.Event()
+        delivered = []
+
+        ticket = coordinator.request_latest("a", lambda: release.wait(2), lambda *args: delivered.append(args))
+        coordinator.cancel_latest()
+        release.set()
+        coordinator.shutdown()
+
+        assert not coordinator.is_current(ticket)
+        assert delivered == []
@@ -0,0 +1,72 @@
+"""
+Testes para o ProcessPool.
+
+Este módulo contém testes do pool de processos usado para o trabalho pesado
+de CPU (análise de HTML e construção de índices) fora do processo da interface.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from core.bible_manager import BibleManager
+from core.bible_search import BibleSearchIndex
+from core.exceptions import ScraperParseError
+from core.services.letras_scraper import LetrasScraper
+from core.utils.process_pool import ProcessPool
+from tests.core.services.test_letras_scraper import make_page
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Um único pool para o módulo: iniciar processos com spawn é lento."""
+    pool = ProcessPool(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+class TestProcessPool:
+    """Testes para a classe ProcessPool."""
+
+    def test_run_returns_result(self, pool):
+        """Testa que a função roda em outro processo e o resultado volta."""
+        assert pool.run(pow, 2, 10) == 1024
+
+    def test_shutdown_rejects_new_tasks(self):
+        """Testa que um pool encerrado não aceita tarefas (e não chega a criar processos)."""
+        pool = ProcessPool()
+        pool.shutdown()
+
+        assert pool._executor is None
+        with pytest.raises(RuntimeError):
+            pool.submit(pow, 2, 2)
+
+
+class TestOffloadedWork:
+    """Testes para o trabalho de CPU enviado ao pool."""
+
+    def test_scraper_parses_in_pool(self, pool):
+        """Testa que o scraper com cpu_pool devolve o mesmo resultado da análise local."""
+        scraper = LetrasScraper(session=Mock(), page_cache=None, cpu_pool=pool)
+        local = LetrasScraper(session=Mock(), page_cache=None)
+
+        assert scraper.parse_page(make_page(), "url") == local.parse_page(make_page(), "url")
+
+    def test_scraper_parse_error_crosses_processes(self, pool):
+        """Testa que a exceção de análise do processo do pool chega ao chamador."""
+        scraper = LetrasScraper(session=Mock(), page_cache=None, cpu_pool=pool)
+
+        with pytest.raises(ScraperParseError):
+            scraper.parse_page("<html><body>vazio</body></html>", "url")
+
+    def test_search_index_built_in_pool(self, pool, tmp_path, monkeypatch):
+        """Testa que o índice construído no pool é gravado e carregado na próxima busca."""
+        monkeypatch.setattr("core.bible_manager.BIBLE_SEARCH_INDEX_DIR", str(tmp_path / "index"))
+        manager = BibleManager(cpu_pool=pool)
+        manager.books = [{"abbrev": {"pt": "gn"}, "name": "Gênesis"}]
+        manager.bible_store.root = tmp_path / "store"
+        manager.bible_store.save_chapter("nvi", "gn", 1, [{"number": 1, "text": "No princípio"}])
+
+        assert manager.build_search_index("nvi") == 1
+        assert "nvi" not in manager._search_indexes
+        assert isinstance(manager.get_search_index("nvi"), BibleSearchIndex)
+        assert manager.search_verses("nvi", "principio")[0].verse == 1
@@ -0,0 +1,72 @@
+"""
+Testes para o RateLimiter.
+
+Este módulo contém testes unitários para o limitador de taxa token bucket.
+"""
+
+import pytest
+import asyncio
+import time
+
+from core.utils.rate_limiter import HostRateLimiter, RateLimiter
+
+
+class TestRateLimiter:
+    """Testes para a classe RateLimiter."""
+    
+    def test_burst_is_immediate(self):
+        """Testa que chamadas dentro da rajada não esperam."""
+        limiter = RateLimiter(rate_per_second=1, burst=3)
+        
+        assert [limiter._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    
+    def test_waits_when_bucket_is_empty(self):
+        """Testa que chamadas além da rajada esperam conforme a taxa."""
+        limiter = RateLimiter(rate_per_second=10, burst=1)
+        limiter._reserve()
+        
+        second = limiter._reserve()
+        third = limiter._reserve()
+        
+        assert 0.09 <= second <= 0.1
+        assert 0.19 <= third <= 0.2
+    
+    def test_acquire_blocks(self):
+        """Testa que acquire() respeita a taxa em tempo real."""
+        limiter = RateLimiter(rate_per_second=50, burst=1)
+        started = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        
+        assert time.monotonic() - started >= 0.05
+    
+    def test_aacquire(self):
+        """Testa a versão assíncrona do limitador."""
+        limiter = RateLimiter(rate_per_second=50, burst=2)
+        
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(*(limiter.aacquire() for _ in range(4)))
+            return time.monotonic() - started
+        
+        assert asyncio.run(run()) >= 0.03
+    
+    def test_invalid_rate(self):
+        """Testa que taxa não positiva é rejeitada."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate_per_second=0)
+
+
+class TestHostRateLimiter:
+    """Testes para a classe HostRateLimiter."""
+    
+    def test_each_host_has_its_own_budget(self):
+        """Testa que hosts diferentes não disputam o mesmo orçamento."""
+        limiter = HostRateLimiter(rate_per_second=1)
+        
+        first = limiter.limiter_for("https://www.letras.mus.br/a/b/")
+        
+        assert limiter.limiter_for("https://WWW.letras.mus.br/c/") is first
+        assert limiter.limiter_for("https://outro.site/x") is not first
+        assert first._reserve() == 0.0
+        assert first._reserve() > 0